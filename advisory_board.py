@@ -0,0 +1,148 @@
+# advisory_board.py — Senior Intern • Virtual Senior Advisory Board, streamed from Gemini
+#
+# Every agent whose rule fires (board_rules) gets its own Gemini prompt. All
+# of them start at once on the client's background loop and queue their
+# chunks as they arrive. The page renders the agents in board order, one
+# st.write_stream per agent: the first words show after one model round
+# trip, and the agents below, generated meanwhile, follow as soon as the one
+# above them is done. An agent that fails before saying anything shows its
+# rule text instead.
+#
+# Agents' answers go through the generation cache: prompts leave out who is
+# asking, so founders in the same situation share an exact hit, and similar
+# situations share a semantic one. The semantic lookup uses the problem's
+# embedding only if the embedding cache already has it (the submission job
+# embedded the same text), so it never puts a round trip before the stream.
+
+import asyncio
+import queue
+import time
+
+from board_rules import BOARD, BOARD_SUMMARY, BoardAnalyzer, BoardRule
+from gemini_client import background_loop, get_gemini_client
+from generation_cache import GenerationCache, get_generation_cache
+from models import FounderProblem, build_problem_ai_text
+
+STREAM_TIMEOUT = 60.0   # seconds without a chunk before an agent gives up
+
+AGENT_PROMPT = """You are the {agent} agent on a Virtual Senior Advisory Board for early-stage founders.
+From the founder's answers the board flagged this: {hint}
+In 2-4 sentences, tell the founder directly how you read their situation and the one thing you would do first.
+{problem}"""
+
+# The single "agent" when no rule fires, as in the rule-based board.
+SUMMARY_RULE = BoardRule("Board Summary", "", "", BOARD_SUMMARY)
+
+# Lines of build_problem_ai_text that identify the founder, not the situation.
+IDENTITY_LINES = ("Founder:", "Company:")
+
+_DONE = object()
+
+
+def split_rule_text(rule: BoardRule) -> tuple:
+    """("🧭 Strategy Agent", "The root cause seems ...") from a rule's text."""
+    heading, _, hint = rule.text.partition(": ")
+    return heading, hint
+
+
+def board_problem_text(problem: FounderProblem) -> str:
+    """build_problem_ai_text without the founder's name, email and company."""
+    lines = build_problem_ai_text(problem).splitlines()
+    return "\n".join(line for line in lines if not line.startswith(IDENTITY_LINES))
+
+
+def agent_prompt(rule: BoardRule, problem_text: str) -> str:
+    return AGENT_PROMPT.format(agent=rule.agent, hint=split_rule_text(rule)[1], problem=problem_text)
+
+
+class AdvisoryStream:
+    """One problem's board analysis, generated by concurrent agent streams."""
+
+    def __init__(self, problem: FounderProblem, client=None, board: BoardAnalyzer = BOARD,
+                 cache: GenerationCache = None):
+        client = client or get_gemini_client()
+        self.problem = problem
+        self.rules = board.agents(problem) or [SUMMARY_RULE]
+        self.cache = get_generation_cache() if cache is None else cache
+        self.started = time.perf_counter()
+        self.first_token = None     # seconds from start to the first chunk of any agent
+        self.cached = 0             # agents answered from the generation cache
+        self._queues = [queue.Queue() for _ in self.rules]
+        text = board_problem_text(problem)
+        vector = self._problem_vector(client)
+        loop = background_loop()
+        self._futures = [
+            asyncio.run_coroutine_threadsafe(self._agent(client, rule, q, text, vector), loop)
+            for rule, q in zip(self.rules, self._queues)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _got_text(self) -> None:
+        if self.first_token is None:
+            self.first_token = time.perf_counter() - self.started
+
+    def _problem_vector(self, client):
+        """The problem's embedding if it is already cached, else None (no semantic lookup)."""
+        if self.cache.threshold is None or client.cache is None:
+            return None
+        return client.cache.get(build_problem_ai_text(self.problem), client.embed_model)
+
+    async def _agent(self, client, rule: BoardRule, q: queue.Queue, problem_text: str, vector) -> None:
+        prompt = agent_prompt(rule, problem_text)
+        model = client.generate_model
+        try:
+            text = self.cache.get(prompt, model, scope=rule.agent, vector=vector)
+            if text is not None:
+                self.cached += 1
+                self._got_text()
+                q.put(text)
+                return
+            t0 = time.perf_counter()
+            chunks = []
+            async for chunk in client.generate_stream(prompt):
+                self._got_text()
+                chunks.append(chunk)
+                q.put(chunk)
+            self.cache.put(
+                prompt, model, "".join(chunks), latency=time.perf_counter() - t0, scope=rule.agent, vector=vector
+            )
+        except Exception as exc:
+            q.put(exc)
+        finally:
+            q.put(_DONE)
+
+    def section(self, i: int):
+        """Agent i's text, chunk by chunk, for st.write_stream."""
+        heading, hint = split_rule_text(self.rules[i])
+        yield f"**{heading}:** "
+        said = False
+        while True:
+            try:
+                item = self._queues[i].get(timeout=STREAM_TIMEOUT)
+            except queue.Empty:
+                self._futures[i].cancel()
+                item = TimeoutError(f"no response from the {self.rules[i].agent} agent")
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                if not said:
+                    yield hint
+                return
+            said = True
+            yield item
+
+    def cancel(self) -> None:
+        """Stop agents still generating (the page was left mid-stream)."""
+        for future in self._futures:
+            future.cancel()
+
+
+def start_advisory_stream(problem: FounderProblem):
+    """AdvisoryStream for problem, or None when Gemini is not configured."""
+    try:
+        return AdvisoryStream(problem)
+    except (ImportError, RuntimeError):
+        # No google-generativeai or no GEMINI_API_KEY: the rule-based board stands in.
+        return None
@@ -0,0 +1,334 @@
+# ann_index.py — Senior Intern • in-process IVF index for senior embeddings
+#
+# A local stand-in for Qdrant so matching can run and be tested without a
+# live service. Vectors are L2-normalised (cosine similarity) and clustered
+# into n_lists inverted lists around k-means centroids; every list stores its
+# vectors as one contiguous float32 block, so probing a list is a single
+# matrix-vector product. A search probes the nprobe closest lists and applies
+# the payload filters (preferred_startup_stage, preferred_domains) as
+# vectorised masks; if the filters leave fewer than k hits it falls back to
+# an exact scan of the filtered set.
+#
+# snapshot() writes .npy files; restore() memory-maps them, so a restart
+# pages vectors in on demand instead of reading the whole matrix up front.
+# Lists restored from a snapshot are copied into memory on their first insert.
+
+import json
+import os
+import shutil
+
+import numpy as np
+
+from models import DOMAINS, STARTUP_STAGES, SeniorProfile
+
+STAGE_CODE = {s: i for i, s in enumerate(STARTUP_STAGES)}
+DOMAIN_BIT = {d: 1 << i for i, d in enumerate(DOMAINS)}
+
+KMEANS_ITERATIONS = 10
+TRAIN_PER_LIST = 40         # training sample size per list
+ASSIGN_CHUNK = 65536
+
+
+def senior_payload(s: SeniorProfile) -> tuple:
+    """(stage code, domain bitmask) stored next to a senior's vector."""
+    return STAGE_CODE.get(s.preferred_startup_stage, STAGE_CODE["Any"]), domain_mask(s.preferred_domains)
+
+
+def domain_mask(domains) -> int:
+    mask = 0
+    for d in domains:
+        mask |= DOMAIN_BIT.get(d, 0)
+    return mask
+
+
+def normalize(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return x / norms
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    idx = np.argpartition(-scores, k - 1)[:k]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def kmeans(x: np.ndarray, n_clusters: int, iterations: int = KMEANS_ITERATIONS, seed: int = 0) -> np.ndarray:
+    """Spherical k-means: unit centroids maximising cosine similarity."""
+    rng = np.random.default_rng(seed)
+    centroids = x[rng.choice(len(x), n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(x @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, x)
+        counts = np.bincount(assign, minlength=n_clusters)
+        empty = counts == 0
+        if empty.any():
+            sums[empty] = x[rng.choice(len(x), int(empty.sum()), replace=False)]
+        centroids = normalize(sums)
+    return centroids
+
+
+class _Grow:
+    """Growable array along axis 0 (amortised O(1) append)."""
+
+    def __init__(self, dtype, width: int = None, data: np.ndarray = None):
+        shape = (0,) if width is None else (0, width)
+        self.data = np.zeros(shape, dtype=dtype) if data is None else data
+        self.n = len(self.data)
+
+    def view(self) -> np.ndarray:
+        return self.data[: self.n]
+
+    def extend(self, values: np.ndarray) -> None:
+        need = self.n + len(values)
+        if need > len(self.data) or not self.data.flags.writeable:
+            grown = np.zeros((max(need, 2 * len(self.data), 16),) + self.data.shape[1:], dtype=self.data.dtype)
+            grown[: self.n] = self.data[: self.n]
+            self.data = grown
+        self.data[self.n : need] = values
+        self.n = need
+
+
+class IVFIndex:
+    def __init__(self, dim: int, n_lists: int = None, nprobe: int = 16):
+        self.dim = dim
+        self.n_lists = n_lists      # None: sqrt(n) chosen at train time
+        self.nprobe = nprobe
+        self.centroids = None       # untrained: a single flat list
+
+        self.ids = []               # slot -> external id
+        self.slot_of = {}           # external id -> slot
+        self._stage = _Grow(np.uint8)
+        self._domains = _Grow(np.uint16)
+        self._alive = _Grow(np.bool_)
+        self._lists = [(_Grow(np.float32, dim), _Grow(np.uint32))]
+
+    def __len__(self) -> int:
+        return len(self.slot_of)
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    # ---------- Building ----------
+
+    def train(self, sample: np.ndarray = None, seed: int = 0) -> None:
+        """Cluster the index (on `sample`, or on the stored vectors) and re-assign everything."""
+        vectors, slots = self._all_vectors()
+        if sample is None:
+            sample = vectors
+        if not len(sample):
+            raise ValueError("nothing to train on")
+        sample = normalize(sample)
+        n_lists = self.n_lists or max(1, int(np.sqrt(max(len(sample), 1))))
+        n_lists = min(n_lists, len(sample))
+        if len(sample) > n_lists * TRAIN_PER_LIST:
+            rng = np.random.default_rng(seed)
+            sample = sample[rng.choice(len(sample), n_lists * TRAIN_PER_LIST, replace=False)]
+        self.centroids = kmeans(sample, n_lists, seed=seed)
+        self.n_lists = n_lists
+        self._lists = [(_Grow(np.float32, self.dim), _Grow(np.uint32)) for _ in range(n_lists)]
+        if len(slots):
+            self._place(vectors, slots)
+
+    def add(self, ids: list, vectors: np.ndarray, payloads: list) -> None:
+        """Insert or replace vectors. payloads[i] is (stage code, domain bitmask)."""
+        vectors = normalize(np.atleast_2d(vectors))
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"expected {self.dim}-d vectors, got {vectors.shape[1]}")
+        ids, payloads = list(ids), list(payloads)
+        last = {i: pos for pos, i in enumerate(ids)}
+        if len(last) < len(ids):
+            # An id repeated within the batch: keep its last copy, as a later
+            # add() would, instead of leaving the earlier ones unreachable by
+            # delete() but still searchable.
+            keep = sorted(last.values())
+            ids = [ids[k] for k in keep]
+            payloads = [payloads[k] for k in keep]
+            vectors = vectors[keep]
+        for i in ids:
+            if i in self.slot_of:
+                self.delete(i)
+        first = len(self.ids)
+        slots = np.arange(first, first + len(ids), dtype=np.uint32)
+        self.ids.extend(ids)
+        for i, slot in zip(ids, slots):
+            self.slot_of[i] = int(slot)
+        stages, domains = zip(*payloads) if payloads else ((), ())
+        self._stage.extend(np.asarray(stages, dtype=np.uint8))
+        self._domains.extend(np.asarray(domains, dtype=np.uint16))
+        self._alive.extend(np.ones(len(ids), dtype=bool))
+        self._place(vectors, slots)
+
+    def add_seniors(self, seniors: list, vectors: np.ndarray) -> None:
+        self.add([s.id for s in seniors], vectors, [senior_payload(s) for s in seniors])
+
+    def delete(self, id_: str) -> bool:
+        slot = self.slot_of.pop(id_, None)
+        if slot is None:
+            return False
+        self._alive.data[slot] = False  # tombstone; dropped by the next snapshot
+        return True
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        if not self.trained:
+            return np.zeros(len(vectors), dtype=np.intp)
+        out = np.empty(len(vectors), dtype=np.intp)
+        for start in range(0, len(vectors), ASSIGN_CHUNK):
+            chunk = vectors[start : start + ASSIGN_CHUNK]
+            out[start : start + len(chunk)] = np.argmax(chunk @ self.centroids.T, axis=1)
+        return out
+
+    def _place(self, vectors: np.ndarray, slots: np.ndarray) -> None:
+        lists = self._assign(vectors)
+        order = np.argsort(lists, kind="stable")
+        bounds = np.searchsorted(lists[order], np.arange(len(self._lists) + 1))
+        for li in range(len(self._lists)):
+            lo, hi = bounds[li], bounds[li + 1]
+            if lo == hi:
+                continue
+            block = order[lo:hi]
+            vecs, list_slots = self._lists[li]
+            vecs.extend(vectors[block])
+            list_slots.extend(slots[block])
+
+    def _all_vectors(self) -> tuple:
+        """Alive vectors and their slots, in list order."""
+        vecs, slots = [], []
+        alive = self._alive.view()
+        for lv, ls in self._lists:
+            s = ls.view()
+            keep = alive[s]
+            vecs.append(lv.view()[keep])
+            slots.append(s[keep])
+        if not vecs:
+            return np.zeros((0, self.dim), dtype=np.float32), np.zeros(0, dtype=np.uint32)
+        return np.concatenate(vecs), np.concatenate(slots)
+
+    # ---------- Search ----------
+
+    def _filter_mask(self, slots: np.ndarray, stage_ok, domain_bits: int) -> np.ndarray:
+        mask = self._alive.data[slots]
+        if stage_ok is not None:
+            mask &= stage_ok[self._stage.data[slots]]
+        if domain_bits:
+            mask &= (self._domains.data[slots] & domain_bits) != 0
+        return mask
+
+    def _filters(self, stages, domains) -> tuple:
+        stage_ok = None
+        if stages:
+            stage_ok = np.zeros(len(STARTUP_STAGES), dtype=bool)
+            for s in stages:
+                stage_ok[STAGE_CODE[s]] = True
+        return stage_ok, domain_mask(domains or [])
+
+    def search(self, query: np.ndarray, k: int = 10, stages=None, domains=None, nprobe: int = None) -> list:
+        """[(id, cosine score)] best first.
+
+        stages: only seniors whose preferred_startup_stage is in this list.
+        domains: only seniors sharing at least one preferred domain.
+        """
+        q = normalize(query)
+        stage_ok, domain_bits = self._filters(stages, domains)
+        if self.trained:
+            nprobe = min(nprobe or self.nprobe, len(self._lists))
+            probe = top_k(self.centroids @ q, nprobe)
+        else:
+            probe = [0]
+        scores, slots = self._scan(q, probe, stage_ok, domain_bits)
+        if len(scores) < k and len(probe) < len(self._lists):
+            # Selective filter: the probed lists didn't hold k matches.
+            scores, slots = self._scan(q, range(len(self._lists)), stage_ok, domain_bits)
+        best = top_k(scores, k)
+        return [(self.ids[slots[i]], float(scores[i])) for i in best]
+
+    def search_exact(self, query: np.ndarray, k: int = 10, stages=None, domains=None) -> list:
+        """Brute force over every list, for recall measurements."""
+        q = normalize(query)
+        stage_ok, domain_bits = self._filters(stages, domains)
+        scores, slots = self._scan(q, range(len(self._lists)), stage_ok, domain_bits)
+        best = top_k(scores, k)
+        return [(self.ids[slots[i]], float(scores[i])) for i in best]
+
+    def _scan(self, q: np.ndarray, lists, stage_ok, domain_bits) -> tuple:
+        all_scores, all_slots = [], []
+        for li in lists:
+            vecs, slots = self._lists[li]
+            if not vecs.n:
+                continue
+            s = slots.view()
+            mask = self._filter_mask(s, stage_ok, domain_bits)
+            if mask.all():
+                all_scores.append(vecs.view() @ q)
+                all_slots.append(s)
+            elif mask.any():
+                all_scores.append(vecs.view()[mask] @ q)
+                all_slots.append(s[mask])
+        if not all_scores:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.uint32)
+        return np.concatenate(all_scores), np.concatenate(all_slots)
+
+    # ---------- Snapshot / restore ----------
+
+    def snapshot(self, path: str) -> None:
+        """Write a compacted copy (tombstones dropped) to directory `path`."""
+        tmp = path.rstrip("/\\") + ".tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        alive = self._alive.view()
+        vecs, slots, sizes = [], [], []
+        for lv, ls in self._lists:
+            s = ls.view()
+            keep = alive[s]
+            vecs.append(lv.view()[keep])
+            slots.append(s[keep])
+            sizes.append(int(keep.sum()))
+        slots = np.concatenate(slots) if slots else np.zeros(0, dtype=np.uint32)
+        np.save(os.path.join(tmp, "vectors.npy"), np.concatenate(vecs) if vecs else np.zeros((0, self.dim), np.float32))
+        np.save(os.path.join(tmp, "stage.npy"), self._stage.data[slots])
+        np.save(os.path.join(tmp, "domains.npy"), self._domains.data[slots])
+        if self.trained:
+            np.save(os.path.join(tmp, "centroids.npy"), self.centroids)
+        meta = {
+            "dim": self.dim,
+            "n_lists": self.n_lists,
+            "nprobe": self.nprobe,
+            "list_sizes": sizes,
+            "ids": [self.ids[i] for i in slots],
+        }
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        old = path.rstrip("/\\") + ".old"
+        shutil.rmtree(old, ignore_errors=True)
+        if os.path.exists(path):
+            os.replace(path, old)
+        os.replace(tmp, path)
+        shutil.rmtree(old, ignore_errors=True)
+
+    @classmethod
+    def restore(cls, path: str) -> "IVFIndex":
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        index = cls(meta["dim"], meta["n_lists"], meta["nprobe"])
+        centroids = os.path.join(path, "centroids.npy")
+        if os.path.exists(centroids):
+            index.centroids = np.load(centroids)
+        vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode="r")
+        n = len(meta["ids"])
+        index.ids = meta["ids"]
+        index.slot_of = {id_: slot for slot, id_ in enumerate(index.ids)}
+        index._stage = _Grow(np.uint8, data=np.load(os.path.join(path, "stage.npy")))
+        index._domains = _Grow(np.uint16, data=np.load(os.path.join(path, "domains.npy")))
+        index._alive = _Grow(np.bool_, data=np.ones(n, dtype=bool))
+        index._lists = []
+        offset = 0
+        for size in meta["list_sizes"]:
+            # Read-only memmap views; _Grow copies a list on its first insert.
+            block = vectors[offset : offset + size]
+            index._lists.append((_Grow(np.float32, data=block), _Grow(np.uint32, data=np.arange(offset, offset + size, dtype=np.uint32))))
+            offset += size
+        return index
@@ -1,10 +1,16 @@
 # app.py — Senior Intern • Senior Profile MVP (v2)
 
 import streamlit as st
-from dataclasses import dataclass, asdict
+from dataclasses import asdict
 from datetime import datetime
 import uuid
 
+from instrumentation import timing_panel
+from jobs import get_submission_queue
+from models import DOMAINS, PROBLEM_TYPES, STARTUP_STAGES, SeniorProfile, build_senior_ai_text
+from skills import get_skill_vocabulary, normalize
+from store import get_senior_store
+
 # ---------- Page config ----------
 
 st.set_page_config(
@@ -50,60 +56,25 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# ---------- Data model ----------
-
-@dataclass
-class SeniorProfile:
-    id: str
-    name: str
-    email: str
-    linkedin_url: str
-    headline: str
-    skills: list
-    intro: str
-    preferred_domains: list
-    preferred_startup_stage: str
-    preferred_problem_types: list
-    availability_days_per_week: int
-    availability_hours_per_day: int
-    created_at: str
-
-
-# ---------- Helpers ----------
-
-def build_ai_text(profile: SeniorProfile) -> str:
-    """Text we will send to Gemini later."""
-    return f"""
-Senior profile:
-Name: {profile.name}
-Headline: {profile.headline}
-
-Skills: {", ".join(profile.skills)}
-Preferred domains: {", ".join(profile.preferred_domains)}
-Preferred startup stage: {profile.preferred_startup_stage}
-Enjoys solving: {", ".join(profile.preferred_problem_types)}
-
-Availability: {profile.availability_days_per_week} days/week,
-{profile.availability_hours_per_day} hours/day.
-
-Intro:
-{profile.intro}
-
-LinkedIn: {profile.linkedin_url}
-"""
+# ---------- Session state ----------
+# Only the profile id: the profile itself is in the senior store.
 
+if "profile_id" not in st.session_state:
+    st.session_state.profile_id = None
+profile = get_senior_store().get(st.session_state.profile_id)
 
-# ---------- Session state ----------
 
-if "profile" not in st.session_state:
-    st.session_state.profile = None
-if "ai_text" not in st.session_state:
-    st.session_state.ai_text = ""
+@st.fragment(run_every=0.5)
+def show_job_progress(job_id: str):
+    job = get_submission_queue().job(job_id)
+    if job is None or job.finished:
+        st.rerun()
+    st.info(f"⏳ {job.label}…")
 
 
 # ---------- UI flow ----------
 
-if st.session_state.profile is None:
+if profile is None:
     # ------- Show form -------
 
     st.markdown('<div class="main-title">Senior Intern – Create Your Senior Profile</div>', unsafe_allow_html=True)
@@ -136,37 +107,17 @@ if st.session_state.profile is None:
 
         preferred_domains = st.multiselect(
             "What kind of industries / domains do you want to work with? *",
-            options=[
-                "SaaS",
-                "Fintech",
-                "Edtech",
-                "Healthtech",
-                "E-commerce",
-                "Telecom",
-                "Manufacturing",
-                "Retail",
-                "Hospitality",
-                "Other",
-            ],
+            options=DOMAINS,
         )
 
         preferred_startup_stage = st.selectbox(
             "Preferred startup stage *",
-            ["Idea stage", "MVP built", "Early revenue", "Scaling", "Any"],
+            STARTUP_STAGES,
         )
 
         preferred_problem_types = st.multiselect(
             "What kind of problems do you enjoy solving most? *",
-            options=[
-                "Strategy & Direction",
-                "Operations & Execution",
-                "Product & UX",
-                "Sales & GTM",
-                "Finance & Unit Economics",
-                "People & Culture",
-                "Turnaround / Crisis",
-                "Other",
-            ],
+            options=PROBLEM_TYPES,
         )
 
         availability_days_per_week = st.slider(
@@ -196,8 +147,12 @@ if st.session_state.profile is None:
             and preferred_problem_types
         ):
             st.error("Please fill all required fields marked with *.")
+        elif not any(normalize(skill) for skill in skills_text.split(",")):
+            # Punctuation alone passes the check above but canonicalises to no skills.
+            st.error("Please list at least one skill, separated by commas.")
         else:
-            skills = [s.strip() for s in skills_text.split(",") if s.strip()]
+            # Keep what they typed; "GTM", "go to market" and "Go-To-Market" share an id.
+            skills, skill_ids = get_skill_vocabulary().canonicalize(skills_text.split(","))
 
             profile = SeniorProfile(
                 id=str(uuid.uuid4()),
@@ -206,6 +161,7 @@ if st.session_state.profile is None:
                 linkedin_url=linkedin_url,
                 headline=headline,
                 skills=skills,
+                skill_ids=skill_ids,
                 intro=intro,
                 preferred_domains=preferred_domains,
                 preferred_startup_stage=preferred_startup_stage,
@@ -215,15 +171,14 @@ if st.session_state.profile is None:
                 created_at=datetime.utcnow().isoformat(),
             )
 
-            st.session_state.profile = profile
-            st.session_state.ai_text = build_ai_text(profile)
+            get_senior_store().append(profile)
+            get_submission_queue().submit_senior(profile)
+            st.session_state.profile_id = profile.id
             st.rerun()
 
 else:
     # ------- Thank-you screen -------
 
-    profile: SeniorProfile = st.session_state.profile
-
     st.markdown(
         """
         <div class="thankyou-card">
@@ -240,18 +195,23 @@ else:
 
     st.write("")  # small spacer
 
+    job = get_submission_queue().job(profile.id)
+    if job is not None and not job.finished:
+        show_job_progress(job.id)
+
     with st.expander("🔍 Developer View: Traceable Senior Profile (for judges)"):
         st.subheader("Senior Profile JSON")
         st.json(asdict(profile))
 
         st.subheader("Text we will send to Gemini")
-        st.code(st.session_state.ai_text.strip(), language="markdown")
+        st.code(build_senior_ai_text(profile).strip(), language="markdown")
         st.caption(
             "This internal view shows how the profile will be processed by Gemini and turned into an embedding for storage in Qdrant."
         )
 
+        timing_panel()
+
     st.write("")
     if st.button("⬅️ Create another profile"):
-        st.session_state.profile = None
-        st.session_state.ai_text = ""
+        st.session_state.profile_id = None
         st.rerun()
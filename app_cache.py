@@ -0,0 +1,124 @@
+# app_cache.py — Senior Intern • per-process state shared by the Streamlit pages
+#
+# Streamlit re-executes a page script top to bottom on every interaction, so
+# anything that doesn't depend on the session is built here once instead:
+#
+#   * senior_matcher()   -> st.cache_resource: one SeniorMatcher per process
+#                           over MOCK_SENIORS + the senior store, topped up
+#                           with seniors who joined since it was built
+#   * hybrid_retriever() -> st.cache_resource: BM25 + embedding index over
+#                           the matcher's rows, fused with its ranking (hybrid)
+#   * problem_analysis() -> st.cache_data: board text and categorical top
+#                           matches, memoized per FounderProblem.id and pool
+#                           size; the founder page's fallback for both
+#
+# The store and the compiled board rules are already process-wide (module
+# level in store.py / board_rules.py), so pages only need this module.
+
+import threading
+
+import streamlit as st
+
+from board_rules import virtual_board
+from explanations import fit_reason
+from gemini_client import get_gemini_client
+from hybrid import HybridRetriever
+from instrumentation import timed
+from matching import SeniorMatcher
+from models import FounderProblem, build_problem_ai_text
+from sample_data import MOCK_SENIORS
+from store import SeniorStore, get_senior_store
+
+
+class StoreMatcher:
+    """SeniorMatcher that follows an append-only senior store."""
+
+    def __init__(self, store: SeniorStore, seed=MOCK_SENIORS):
+        self.store = store
+        self.matcher = SeniorMatcher(seed)
+        self.seen = 0
+        self._lock = threading.Lock()
+        self.sync()
+
+    def sync(self) -> SeniorMatcher:
+        # Seniors are only ever appended, so catching up is "encode the tail".
+        if len(self.store) > self.seen:
+            with self._lock:
+                new = self.store.all(self.seen)
+                if new:
+                    self.matcher.extend(new)
+                    self.seen += len(new)
+        return self.matcher
+
+
+@st.cache_resource(show_spinner="Loading senior pool…")
+def store_matcher() -> StoreMatcher:
+    return StoreMatcher(get_senior_store())
+
+
+def senior_matcher() -> SeniorMatcher:
+    return store_matcher().sync()
+
+
+@st.cache_resource(show_spinner="Indexing senior profiles…")
+def hybrid_retriever() -> HybridRetriever:
+    return HybridRetriever(senior_matcher())
+
+
+def cached_embedding():
+    """text -> its cached Gemini embedding or None; None when Gemini isn't configured.
+
+    Never calls the API: vectors come from the submission jobs' embed step.
+    """
+    try:
+        client = get_gemini_client()
+    except (ImportError, RuntimeError):
+        return None
+    if client.cache is None:
+        return None
+    return lambda text: client.cache.get(text, client.embed_model)
+
+
+@st.cache_data(show_spinner=False, max_entries=10_000)
+def _hybrid(problem_id: str, n_seniors: int, n_vectors: int, embedded: bool,
+            _problem: FounderProblem, _vector) -> list:
+    return hybrid_retriever().top_k(_problem, k=3, query_vector=_vector)
+
+
+@timed("match.hybrid")
+def hybrid_matches(problem: FounderProblem) -> list:
+    """[(Match, reason), ...] from categorical, BM25 and embedding rankings fused."""
+    retriever = hybrid_retriever()
+    senior_matcher()
+    embedding_for = cached_embedding()
+    retriever.sync(embedding_for)
+    vector = embedding_for(build_problem_ai_text(problem)) if embedding_for else None
+    matches = _hybrid(problem.id, len(retriever), retriever.n_vectors, vector is not None, problem, vector)
+    return [(m, fit_reason(problem, m)) for m in matches]
+
+
+def describe(problem: FounderProblem, matches: list) -> dict:
+    """{"advisory_text": str, "matches": [(Match, reason), ...]}."""
+    return {
+        "advisory_text": virtual_board(problem),
+        "matches": [(m, fit_reason(problem, m)) for m in matches],
+    }
+
+
+def analyze_problem(problem: FounderProblem, matcher: SeniorMatcher, k: int = 3) -> dict:
+    """describe() with a one-off top-k from the matcher, uncached."""
+    return describe(problem, matcher.top_k(problem, k=k))
+
+
+@st.cache_data(show_spinner=False, max_entries=10_000)
+def _analysis(problem_id: str, n_seniors: int, _problem: FounderProblem) -> dict:
+    # Keyed on id and pool size only: the leading underscore keeps Streamlit
+    # from hashing the problem, and a senior joining changes n_seniors.
+    return analyze_problem(_problem, senior_matcher())
+
+
+@timed("analysis")
+def problem_analysis(problem: FounderProblem) -> dict:
+    """analyze_problem() against the shared matcher, memoized across reruns."""
+    matcher = senior_matcher()
+    return _analysis(problem.id, len(matcher), problem)
@@ -0,0 +1,155 @@
+# batch_match.py — Senior Intern • match every open problem against every senior
+#
+#   python batch_match.py [--out matches.jsonl] [--k 3] [--workers N]
+#
+# For the weekly digest. The senior feature matrix is encoded once and
+# placed in shared memory; worker processes attach to it at start-up, so
+# tasks only carry a chunk of founder problems and return small top-k
+# arrays. Each worker scores its chunk as one matrix product, and results
+# are written as JSONL in problem order while later chunks are still being
+# scored. Ranking is exact, ties in pool order, as SeniorMatcher.top_k
+# with prefilter=False.
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+from matching import CHUNK_CELLS, N_FEATURES, encode_problem, encode_seniors, top_k_rows
+
+# Each worker gets one core; BLAS threads on top of that only oversubscribe.
+# Unless one of these is set, which then applies as usual.
+BLAS_THREAD_VARS = ("OPENBLAS_NUM_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS")
+
+_columns = None     # per worker: (N_FEATURES, n_seniors) view of the shared matrix
+_shm = None
+
+
+def _attach(name: str, n_seniors: int, blas_threads: int = None) -> None:
+    global _columns, _shm
+    if blas_threads is not None:
+        # Limited inside the worker: numpy has loaded BLAS by now, so the
+        # variables above would come too late, and setting them in the
+        # parent would change them for every thread of the importing
+        # process (the Streamlit app, say).
+        threadpool_limits(blas_threads)
+    _shm = shared_memory.SharedMemory(name=name)
+    _columns = np.ndarray((N_FEATURES, n_seniors), dtype=np.float32, buffer=_shm.buf)
+
+
+def _score(problems: list, k: int, columns: np.ndarray = None) -> tuple:
+    columns = _columns if columns is None else columns
+    queries = np.stack([encode_problem(p) for p in problems])
+    return top_k_rows(queries @ columns, k)
+
+
+def _chunks(problems, size: int):
+    part = []
+    for p in problems:
+        part.append(p)
+        if len(part) == size:
+            yield part
+            part = []
+    if part:
+        yield part
+
+
+def _rows(part: list, ids: np.ndarray, scores: np.ndarray):
+    for p, row_ids, row_scores in zip(part, ids, scores):
+        keep = row_ids >= 0
+        yield p, row_ids[keep], row_scores[keep]
+
+
+def batch_match(seniors: list, problems, k: int = 3, workers: int = None, chunk: int = None):
+    """Yield (problem, senior rows, scores) for every problem, in input order.
+
+    workers=0 scores in this process; otherwise problems are sharded over a
+    process pool. The default is one worker per core, or in-process on a
+    single core, where a pool only adds start-up and pickling.
+    """
+    columns = np.ascontiguousarray(encode_seniors(seniors).T)
+    chunk = chunk or max(1, CHUNK_CELLS // max(len(seniors), 1))
+    if workers is None:
+        workers = os.cpu_count() or 1
+        workers = 0 if workers == 1 else workers
+
+    if workers == 0:
+        for part in _chunks(problems, chunk):
+            yield from _rows(part, *_score(part, k, columns))
+        return
+
+    shm = shared_memory.SharedMemory(create=True, size=max(columns.nbytes, 1))
+    try:
+        np.ndarray(columns.shape, dtype=np.float32, buffer=shm.buf)[:] = columns
+        del columns
+        blas_threads = None if any(var in os.environ for var in BLAS_THREAD_VARS) else 1
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_attach,
+            initargs=(shm.name, len(seniors), blas_threads),
+        ) as pool:
+            # A couple of chunks per worker in flight: enough to keep every
+            # worker busy, few enough that memory doesn't grow with the input.
+            in_flight = deque()
+            for part in _chunks(problems, chunk):
+                in_flight.append((part, pool.submit(_score, part, k)))
+                if len(in_flight) >= 2 * workers:
+                    done, future = in_flight.popleft()
+                    yield from _rows(done, *future.result())
+            while in_flight:
+                done, future = in_flight.popleft()
+                yield from _rows(done, *future.result())
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def write_matches(out, seniors: list, results) -> int:
+    n = 0
+    for problem, rows, scores in results:
+        line = {
+            "problem_id": problem.id,
+            "founder_email": problem.founder_email,
+            "matches": [{"senior_id": seniors[i].id, "score": float(s)} for i, s in zip(rows, scores)],
+        }
+        out.write(json.dumps(line, ensure_ascii=False) + "\n")
+        n += 1
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Match every stored founder problem against every senior.")
+    parser.add_argument("--out", default="-", help="JSONL output file, or - for stdout")
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None, help="0 = in-process; default one per core")
+    parser.add_argument("--chunk", type=int, default=None, help="problems per task")
+    args = parser.parse_args(argv)
+
+    from store import get_problem_store, get_senior_store
+
+    seniors = get_senior_store().all()
+    problems = get_problem_store().all()
+    t0 = time.perf_counter()
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    try:
+        n = write_matches(out, seniors, batch_match(seniors, problems, k=args.k, workers=args.workers, chunk=args.chunk))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(
+        f"{n:,} problems x {len(seniors):,} seniors matched in {time.perf_counter() - t0:.1f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/bench_advisory_stream.py — time to first token of the advisory board
+#
+# One problem that fires all five agents, against the offline fake with a
+# Gemini-like first-token latency and per-token pace. Compares rendering the
+# board once the whole analysis is built (agents one after another, or all
+# at once) with AdvisoryStream, which streams concurrent agents into the page.
+#
+#   python -m benchmarks.bench_advisory_stream [--latency 0.8] [--token-latency 0.04] [--runs 5]
+
+import argparse
+import asyncio
+import statistics
+import time
+from dataclasses import replace
+
+from advisory_board import AdvisoryStream, agent_prompt, board_problem_text
+from board_rules import BOARD, FIELD_OPTIONS
+from fake_gemini import FakeGemini
+from gemini_client import GeminiClient, run_sync
+from generation_cache import GenerationCache
+from sample_data import synthetic_problems
+
+
+async def collect(client, prompt):
+    return "".join([chunk async for chunk in client.generate_stream(prompt)])
+
+
+async def collect_all(client, prompts):
+    return await asyncio.gather(*(collect(client, prompt) for prompt in prompts))
+
+
+def whole_board(client, problem, concurrent):
+    text = board_problem_text(problem)
+    prompts = [agent_prompt(r, text) for r in BOARD.agents(problem)]
+    t0 = time.perf_counter()
+    if concurrent:
+        run_sync(collect_all(client, prompts))
+    else:
+        for prompt in prompts:
+            run_sync(collect(client, prompt))
+    total = time.perf_counter() - t0
+    return total, total     # nothing shows until everything is built
+
+
+def streamed(client, problem):
+    stream = AdvisoryStream(problem, client=client, cache=GenerationCache(max_entries=0))
+    first = None
+    for i in range(len(stream)):
+        for j, _ in enumerate(stream.section(i)):
+            if first is None and j == 1:    # j == 0 is the agent heading
+                first = time.perf_counter() - stream.started
+    return first, time.perf_counter() - stream.started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.8, help="seconds to the first token")
+    parser.add_argument("--token-latency", type=float, default=0.04)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    problem = replace(
+        synthetic_problems(1, seed=3)[0],
+        why_exists=list(FIELD_OPTIONS["why_exists"]),
+        impact_areas=list(FIELD_OPTIONS["impact_areas"]),
+    )
+    client = GeminiClient(FakeGemini(latency=args.latency, token_latency=args.token_latency))
+    print(f"{len(BOARD.agents(problem))} agents, first token after {args.latency * 1000:.0f} ms, "
+          f"then {args.token_latency * 1000:.0f} ms per token")
+
+    scenarios = {
+        "whole board, agents in turn": lambda: whole_board(client, problem, concurrent=False),
+        "whole board, agents at once": lambda: whole_board(client, problem, concurrent=True),
+        "streamed, agents at once": lambda: streamed(client, problem),
+    }
+    for name, run in scenarios.items():
+        results = [run() for _ in range(args.runs)]
+        ttft = statistics.median(r[0] for r in results) * 1000
+        total = statistics.median(r[1] for r in results) * 1000
+        print(f"{name:30s} first text {ttft:7.0f} ms   full board {total:7.0f} ms")
+    run_sync(client.close())
+
+
+if __name__ == "__main__":
+    main()
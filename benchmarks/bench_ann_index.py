@@ -0,0 +1,95 @@
+# benchmarks/bench_ann_index.py — recall@10 and QPS of the IVF index vs brute force
+#
+# Vectors are a synthetic Gaussian mixture (embeddings cluster; uniform noise
+# would be the IVF worst case). Dimension defaults to 64 so 1M vectors fit
+# comfortably in memory; pass --dim 768 for Gemini-sized vectors.
+#   python -m benchmarks.bench_ann_index [--sizes 100000 1000000] [--dim 64]
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from ann_index import IVFIndex, normalize
+from models import DOMAINS, STARTUP_STAGES
+
+
+def clustered(n: int, dim: int, n_centers: int, rng) -> np.ndarray:
+    centers = rng.standard_normal((n_centers, dim), dtype=np.float32)
+    out = np.empty((n, dim), dtype=np.float32)
+    for start in range(0, n, 100_000):
+        m = min(100_000, n - start)
+        out[start : start + m] = centers[rng.integers(0, n_centers, m)] + 0.6 * rng.standard_normal((m, dim), dtype=np.float32)
+    return out
+
+
+def payloads(n: int, rng) -> list:
+    stages = rng.integers(0, len(STARTUP_STAGES), n)
+    bits = np.zeros(n, dtype=np.int64)
+    for _ in range(2):
+        bits |= 1 << rng.integers(0, len(DOMAINS), n)
+    return list(zip(stages.tolist(), bits.tolist()))
+
+
+def measure(index: IVFIndex, queries: np.ndarray, k: int, **filters) -> tuple:
+    t0 = time.perf_counter()
+    approx = [index.search(q, k, **filters) for q in queries]
+    ann_qps = len(queries) / (time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    exact = [index.search_exact(q, k, **filters) for q in queries]
+    exact_qps = len(queries) / (time.perf_counter() - t0)
+    recall = np.mean([len({i for i, _ in a} & {i for i, _ in e}) / max(len(e), 1) for a, e in zip(approx, exact)])
+    return recall, ann_qps, exact_qps
+
+
+def bench(n: int, dim: int, n_queries: int, k: int, nprobe: int) -> None:
+    rng = np.random.default_rng(0)
+    vectors = clustered(n, dim, max(100, n // 500), rng)
+    ids = [f"senior-{i}" for i in range(n)]
+    queries = normalize(vectors[rng.choice(n, n_queries, replace=False)] + 0.3 * rng.standard_normal((n_queries, dim), dtype=np.float32))
+
+    index = IVFIndex(dim, nprobe=nprobe)
+    t0 = time.perf_counter()
+    index.train(vectors)
+    train_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for start in range(0, n, 100_000):
+        index.add(ids[start : start + 100_000], vectors[start : start + 100_000], payloads(min(100_000, n - start), rng))
+    add_s = time.perf_counter() - t0
+    print(f"\n{n:,} vectors x {dim}d: {index.n_lists} lists, nprobe {nprobe}; train {train_s:.1f} s, insert {add_s:.1f} s")
+
+    for name, filters in [
+        ("unfiltered", {}),
+        ("stage filter", {"stages": ["Early revenue", "Any"]}),
+        ("stage + domain filter", {"stages": ["Scaling"], "domains": ["Fintech"]}),
+    ]:
+        recall, ann_qps, exact_qps = measure(index, queries, k, **filters)
+        print(f"  {name:<22} recall@{k} {recall:.3f}   ANN {ann_qps:8.0f} QPS   brute force {exact_qps:6.0f} QPS")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        index.snapshot(tmp + "/ivf")
+        snap_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        restored = IVFIndex.restore(tmp + "/ivf")
+        restore_s = time.perf_counter() - t0
+        same = restored.search(queries[0], k) == index.search(queries[0], k)
+        print(f"  snapshot {snap_s:.2f} s, restore (mmap) {restore_s:.2f} s, identical results: {same}")
+        del restored
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--nprobe", type=int, default=16)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+    for n in args.sizes:
+        bench(n, args.dim, args.queries, args.k, args.nprobe)
+
+
+if __name__ == "__main__":
+    main()
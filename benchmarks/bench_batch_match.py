@@ -0,0 +1,64 @@
+# benchmarks/bench_batch_match.py — batch matching across worker processes
+#
+# Matches every problem against a synthetic senior pool with batch_match:
+# in-process (workers=0) and over 1..N worker processes sharing the senior
+# matrix through shared memory, against the per-problem top_k loop. Scaling
+# efficiency is speedup over 1 worker divided by the worker count; it can
+# only be meaningful up to the number of cores this machine has.
+#
+#   python -m benchmarks.bench_batch_match [--problems 20000] [--seniors 100000] [--max-workers N]
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from batch_match import batch_match
+from matching import SeniorMatcher
+from sample_data import synthetic_problems, synthetic_seniors
+
+
+def run(seniors, problems, workers):
+    t0 = time.perf_counter()
+    results = [(rows, scores) for _, rows, scores in batch_match(seniors, problems, k=3, workers=workers)]
+    return time.perf_counter() - t0, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--problems", type=int, default=20_000)
+    parser.add_argument("--seniors", type=int, default=100_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    seniors = synthetic_seniors(args.seniors, seed=11)
+    problems = synthetic_problems(args.problems, seed=12)
+    matcher = SeniorMatcher(seniors)
+    print(f"{args.problems:,} problems x {args.seniors:,} seniors, {os.cpu_count()} core(s)")
+
+    sample = problems[:200]
+    t0 = time.perf_counter()
+    expected = [matcher.top_k(p, k=3, prefilter=False) for p in sample]
+    loop = (time.perf_counter() - t0) / len(sample) * args.problems
+    print(f"top_k per problem:   {loop:8.1f} s (estimated from {len(sample)} problems)")
+
+    in_process, results = run(seniors, problems, 0)
+    print(f"in-process:          {in_process:8.1f} s  ({loop / in_process:.1f}x the loop)")
+    for want, (rows, scores) in zip(expected, results):
+        assert [m.senior.id for m in want] == [seniors[i].id for i in rows]
+        assert np.allclose([m.score for m in want], scores)
+
+    base = None
+    for workers in range(1, args.max_workers + 1):
+        seconds, got = run(seniors, problems, workers)
+        assert all(np.array_equal(a[0], b[0]) for a, b in zip(results, got))
+        base = base or seconds
+        speedup = base / seconds
+        print(f"{workers:2d} worker(s):        {seconds:8.1f} s  speedup {speedup:4.2f}x, "
+              f"efficiency {speedup / workers:4.0%}")
+    print(f"  {len(sample)} sampled rankings equal SeniorMatcher.top_k(prefilter=False): ok")
+
+
+if __name__ == "__main__":
+    main()
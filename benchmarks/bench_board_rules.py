@@ -0,0 +1,86 @@
+# benchmarks/bench_board_rules.py — compiled board rules vs the original if-chain
+#
+#   python -m benchmarks.bench_board_rules [--problems 100000]
+
+import argparse
+import time
+
+from board_rules import BOARD, BOARD_RULES, FIELD_OPTIONS, BoardAnalyzer, BoardRule
+from models import FounderProblem
+from sample_data import synthetic_problems
+
+
+def legacy_virtual_board(problem: FounderProblem) -> str:
+    """mock_virtual_board exactly as founder_app.py defined it before the rule engine."""
+    lines = []
+    lines.append(f"Main problem identified: {problem.main_problem_one_line}")
+    lines.append("")
+
+    if "Weak or unclear strategy" in problem.why_exists:
+        lines.append("🧭 Strategy Agent: The root cause seems to be an unclear strategy. You may not have a sharp definition of who you serve, with what offer, and why you are different.")
+    if "Poor execution / follow-through" in problem.why_exists:
+        lines.append("⚙️ Execution Agent: You’ve already tried some actions, but follow-through and consistency look weak. The problem may not be the idea, but how rigorously it’s being executed.")
+    if "Not talking enough to customers" in problem.why_exists:
+        lines.append("🗣️ Customer Agent: You are likely missing deep, structured conversations with customers. Without this, it’s hard to know whether the problem is pricing, product, or positioning.")
+    if "Low sales experience" in problem.why_exists:
+        lines.append("💼 Sales Agent: Sales capability appears to be a gap. You may need senior guidance on building a repeatable sales motion instead of one-off efforts.")
+    if "Cashflow / Runway" in problem.impact_areas:
+        lines.append("📊 Finance Agent: Cashflow is under pressure. Any solution must protect runway while you run experiments on product or marketing.")
+
+    if len(lines) <= 2:
+        lines.append("🤝 Board Summary: Based on your inputs, you’re facing a mix of strategy, execution, and learning issues. A senior with hands-on experience in your stage and domain can help you avoid expensive mistakes and focus on what truly moves the needle.")
+
+    return "\n".join(lines)
+
+
+def chained_board(problem: FounderProblem, rules: list, summary: str) -> str:
+    """The original if-chain generalised to any rule list: one membership test per rule."""
+    lines = [f"Main problem identified: {problem.main_problem_one_line}", ""]
+    for r in rules:
+        if r.option in getattr(problem, r.field):
+            lines.append(r.text)
+    if len(lines) <= 2:
+        lines.append(summary)
+    return "\n".join(lines)
+
+
+def synthetic_rules(n: int) -> list:
+    """n rules cycling over every form option, as the board grows more agents."""
+    options = [(field, opt) for field, opts in FIELD_OPTIONS.items() for opt in opts]
+    return [BoardRule(f"Agent {i}", *options[i % len(options)], f"Agent {i}: advice.") for i in range(n)]
+
+
+def rate(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return n / (time.perf_counter() - t0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--problems", type=int, default=100_000)
+    args = parser.parse_args()
+
+    problems = synthetic_problems(args.problems, seed=3)
+    legacy = [legacy_virtual_board(p) for p in problems]
+    assert BOARD.analyze_batch(problems) == legacy, "compiled rules disagree with the original function"
+
+    print(f"{args.problems:,} problems, outputs identical")
+    print(f"original if-chain, one by one: {rate(lambda: [legacy_virtual_board(p) for p in problems], len(problems)):>12,.0f} problems/s")
+    print(f"compiled, one by one:          {rate(lambda: [BOARD.analyze(p) for p in problems], len(problems)):>12,.0f} problems/s")
+    print(f"compiled, one batch:           {rate(lambda: BOARD.analyze_batch(problems), len(problems)):>12,.0f} problems/s")
+
+    sample = problems[:20_000]
+    print("\nrule count scaling (problems/s)")
+    print(f"{'rules':>6} {'if-chain':>12} {'compiled batch':>15}")
+    for n_rules in (len(BOARD_RULES), 20, 50, 100):
+        rules = BOARD_RULES if n_rules == len(BOARD_RULES) else synthetic_rules(n_rules)
+        board = BoardAnalyzer(rules)
+        assert board.analyze_batch(sample) == [chained_board(p, rules, board.summary) for p in sample]
+        chain = rate(lambda: [chained_board(p, rules, board.summary) for p in sample], len(sample))
+        compiled = rate(lambda: board.analyze_batch(sample), len(sample))
+        print(f"{n_rules:>6} {chain:>12,.0f} {compiled:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
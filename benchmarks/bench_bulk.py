@@ -0,0 +1,77 @@
+# benchmarks/bench_bulk.py — bulk import / export throughput and memory
+#
+# Writes N synthetic seniors to a CSV file, then times `python bulk.py
+# import` and `export` in child processes (so peak RSS is the CLI's own).
+#
+#   python -m benchmarks.bench_bulk [--records 1000000] [--format csv]
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bulk import LIST_SEP
+from sample_data import iter_synthetic_seniors
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIELDS = [
+    "id", "name", "email", "linkedin_url", "headline", "skills", "intro", "preferred_domains",
+    "preferred_startup_stage", "preferred_problem_types", "availability_days_per_week",
+    "availability_hours_per_day", "created_at",
+]
+
+
+def write_input(path: str, n: int, fmt: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f) if fmt == "csv" else None
+        if writer:
+            writer.writerow(FIELDS)
+        for s in iter_synthetic_seniors(n, seed=21):
+            row = [getattr(s, name) for name in FIELDS]
+            if writer:
+                writer.writerow([LIST_SEP.join(v) if isinstance(v, list) else v for v in row])
+            else:
+                f.write(json.dumps(dict(zip(FIELDS, row))) + "\n")
+
+
+def run(args: list) -> tuple:
+    """(seconds, peak RSS MB) of one bulk.py child process."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, os.path.join(ROOT, "bulk.py"), *args], cwd=ROOT)
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - t0
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode:
+        raise SystemExit(f"bulk.py {' '.join(args)} failed with {proc.returncode}")
+    return elapsed, usage.ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--chunk", type=int, default=10_000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="bench-bulk-")
+    source = os.path.join(directory, f"seniors.{args.format}")
+    data_dir = os.path.join(directory, "data")
+    t0 = time.perf_counter()
+    write_input(source, args.records, args.format)
+    size = os.path.getsize(source) / 1e6
+    print(f"{args.records:,} seniors, {size:,.0f} MB {args.format} (generated in {time.perf_counter() - t0:.1f}s)")
+
+    seconds, rss = run(["import", "seniors", source, "--data-dir", data_dir, "--chunk", str(args.chunk)])
+    print(f"import:            {seconds:7.1f}s  {args.records / seconds:9,.0f} records/s  peak RSS {rss:6.0f} MB")
+    seconds, rss = run(["import", "seniors", source, "--data-dir", data_dir, "--chunk", str(args.chunk)])
+    print(f"re-import (dupes): {seconds:7.1f}s  {args.records / seconds:9,.0f} records/s  peak RSS {rss:6.0f} MB")
+    seconds, rss = run(["export", "seniors", os.path.join(directory, "out.csv"), "--data-dir", data_dir])
+    print(f"export to csv:     {seconds:7.1f}s  {args.records / seconds:9,.0f} records/s  peak RSS {rss:6.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_embedding_cache.py — embedding cache hit paths and saved calls
+#
+# Uses a deterministic fake embedder, so it runs offline:
+#   python -m benchmarks.bench_embedding_cache [--profiles 5000] [--dim 768]
+
+import argparse
+import hashlib
+import tempfile
+import time
+
+import numpy as np
+
+from embedding_cache import EmbeddingCache
+from models import build_senior_ai_text
+from sample_data import synthetic_seniors
+
+MODEL = "models/text-embedding-004"
+
+
+class FakeEmbedder:
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.calls = 0
+        self.texts = 0
+
+    def __call__(self, texts: list) -> list:
+        self.calls += 1
+        self.texts += len(texts)
+        out = []
+        for t in texts:
+            seed = int.from_bytes(hashlib.sha256(t.encode()).digest()[:8], "little")
+            out.append(np.random.default_rng(seed).standard_normal(self.dim, dtype=np.float32))
+        return out
+
+
+def per_item_us(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--profiles", type=int, default=5_000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    texts = [build_senior_ai_text(s) for s in synthetic_seniors(args.profiles, seed=1)]
+    # Same profiles again with cosmetic whitespace changes, as on a re-submit.
+    resubmits = ["  " + t.replace("\n", "  \n") for t in texts]
+    embed = FakeEmbedder(args.dim)
+
+    def run(cache, batch_texts):
+        for i in range(0, len(batch_texts), args.batch):
+            cache.get_or_embed(batch_texts[i : i + args.batch], MODEL, embed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EmbeddingCache(tmp, lru_size=args.profiles)
+        cold = per_item_us(lambda: run(cache, texts), len(texts))
+        warm = per_item_us(lambda: run(cache, resubmits), len(texts))
+        print(f"cold (miss + embed + write): {cold:8.1f} us/profile")
+        print(f"memory hit:                  {warm:8.1f} us/profile")
+
+        restarted = EmbeddingCache(tmp, lru_size=args.profiles)
+        disk = per_item_us(lambda: run(restarted, texts), len(texts))
+        print(f"disk hit after restart:      {disk:8.1f} us/profile")
+
+        lookups = 3 * len(texts)
+        print(f"embedding calls: {embed.calls} batches / {embed.texts} texts for {lookups} lookups")
+        print(f"first instance: {cache.stats()}")
+        print(f"after restart:  {restarted.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# benchmarks/bench_explanations.py — match explanations: templates and batched top-1 vs per-match Gemini
+#
+# Templates: reason strings for every synthetic problem's top-3 matches,
+# built by sentence-by-sentence concatenation (the previous fit_reason) and
+# by explanations.fit_reason (which adds the stage sentence).
+#
+# Gemini: --founders founders open their results at once (--concurrency
+# threads, like concurrent sessions) against the offline fake at --latency
+# seconds per call, with an empty generation cache per strategy:
+#
+#   per match    every one of the k matches explained by its own call
+#   top-1        only the best match, one call per founder
+#   top-1 batch  only the best match, coalesced across founders (MAX_BATCH)
+#
+# Reports model calls and the time each founder waits for explanations
+# (what the results view blocks on before rendering them).
+#
+#   python -m benchmarks.bench_explanations [--founders 200] [--concurrency 16] [--latency 0.3]
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("SENIOR_INTERN_TIMING", "0")
+
+import numpy as np
+
+import explanations
+from explanations import ExplanationBatcher, fit_reason
+from fake_gemini import FakeGemini
+from gemini_client import GeminiClient, run_sync
+from generation_cache import GenerationCache
+from matching import SeniorMatcher
+from sample_data import synthetic_problems, synthetic_seniors
+
+K = 3
+
+
+def concatenated_reason(problem, match) -> str:
+    """fit_reason as it was: the reason string grown one += at a time."""
+    reason = match.senior.intro
+    if match.shared_problem_types:
+        reason += f" They enjoy solving {', '.join(match.shared_problem_types)} problems."
+    if match.shared_domains:
+        reason += f" They want to work in {', '.join(match.shared_domains)}."
+    if "Revenue / Sales" in problem.impact_areas:
+        reason += " Given that revenue and GTM are central for you, their experience will shortcut a lot of trial-and-error."
+    if "Customer satisfaction" in problem.impact_areas:
+        reason += " They have seen similar churn or satisfaction issues and know how to improve experience step by step."
+    return reason
+
+
+def bench_templates(pairs: list, repeat: int = 5) -> None:
+    def per_reason_us(fn) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for p, m in pairs:
+                fn(p, m)
+            best = min(best, time.perf_counter() - t0)
+        return best / len(pairs) * 1e6
+
+    concat = per_reason_us(concatenated_reason)
+    templated = per_reason_us(fit_reason)
+    print(f"reasons for {len(pairs):,} matches: concatenation {concat:.2f} us, "
+          f"templates {templated:.2f} us per reason")
+
+
+def bench_gemini(matched: list, concurrency: int, latency: float) -> None:
+    strategies = {
+        "per match": (K, 1),
+        "top-1": (1, 1),
+        "top-1 batch": (1, explanations.MAX_BATCH),
+    }
+    print(f"{len(matched)} founders, {concurrency} concurrent, fake Gemini at {latency * 1000:.0f} ms per call")
+    print(f"{'strategy':12s} {'calls':>6s} {'per founder':>12s} {'wait p50 ms':>12s} {'wait p95 ms':>12s} {'wall s':>7s}")
+    for name, (explained, max_batch) in strategies.items():
+        backend = FakeGemini(latency=latency)
+        client = GeminiClient(backend)
+        batcher = ExplanationBatcher(client, cache=GenerationCache(), max_batch=max_batch)
+
+        def founder(item):
+            problem, matches = item
+            t0 = time.perf_counter()
+
+            async def explain_all():
+                return await asyncio.gather(*(batcher.explain(problem, m) for m in matches[:explained]))
+
+            answers = run_sync(explain_all(), timeout=120)
+            assert all(answers), "every explanation should come back"
+            return time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            waits = list(pool.map(founder, matched))
+        wall = time.perf_counter() - t0
+        ms = np.asarray(waits) * 1000
+        print(f"{name:12s} {backend.calls:6d} {backend.calls / len(matched):12.2f} "
+              f"{np.percentile(ms, 50):12.0f} {np.percentile(ms, 95):12.0f} {wall:7.1f}")
+        run_sync(batcher.close(), timeout=5)
+        run_sync(client.close(), timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seniors", type=int, default=10_000)
+    parser.add_argument("--problems", type=int, default=20_000, help="problems for the template timings")
+    parser.add_argument("--founders", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+
+    matcher = SeniorMatcher(synthetic_seniors(args.seniors, seed=41))
+    problems = synthetic_problems(max(args.problems, args.founders), seed=42)
+    matched = [(p, matcher.top_k(p, k=K)) for p in problems]
+    bench_templates([(p, m) for p, ms in matched[: args.problems] for m in ms])
+    bench_gemini(matched[: args.founders], args.concurrency, args.latency)
+
+
+if __name__ == "__main__":
+    main()
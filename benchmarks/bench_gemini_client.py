@@ -0,0 +1,80 @@
+# benchmarks/bench_gemini_client.py — burst of submissions through the async client
+#
+# Runs offline against fake_gemini.FakeGemini:
+#   python -m benchmarks.bench_gemini_client [--submissions 1000] [--rpm 3000]
+#
+# Every submission embeds its build_ai_text; founder submissions also
+# generate an advisory analysis. The naive baseline sends one request per
+# payload, sequentially, as test_gemini.py does.
+
+import argparse
+import asyncio
+import time
+
+from fake_gemini import FakeGemini
+from gemini_client import GeminiClient
+from models import build_problem_ai_text, build_senior_ai_text
+from sample_data import synthetic_problems, synthetic_seniors
+
+
+def payloads(n: int, founder_share: float) -> list:
+    n_founders = int(n * founder_share)
+    seniors = [("senior", build_senior_ai_text(s)) for s in synthetic_seniors(n - n_founders, seed=1)]
+    founders = [("founder", build_problem_ai_text(p)) for p in synthetic_problems(n_founders, seed=2)]
+    mixed = []
+    for i in range(max(len(seniors), len(founders))):
+        mixed.extend(x[i] for x in (seniors, founders) if i < len(x))
+    return mixed
+
+
+async def naive(items: list, backend: FakeGemini) -> float:
+    t0 = time.perf_counter()
+    for kind, text in items:
+        await backend.embed([text], "embed")
+        if kind == "founder":
+            await backend.generate(text, "generate")
+    return time.perf_counter() - t0
+
+
+async def burst(items: list, backend: FakeGemini, rpm: float, in_flight: int) -> tuple:
+    client = GeminiClient(backend, requests_per_minute=rpm, max_in_flight=in_flight)
+
+    async def submit(kind, text):
+        await client.embed(text)
+        if kind == "founder":
+            await client.generate(text)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(submit(k, t) for k, t in items))
+    elapsed = time.perf_counter() - t0
+    await client.close()
+    return elapsed, client.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--submissions", type=int, default=1000)
+    parser.add_argument("--founder-share", type=float, default=0.3)
+    parser.add_argument("--latency", type=float, default=0.05, help="fake API latency per request, seconds")
+    parser.add_argument("--rpm", type=float, default=3000, help="quota, requests per minute")
+    parser.add_argument("--in-flight", type=int, default=8)
+    parser.add_argument("--failure-rate", type=float, default=0.02)
+    parser.add_argument("--baseline-sample", type=int, default=50)
+    args = parser.parse_args()
+
+    items = payloads(args.submissions, args.founder_share)
+
+    sample = items[: args.baseline_sample]
+    base = asyncio.run(naive(sample, FakeGemini(latency=args.latency)))
+    base_rate = len(sample) / base
+    print(f"naive sequential:  {base_rate:8.1f} submissions/s  (measured on {len(sample)}, "
+          f"~{args.submissions / base_rate:.1f} s for {args.submissions})")
+
+    backend = FakeGemini(latency=args.latency, rpm_limit=int(args.rpm), failure_rate=args.failure_rate)
+    elapsed, stats = asyncio.run(burst(items, backend, args.rpm, args.in_flight))
+    print(f"batched client:    {len(items) / elapsed:8.1f} submissions/s  ({elapsed:.2f} s for {len(items)})")
+    print(f"api requests: {backend.calls} (rejected by fake: {backend.rejected})  client: {stats}")
+
+
+if __name__ == "__main__":
+    main()
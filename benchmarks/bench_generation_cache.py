@@ -0,0 +1,104 @@
+# benchmarks/bench_generation_cache.py — generation cache on repeat founder situations
+#
+# Founders arrive with one of a few dozen situations (same impact areas, why
+# it exists, stage, description). Half of them retype the description with a
+# small variation, so only a semantic lookup can match them. Embeddings are
+# simulated as the situation's vector plus a little noise per founder and
+# put in the embedding cache, as the submission job would have. Every board
+# streams through AdvisoryStream against the offline fake.
+#
+#   python -m benchmarks.bench_generation_cache [--submissions 150] [--situations 30]
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from dataclasses import replace
+
+import numpy as np
+
+from advisory_board import AdvisoryStream
+from embedding_cache import EmbeddingCache
+from fake_gemini import FakeGemini
+from gemini_client import GeminiClient, run_sync
+from generation_cache import GenerationCache
+from models import build_problem_ai_text
+from sample_data import synthetic_problems
+
+DIM = 768
+NOISE = 0.05     # per-founder wording; cosine to the situation stays ~0.999
+
+
+def submissions(n, n_situations, seed=0):
+    rng = random.Random(seed)
+    situations = synthetic_problems(n_situations, seed=seed)
+    out = []
+    for i in range(n):
+        s = rng.randrange(n_situations)
+        p = situations[s]
+        description = p.detailed_description
+        if rng.random() < 0.5:
+            description += rng.choice([" Any help appreciated.", " Thanks!", " We need to fix this fast."])
+        out.append((s, replace(
+            p, id=str(uuid.UUID(int=rng.getrandbits(128))), founder_name=f"Founder {i}",
+            founder_email=f"f{i}@example.com", company_name=f"Startup {i}", detailed_description=description,
+        )))
+    return out
+
+
+def run(problems, vectors, cache, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        embeddings = EmbeddingCache(directory=tmp)
+        client = GeminiClient(
+            FakeGemini(latency=args.latency, token_latency=args.token_latency), cache=embeddings
+        )
+        for s, p in problems:
+            noise = np.random.default_rng(uuid.UUID(p.id).int).standard_normal(DIM).astype(np.float32)
+            embeddings.put(build_problem_ai_text(p), client.embed_model, vectors[s] + NOISE * noise / np.sqrt(DIM))
+        ttft, total = [], []
+        for _, p in problems:
+            stream = AdvisoryStream(p, client=client, cache=cache)
+            for i in range(len(stream)):
+                for _ in stream.section(i):
+                    pass
+            ttft.append(stream.first_token)
+            total.append(time.perf_counter() - stream.started)
+        stats = client.stats()
+        run_sync(client.close())
+    return ttft, total, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--submissions", type=int, default=150)
+    parser.add_argument("--situations", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--token-latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    problems = submissions(args.submissions, args.situations)
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((args.situations, DIM)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    print(f"{args.submissions} submissions over {args.situations} situations, "
+          f"fake at {args.latency * 1000:.0f} ms to first token")
+
+    caches = {
+        "no cache": GenerationCache(max_entries=0),
+        "exact only": GenerationCache(threshold=None),
+        "exact + semantic": GenerationCache(),
+    }
+    for name, cache in caches.items():
+        ttft, total, stats = run(problems, vectors, cache, args)
+        c = cache.stats()
+        print(f"{name:17s} board p50 {statistics.median(total) * 1000:5.0f} ms, "
+              f"first text p50 {statistics.median(ttft) * 1000:5.0f} ms | "
+              f"generate calls {stats['generated']:4d}, hit rate {c['hit_rate']:4.0%} "
+              f"({c['exact_hits']} exact, {c['semantic_hits']} semantic), "
+              f"{c['seconds_saved']:.0f} s generation saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# benchmarks/bench_hybrid.py — hybrid retrieval quality and latency vs the categorical matcher
+#
+# Synthetic labelled set: every senior gets a hidden specialty (one of
+# TOPICS) that only shows in their intro, written with two of the topic's
+# words; every problem gets a specialty too, described with zero, one or
+# two of the topic's words (drawn independently of any senior's) and vague
+# VAGUE words for the rest, so a third of the founders share no specialty
+# word with anyone. Relevance of a senior to a problem:
+#
+#   2  same specialty and a preferred domain the problem mentions
+#   1  same specialty only
+#   0  otherwise
+#
+# Embeddings stand in for Gemini's: a topic centroid plus half a domain
+# centroid plus Gaussian noise, so they know the specialty without sharing
+# words, but imperfectly. Compares, at k=10: the categorical matcher alone,
+# BM25 alone, vectors alone, hybrid without vectors (what the app does
+# without Gemini) and the full hybrid. Reports nDCG@10, precision@10 (share
+# of grade 2) and MRR (first grade 2), plus latency p50 / p99 per method.
+#
+#   python -m benchmarks.bench_hybrid [--seniors 20000] [--queries 500] [--dim 768]
+
+import argparse
+import os
+import random
+import time
+from dataclasses import replace
+
+os.environ.setdefault("SENIOR_INTERN_TIMING", "0")
+
+import numpy as np
+
+from hybrid import CATEGORICAL_WEIGHT, HybridRetriever, problem_text, reciprocal_rank_fusion
+from matching import SeniorMatcher, infer_domains
+from models import DOMAINS
+from sample_data import synthetic_problems, synthetic_seniors
+
+K = 10
+TOPICS = [
+    ["churn", "retention", "renewals", "cohorts", "loyalty", "reactivation"],
+    ["pricing", "discounting", "packaging", "tiers", "monetisation", "willingness"],
+    ["fundraising", "investors", "term", "valuation", "pitch", "seed"],
+    ["hiring", "recruiting", "interviews", "onboarding", "headcount", "talent"],
+    ["logistics", "warehousing", "fulfilment", "shipping", "inventory", "couriers"],
+    ["compliance", "regulators", "licensing", "audits", "kyc", "gdpr"],
+    ["enterprise", "procurement", "contracts", "pilots", "champions", "security"],
+    ["marketplace", "liquidity", "supply", "demand", "matching", "take"],
+    ["brand", "storytelling", "awareness", "messaging", "creative", "identity"],
+    ["seo", "content", "organic", "search", "keywords", "backlinks"],
+    ["ads", "paid", "acquisition", "cac", "campaigns", "attribution"],
+    ["partnerships", "channel", "resellers", "alliances", "distribution", "referrals"],
+    ["cashflow", "runway", "burn", "budgeting", "forecasting", "margins"],
+    ["onboarding", "activation", "adoption", "tutorials", "aha", "setup"],
+    ["support", "tickets", "helpdesk", "satisfaction", "nps", "escalations"],
+    ["culture", "morale", "values", "feedback", "burnout", "rituals"],
+    ["roadmap", "prioritisation", "discovery", "backlog", "specs", "releases"],
+    ["data", "analytics", "dashboards", "metrics", "instrumentation", "warehouse"],
+    ["infrastructure", "cloud", "uptime", "scaling", "devops", "outages"],
+    ["manufacturing", "factories", "suppliers", "tooling", "quality", "sourcing"],
+    ["retail", "stores", "merchandising", "footfall", "shelves", "franchise"],
+    ["clinical", "patients", "clinicians", "trials", "hospitals", "reimbursement"],
+    ["payments", "checkout", "fraud", "chargebacks", "acquirers", "settlement"],
+    ["curriculum", "teachers", "schools", "learners", "courses", "districts"],
+]
+VAGUE = ["growth", "focus", "execution", "momentum", "clarity", "traction", "priorities", "speed"]
+NOISE = 2.5     # noise norm relative to the topic centroid
+
+
+def labelled_set(n_seniors: int, n_queries: int, dim: int, seed: int = 0) -> tuple:
+    rng = random.Random(seed)
+    seniors, senior_topics = [], []
+    for s in synthetic_seniors(n_seniors, seed=31):
+        t = rng.randrange(len(TOPICS))
+        a, b = rng.sample(TOPICS[t], 2)
+        seniors.append(replace(s, intro=f"{s.intro} Known for {a} and {b} work."))
+        senior_topics.append(t)
+    problems, problem_topics = [], []
+    for p in synthetic_problems(n_queries, seed=32):
+        t = rng.randrange(len(TOPICS))
+        n_specific = rng.randint(0, 2)
+        a, b = rng.sample(TOPICS[t], n_specific) + rng.sample(VAGUE, 2 - n_specific)
+        problems.append(replace(p, detailed_description=f"Our biggest gap is {a}; we also struggle with {b}."))
+        problem_topics.append(t)
+
+    nrng = np.random.default_rng(seed)
+    topic_c = nrng.standard_normal((len(TOPICS), dim)).astype(np.float32) / np.sqrt(dim)
+    domain_c = nrng.standard_normal((len(DOMAINS), dim)).astype(np.float32) / np.sqrt(dim)
+    domain_of = {d: i for i, d in enumerate(DOMAINS)}
+
+    def embed(topic: int, domains: list) -> np.ndarray:
+        v = topic_c[topic] + NOISE * nrng.standard_normal(dim).astype(np.float32) / np.sqrt(dim)
+        if domains:
+            v += 0.5 * domain_c[[domain_of[d] for d in domains]].mean(axis=0)
+        return v
+
+    senior_vectors = np.stack([embed(t, s.preferred_domains) for s, t in zip(seniors, senior_topics)])
+    problem_vectors = np.stack([embed(t, infer_domains(p)) for p, t in zip(problems, problem_topics)])
+
+    s_topics = np.array(senior_topics)
+    s_domains = np.zeros((len(seniors), len(DOMAINS)), dtype=bool)
+    for i, s in enumerate(seniors):
+        s_domains[i, [domain_of[d] for d in s.preferred_domains]] = True
+    gains = []
+    for p, t in zip(problems, problem_topics):
+        shares = s_domains[:, [domain_of[d] for d in infer_domains(p)]].any(axis=1)
+        gains.append(np.where(s_topics == t, np.where(shares, 2, 1), 0))
+    return seniors, problems, senior_vectors, problem_vectors, gains
+
+
+def quality(ranked: list, gains: list) -> dict:
+    discount = 1 / np.log2(np.arange(2, K + 2))
+    ndcg, precision, rr = [], [], []
+    for rows, g in zip(ranked, gains):
+        rows = np.asarray(rows[:K], dtype=np.intp)
+        got = g[rows]
+        ideal = np.sort(g)[::-1][:K]
+        ndcg.append(((2.0 ** got - 1) @ discount[: len(got)]) / ((2.0 ** ideal - 1) @ discount))
+        precision.append(np.sum(got == 2) / K)
+        hits = np.flatnonzero(got == 2)
+        rr.append(1 / (hits[0] + 1) if len(hits) else 0.0)
+    return {"ndcg": np.mean(ndcg), "p": np.mean(precision), "mrr": np.mean(rr)}
+
+
+def run(fn, items: list) -> tuple:
+    out, times = [], []
+    for item in items:
+        t0 = time.perf_counter()
+        out.append(fn(item))
+        times.append(time.perf_counter() - t0)
+    ms = np.asarray(times) * 1000
+    return out, np.percentile(ms, 50), np.percentile(ms, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seniors", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--dim", type=int, default=768)
+    args = parser.parse_args()
+
+    seniors, problems, senior_vectors, problem_vectors, gains = labelled_set(args.seniors, args.queries, args.dim)
+    matcher = SeniorMatcher(seniors)
+    retriever = HybridRetriever(matcher)
+    t0 = time.perf_counter()
+    retriever.sync()
+    bm25_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    retriever.add_vectors(list(range(len(seniors))), senior_vectors)
+    vectors_s = time.perf_counter() - t0
+    print(f"{len(seniors):,} seniors, {len(problems)} queries, {len(TOPICS)} specialties; "
+          f"BM25 index {bm25_s:.2f} s, vector index {vectors_s:.2f} s "
+          f"({'IVF' if retriever.vectors.trained else 'flat'})")
+
+    queries = list(zip(problems, problem_vectors))
+    methods = {
+        "categorical": lambda q: matcher.ranked(q[0], K)[0],
+        "bm25": lambda q: retriever.bm25.top(problem_text(q[0]), K),
+        "vector": lambda q: retriever.semantic(q[1], K),
+        "hybrid, no vectors": lambda q: reciprocal_rank_fusion(
+            [retriever.categorical(q[0]), retriever.lexical(q[0])], [CATEGORICAL_WEIGHT, 1.0])[0][:K],
+        "hybrid": lambda q: reciprocal_rank_fusion(
+            [retriever.categorical(q[0]), retriever.lexical(q[0]), retriever.semantic(q[1])],
+            [CATEGORICAL_WEIGHT, 1.0, 1.0])[0][:K],
+        "hybrid, equal weights": lambda q: reciprocal_rank_fusion(
+            [retriever.categorical(q[0]), retriever.lexical(q[0]), retriever.semantic(q[1])])[0][:K],
+    }
+    run(methods["hybrid"], queries[:20])     # warm-up
+    print(f"{'method':22s} {'nDCG@10':>8s} {'P@10':>6s} {'MRR':>6s} {'p50 ms':>8s} {'p99 ms':>8s}")
+    for name, fn in methods.items():
+        ranked, p50, p99 = run(fn, queries)
+        q = quality(ranked, gains)
+        print(f"{name:22s} {q['ndcg']:8.3f} {q['p']:6.3f} {q['mrr']:6.3f} {p50:8.2f} {p99:8.2f}")
+    _, p50, p99 = run(lambda q: retriever.top_k(q[0], k=3, query_vector=q[1]), queries)
+    print(f"HybridRetriever.top_k(k=3) with Match objects: p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
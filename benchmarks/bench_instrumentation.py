@@ -0,0 +1,61 @@
+# benchmarks/bench_instrumentation.py — cost of timing spans, enabled and disabled
+#
+# Runs the same micro-benchmarks in a child process per setting, since
+# SENIOR_INTERN_TIMING is read at import: an empty `with span(...)`, a
+# @timed no-op function, and SeniorMatcher.top_k (instrumented) over a
+# 20k-senior pool, against the same code with no instrumentation at all.
+#
+#   python -m benchmarks.bench_instrumentation
+
+import json
+import os
+import subprocess
+import sys
+
+CHILD = r"""
+import json, timeit
+from instrumentation import span, timed
+from matching import SeniorMatcher
+from sample_data import synthetic_problems, synthetic_seniors
+
+def bare():
+    pass
+
+@timed("bench.noop")
+def noop():
+    pass
+
+def empty_span():
+    with span("bench.span"):
+        pass
+
+matcher = SeniorMatcher(synthetic_seniors(20_000, seed=1))
+problem = synthetic_problems(1, seed=2)[0]
+raw_top_k = getattr(SeniorMatcher.top_k, "__wrapped__", SeniorMatcher.top_k)
+
+def ns(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e9
+
+print(json.dumps({
+    "bare call": ns(bare, 200_000),
+    "@timed call": ns(noop, 200_000),
+    "empty span": ns(empty_span, 200_000),
+    "top_k, uninstrumented": ns(lambda: raw_top_k(matcher, problem), 300),
+    "top_k": ns(lambda: matcher.top_k(problem), 300),
+}))
+"""
+
+
+def main():
+    results = {}
+    for setting in ("0", "1"):
+        env = dict(os.environ, SENIOR_INTERN_TIMING=setting)
+        out = subprocess.run([sys.executable, "-c", CHILD], env=env, capture_output=True, text=True, check=True)
+        results[setting] = json.loads(out.stdout)
+    print(f"{'':24s} {'disabled':>12s} {'enabled':>12s}")
+    for name in results["1"]:
+        print(f"{name:24s} {results['0'][name]:10.0f}ns {results['1'][name]:10.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/bench_inverted_index.py — AND/OR query latency and matcher pre-filtering
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_inverted_index [--seniors 100000] [--queries 200]
+
+import argparse
+import statistics
+import time
+
+from inverted_index import domain_term, problem_term
+from matching import SeniorMatcher
+from sample_data import synthetic_problems, synthetic_seniors
+
+QUERIES = {
+    "Fintech AND Turnaround": [[domain_term("Fintech")], [problem_term("Turnaround / Crisis")]],
+    "(SaaS OR Edtech) AND Sales": [[domain_term("SaaS"), domain_term("Edtech")], [problem_term("Sales & GTM")]],
+    "Retail OR Hospitality": [[domain_term("Retail"), domain_term("Hospitality")]],
+}
+
+
+def timed(fn, repeat: int) -> float:
+    """Median wall time of fn() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seniors", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    seniors = synthetic_seniors(args.seniors, seed=1)
+    t0 = time.perf_counter()
+    matcher = SeniorMatcher(seniors)
+    print(f"built matcher + index for {len(matcher):,} seniors in {time.perf_counter() - t0:.2f} s")
+
+    for name, groups in QUERIES.items():
+        hits = len(matcher.index.search(groups))
+        ms = timed(lambda: matcher.index.search(groups), args.queries)
+        print(f"{name:<30} {hits:>8,} hits  {ms:.3f} ms")
+
+    problems = synthetic_problems(args.queries, seed=2)
+    sizes = [len(ids) if (ids := matcher.candidates(p, 3)) is not None else len(matcher) for p in problems]
+    full = statistics.median(timed(lambda: matcher.top_k(p, prefilter=False), 1) for p in problems)
+    pre = statistics.median(timed(lambda: matcher.top_k(p), 1) for p in problems)
+    print(f"median candidates after pre-filter: {statistics.median(sizes):,.0f} of {len(matcher):,}")
+    print(f"top_k p50: full scan {full:.3f} ms, pre-filtered {pre:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
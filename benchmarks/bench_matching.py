@@ -0,0 +1,52 @@
+# benchmarks/bench_matching.py — per-query latency of the vectorized matcher
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_matching [--sizes 1000 10000 100000] [--queries 200]
+
+import argparse
+import statistics
+import time
+
+from matching import SeniorMatcher
+from sample_data import synthetic_problems, synthetic_seniors
+
+
+def bench(n_seniors: int, n_queries: int, k: int) -> dict:
+    seniors = synthetic_seniors(n_seniors, seed=1)
+    problems = synthetic_problems(n_queries, seed=2)
+
+    t0 = time.perf_counter()
+    matcher = SeniorMatcher(seniors)
+    encode_s = time.perf_counter() - t0
+
+    latencies = []
+    for p in problems:
+        t0 = time.perf_counter()
+        matcher.top_k(p, k=k)
+        latencies.append(time.perf_counter() - t0)
+    latencies.sort()
+
+    return {
+        "seniors": n_seniors,
+        "encode_s": encode_s,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "matrix_mb": matcher.features.nbytes / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'seniors':>10} {'encode s':>10} {'p50 ms':>8} {'p99 ms':>8} {'matrix MB':>10}")
+    for n in args.sizes:
+        r = bench(n, args.queries, args.k)
+        print(f"{r['seniors']:>10} {r['encode_s']:>10.2f} {r['p50_ms']:>8.3f} {r['p99_ms']:>8.3f} {r['matrix_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
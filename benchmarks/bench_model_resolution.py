@@ -0,0 +1,54 @@
+# benchmarks/bench_model_resolution.py — startup cost of picking a Gemini model
+#
+# Offline; model listing goes to fake_gemini.FakeGemini with a simulated
+# network round trip:
+#   python -m benchmarks.bench_model_resolution [--round-trip 0.6]
+
+import argparse
+import os
+import tempfile
+import time
+
+from fake_gemini import FakeGemini
+from model_resolver import METHODS, ModelResolver, choose
+
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--round-trip", type=float, default=0.6, help="simulated list_models latency, seconds")
+    args = parser.parse_args()
+
+    fake = FakeGemini()
+
+    def list_models():
+        return fake.list_models(latency=args.round_trip)
+
+    def old_startup():
+        # What test_gemini.py did on every run.
+        names = [m.name for m in list_models() if METHODS["generate"] in m.supported_generation_methods]
+        return choose("generate", names)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "gemini_models.json")
+        rows = [("list_models on every start (before)", timed(old_startup))]
+        rows.append(("first start, no cache", timed(lambda: ModelResolver(list_models, path).resolve())))
+        rows.append(("warm start, fresh cache", timed(lambda: ModelResolver(list_models, path).resolve())))
+        stale = ModelResolver(list_models, path, ttl=0)
+        rows.append(("warm start, stale cache (bg refresh)", timed(lambda: stale.resolve())))
+        os.environ["GEMINI_MODEL"] = "models/gemini-1.5-flash"
+        rows.append(("GEMINI_MODEL pinned", timed(lambda: ModelResolver(list_models, path).resolve())))
+        del os.environ["GEMINI_MODEL"]
+        time.sleep(args.round_trip + 0.1)  # let the background refresh finish before cleanup
+
+    for name, ms in rows:
+        print(f"{name:<40} {ms:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
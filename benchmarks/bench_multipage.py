@@ -0,0 +1,152 @@
+# benchmarks/bench_multipage.py — one multipage server vs one server per page
+#
+# Compares the old setup (`streamlit run` for home.py, app.py and
+# founder_app.py separately) with `streamlit run streamlit_app.py`:
+#
+#   * startup: time until each server answers its health check, and its RSS
+#   * loaded:  peak RSS once a session has walked every flow, with the senior
+#              store seeded, each flow in the process that would serve it
+#
+#   python -m benchmarks.bench_multipage [--seniors 20000]
+
+import argparse
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES = ["home.py", "app.py", "founder_app.py"]
+UNIFIED = "streamlit_app.py"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def start_server(script: str, env: dict) -> tuple:
+    """Launch `streamlit run script`; return (process, seconds until healthy)."""
+    port = free_port()
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", os.path.join(ROOT, script),
+        "--server.headless", "true", "--server.port", str(port),
+        "--browser.gatherUsageStats", "false",
+    ]
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}/_stcore/health"
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as r:
+                if r.status == 200:
+                    return proc, time.perf_counter() - t0
+        except OSError:
+            if proc.poll() is not None:
+                raise RuntimeError(f"streamlit run {script} exited with {proc.returncode}")
+            time.sleep(0.05)
+
+
+def bench_startup(scripts: list, env: dict) -> tuple:
+    procs, total_rss = [], 0.0
+    t0 = time.perf_counter()
+    try:
+        for script in scripts:
+            proc, _ = start_server(script, env)
+            procs.append(proc)
+        elapsed = time.perf_counter() - t0
+        total_rss = sum(rss_mb(p.pid) for p in procs)
+    finally:
+        for p in procs:
+            p.terminate()
+        for p in procs:
+            p.wait()
+    return elapsed, total_rss
+
+
+# ---------- Loaded sessions (child processes) ----------
+
+def fill_founder_form(at) -> None:
+    at.text_input[0].input("Jane")
+    at.text_input[1].input("jane@example.com")
+    at.text_input[3].input("We are a SaaS platform for small retailers")
+    at.text_input[4].input("We don't have repeat customers")
+    at.multiselect[0].set_value(["Revenue / Sales", "Cashflow / Runway"])
+    at.multiselect[1].set_value(["Low sales experience", "Weak or unclear strategy"])
+    at.multiselect[2].set_value(["Nothing yet"])
+    at.text_area[0].input("We acquired 500 users but few come back.")
+    at.button[0].click().run()
+
+
+def child(scripts: list) -> None:
+    """Walk the given flows in this process and print its peak RSS."""
+    sys.path.insert(0, ROOT)
+    from streamlit.testing.v1 import AppTest
+
+    for script in scripts:
+        at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=300).run()
+        if script == UNIFIED:
+            for page in PAGES[1:]:
+                at.switch_page(page).run()
+            fill_founder_form(at)
+        elif script == "founder_app.py":
+            fill_founder_form(at)
+        assert not at.exception, at.exception
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"peak_rss_mb": peak}))
+
+
+def loaded_rss(scripts: list, env: dict) -> float:
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_multipage", "--child", *scripts],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])["peak_rss_mb"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seniors", type=int, default=20_000)
+    parser.add_argument("--child", nargs="+")
+    args = parser.parse_args()
+    if args.child:
+        child(args.child)
+        return
+
+    sys.path.insert(0, ROOT)
+    from sample_data import synthetic_seniors
+    from store import SeniorStore
+
+    directory = tempfile.mkdtemp(prefix="bench-multipage-")
+    store = SeniorStore(os.path.join(directory, "seniors.jsonl"))
+    for s in synthetic_seniors(args.seniors, seed=7):
+        store.append(s)
+    store.close()
+    env = dict(os.environ, SENIOR_INTERN_DATA_DIR=directory)
+
+    print(f"{args.seniors:,} seniors in the store")
+    print(f"{'setup':<28} {'startup':>9} {'idle RSS':>10} {'loaded RSS':>11}")
+    separate_t, separate_rss = bench_startup(PAGES, env)
+    separate_loaded = sum(loaded_rss([page], env) for page in PAGES)
+    print(f"{'3 servers (one per page)':<28} {separate_t:>8.2f}s {separate_rss:>8.0f}MB {separate_loaded:>9.0f}MB")
+    unified_t, unified_rss = bench_startup([UNIFIED], env)
+    unified_loaded = loaded_rss([UNIFIED], env)
+    print(f"{'1 server (streamlit_app.py)':<28} {unified_t:>8.2f}s {unified_rss:>8.0f}MB {unified_loaded:>9.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_reruns.py — per-rerun script time of the Streamlit pages
+#
+# Seeds a throwaway data directory with synthetic seniors, drives
+# founder_app.py through the form with Streamlit's AppTest, then times
+# reruns of the results view (what every widget interaction costs).
+#
+#   python -m benchmarks.bench_reruns [--seniors 20000] [--reruns 20]
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def seed(directory: str, n: int) -> None:
+    from sample_data import synthetic_seniors
+    from store import SeniorStore
+
+    store = SeniorStore(os.path.join(directory, "seniors.jsonl"))
+    for s in synthetic_seniors(n, seed=7):
+        store.append(s)
+    store.close()
+
+
+def submit_problem(at) -> None:
+    at.text_input[0].input("Jane")
+    at.text_input[1].input("jane@example.com")
+    at.text_input[3].input("We are a SaaS platform for small retailers")
+    at.text_input[4].input("We don't have repeat customers")
+    at.multiselect[0].set_value(["Revenue / Sales", "Cashflow / Runway"])
+    at.multiselect[1].set_value(["Low sales experience", "Weak or unclear strategy"])
+    at.multiselect[2].set_value(["Nothing yet"])
+    at.text_area[0].input("We acquired 500 users but few come back.")
+    at.button[0].click().run()
+
+
+def timed_runs(at, n: int) -> list:
+    times = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - t0) * 1000)
+        assert not at.exception, at.exception
+    return times
+
+
+def report(label: str, times: list) -> None:
+    times = sorted(times)
+    print(f"{label:<34} max {times[-1]:8.1f} ms   "
+          f"p50 {statistics.median(times):8.1f} ms   min {times[0]:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seniors", type=int, default=20_000)
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="bench-reruns-")
+    os.environ["SENIOR_INTERN_DATA_DIR"] = directory
+    sys.path.insert(0, ROOT)
+    seed(directory, args.seniors)
+
+    from streamlit.testing.v1 import AppTest
+
+    print(f"{args.seniors:,} seniors in the store, {args.reruns} reruns per view")
+    at = AppTest.from_file(os.path.join(ROOT, "founder_app.py"), default_timeout=120)
+    t0 = time.perf_counter()
+    at.run()
+    print(f"founder_app.py first run (form):   {(time.perf_counter() - t0) * 1000:8.1f} ms")
+    report("founder_app.py form rerun", timed_runs(at, args.reruns))
+
+    t0 = time.perf_counter()
+    submit_problem(at)
+    assert not at.exception, at.exception
+    print(f"submit -> results view:            {(time.perf_counter() - t0) * 1000:8.1f} ms")
+    report("founder_app.py results rerun", timed_runs(at, args.reruns))
+
+    for page in ("app.py", "home.py"):
+        page_at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=120)
+        page_at.run()
+        report(f"{page} rerun", timed_runs(page_at, args.reruns))
+
+
+if __name__ == "__main__":
+    main()
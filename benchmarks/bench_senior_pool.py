@@ -0,0 +1,77 @@
+# benchmarks/bench_senior_pool.py — memory of list[SeniorProfile] vs SeniorPool
+#
+#   python -m benchmarks.bench_senior_pool [--sizes 100000 1000000]
+#
+# Each structure is built in its own child process and measured as peak RSS
+# minus the RSS of the same process right after imports, so the numbers
+# include allocator overhead that sys.getsizeof-style accounting misses.
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from sample_data import iter_synthetic_seniors
+from senior_pool import SeniorPool
+
+
+def peak_rss_bytes() -> int:
+    # ru_maxrss is KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def child(kind: str, n: int) -> None:
+    baseline = peak_rss_bytes()
+    t0 = time.perf_counter()
+    if kind == "dataclass":
+        held = list(iter_synthetic_seniors(n, seed=1))
+        extra = {}
+    else:
+        held = SeniorPool(iter_synthetic_seniors(n, seed=1))
+        some_id = held[n // 2].id
+        t1 = time.perf_counter()
+        held.get(some_id)
+        lookup_ms = (time.perf_counter() - t1) * 1000
+        t1 = time.perf_counter()
+        for row in range(10_000):
+            held[row % n].to_profile()
+        extra = {"lookup_ms": lookup_ms, "to_profile_us": (time.perf_counter() - t1) / 10_000 * 1e6, "buffers": held.nbytes()}
+    build_s = time.perf_counter() - t0
+    print(json.dumps({"bytes": peak_rss_bytes() - baseline, "build_s": build_s, **extra}))
+
+
+def measure(kind: str, n: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_senior_pool", "--child", kind, str(n)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child[0], int(args.child[1]))
+        return
+
+    print(f"{'seniors':>10} {'dataclass MB':>13} {'B/senior':>9} {'pool MB':>9} {'B/senior':>9} {'ratio':>6}")
+    for n in args.sizes:
+        dc = measure("dataclass", n)
+        pool = measure("pool", n)
+        print(
+            f"{n:>10,} {dc['bytes'] / 1e6:>13.1f} {dc['bytes'] / n:>9.0f} "
+            f"{pool['bytes'] / 1e6:>9.1f} {pool['bytes'] / n:>9.0f} {dc['bytes'] / pool['bytes']:>5.1f}x"
+        )
+        print(
+            f"{'':>10} pool buffers {pool['buffers'] / n:.0f} B/senior; first get() incl. index build "
+            f"{pool['lookup_ms']:.1f} ms; to_profile() {pool['to_profile_us']:.1f} us/row"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_sessions.py — memory per founder session, full objects vs ids + session cache
+#
+# Builds --sessions founder sessions' state the way the results view used
+# to keep it (the FounderProblem, its rendered AI text, the board text and
+# its stats in st.session_state) and the way it does now (session id and
+# problem id in st.session_state, the board in the process-wide
+# SessionCache), and reports traced bytes per session and the pickled size
+# of the session_state dict. Problems are in the store either way, so they
+# are created before tracing starts and not counted; each session's board
+# text is its own string, created while tracing. The board text is the
+# rule-based board's, repeated to --board-chars (a streamed Gemini board of
+# four agents runs to a few thousand characters; 0 keeps the rule text).
+#
+# Then shows the cache's bounds: capped at --max-sessions, and every
+# session dropped once it has been idle past IDLE_SECONDS (clock faked).
+#
+#   python -m benchmarks.bench_sessions [--sessions 5000] [--board-chars 3000] [--max-sessions 2000]
+
+import argparse
+import gc
+import pickle
+import tracemalloc
+import uuid
+
+from board_rules import virtual_board
+from models import build_problem_ai_text
+from sample_data import synthetic_problems
+from session_cache import IDLE_SECONDS, SessionCache
+
+
+def own(text: str) -> str:
+    """A copy of text, as each session streams its own board."""
+    return text[:-1] + text[-1]
+
+
+def traced(build) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=5_000)
+    parser.add_argument("--board-chars", type=int, default=3_000)
+    parser.add_argument("--max-sessions", type=int, default=2_000)
+    args = parser.parse_args()
+
+    problems = synthetic_problems(args.sessions, seed=51)
+    boards = [virtual_board(p) for p in problems]
+    if args.board_chars:
+        boards = [(b * (args.board_chars // len(b) + 1))[: args.board_chars] for b in boards]
+    n = len(problems)
+
+    def full_objects():
+        return [
+            {"problem": p, "problem_ai_text": build_problem_ai_text(p), "board_text": own(board),
+             "board_ttft": 0.42, "board_cached": 0}
+            for p, board in zip(problems, boards)
+        ]
+
+    def ids_only(cache):
+        states = []
+        for p, board in zip(problems, boards):
+            sid = uuid.uuid4().hex
+            states.append({"sid": sid, "problem_id": p.id})
+            cache.put(sid, "board", (own(board), 0.42, 0))
+        return states
+
+    before, before_bytes = traced(full_objects)
+    before_pickled = sum(len(pickle.dumps(s)) for s in before) / n
+    del before
+    cache = SessionCache(max_sessions=n)
+    after, after_bytes = traced(lambda: ids_only(cache))
+    after_pickled = sum(len(pickle.dumps(s)) for s in after) / n
+    print(f"{n:,} founder sessions, board text {sum(map(len, boards)) / n:.0f} chars on average")
+    print(f"{'layout':28s} {'bytes/session':>14s} {'session_state pickled':>22s}")
+    print(f"{'objects in session_state':28s} {before_bytes / n:14.0f} {before_pickled:22.0f}")
+    print(f"{'ids + session cache':28s} {after_bytes / n:14.0f} {after_pickled:22.0f}")
+
+    clock = [0.0]
+    capped = SessionCache(max_sessions=args.max_sessions, clock=lambda: clock[0])
+    capped_states, capped_bytes = traced(lambda: ids_only(capped))
+    print(f"cache capped at {args.max_sessions:,} sessions: {capped_bytes / n:.0f} bytes/session "
+          f"({capped.stats()['evicted']:,} boards evicted, regenerated on the next view)")
+    clock[0] += IDLE_SECONDS + 1
+    capped.get("a-new-session", "board")
+    print(f"after {IDLE_SECONDS / 60:.0f} idle minutes: {capped.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# benchmarks/bench_skills.py — skill resolution latency and vocabulary cardinality
+#
+# Builds a synthetic vocabulary (the built-in skills plus generated
+# multi-word terms, --terms in all) and resolves surface variants of its
+# terms: case / punctuation changes, initials, and for one-word terms
+# one-letter typos and plurals; plus text that must not resolve: a term
+# with another word added ("<term> research", a different skill) and
+# made-up words. Reports accuracy and latency per variant kind, build time
+# and index size, and which of a list of near-miss skills stay apart from
+# the built-in terms.
+#
+# Then rewrites a synthetic senior pool's skills the way people type them
+# ("GTM", "go to market", "Go-to-Market", typos) and counts distinct skill
+# strings against distinct term ids, and skill index terms built from the
+# typed text against ones built from the terms' names.
+#
+#   python -m benchmarks.bench_skills [--terms 10000] [--queries 2000] [--seniors 20000]
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from inverted_index import tokens
+from sample_data import synthetic_seniors
+from skills import BUILTIN_SKILLS, MIN_TYPO, SkillVocabulary, normalize
+
+RELATED = ["research", "tech", "ops", "design"]
+# Different skills that share a word or most letters with a built-in term.
+NEAR_MISSES = [
+    "ML ops", "Production", "Product design", "Operations research", "Engineering management",
+    "Team", "Data", "Legal tech", "Scales",
+]
+
+SYLLABLES = [c + v for c in "bcdfghjklmnprstvwz" for v in "aeiou"] + ["an", "er", "in", "on", "ul", "st", "tr", "ch"]
+
+
+def word(rng) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def synthetic_terms(n: int, rng) -> list:
+    terms = list(BUILTIN_SKILLS)
+    seen = {normalize(name) for name, _ in terms}
+    while len(terms) < n:
+        name = " ".join(word(rng) for _ in range(rng.choice([1, 2, 2, 3]))).title()
+        if normalize(name) not in seen:
+            seen.add(normalize(name))
+            terms.append((name, []))
+    return terms
+
+
+def typo(text: str, rng) -> str:
+    i = rng.randrange(1, len(text) - 1)
+    if rng.random() < 0.5:
+        return text[:i] + text[i + 1 :]                 # dropped letter
+    return text[:i - 1] + text[i] + text[i - 1] + text[i + 1 :]   # swapped pair
+
+
+def variants(name: str, rng) -> dict:
+    words = name.split()
+    out = {
+        "case": name.upper() if rng.random() < 0.5 else name.lower(),
+        "punctuation": "-".join(words) if len(words) > 1 else f" {name}. ",
+    }
+    if len(words) >= 3:
+        out["initials"] = "".join(w[0] for w in words).upper()
+    if len(words) == 1 and len(name) >= MIN_TYPO:
+        out["plural"] = name + "s"
+        out["typo"] = typo(name, rng)
+    return out
+
+
+def pct(samples: list, q: float) -> float:
+    return float(np.percentile(np.asarray(samples) * 1e6, q))
+
+
+def respell(skill: str, vocab: SkillVocabulary, rng) -> str:
+    """How a person might type a canonical skill."""
+    name, aliases = BUILTIN_SKILLS[vocab.resolve(skill)]
+    choice = rng.random()
+    if aliases and choice < 0.3:
+        return rng.choice(aliases)
+    if choice < 0.5:
+        return name.lower()
+    if choice < 0.6:
+        return name.upper()
+    if choice < 0.7 and " " not in name and len(name) >= MIN_TYPO:
+        return typo(name, rng)
+    if choice < 0.8:
+        return name.replace("-", " ")
+    return name
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=2_000, help="terms whose variants are resolved")
+    parser.add_argument("--seniors", type=int, default=20_000)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    terms = synthetic_terms(args.terms, rng)
+    t0 = time.perf_counter()
+    vocab = SkillVocabulary(terms)
+    build_s = time.perf_counter() - t0
+    print(f"{len(vocab):,} terms, {len(vocab.keys):,} keys, {len(vocab._postings):,} trigrams; "
+          f"built in {build_s * 1000:.0f} ms, postings {vocab.nbytes() / 1e6:.2f} MB")
+
+    by_kind = {}
+    for term_id in rng.sample(range(len(terms)), min(args.queries, len(terms))):
+        for kind, text in variants(terms[term_id][0], rng).items():
+            by_kind.setdefault(kind, []).append((text, term_id))
+        by_kind.setdefault("related", []).append((f"{terms[term_id][0]} {rng.choice(RELATED)}", None))
+    by_kind["unknown"] = [(f"{word(rng)}x{word(rng)}q", None) for _ in range(args.queries)]
+    print(f"{'variant':12s} {'queries':>8s} {'correct':>8s} {'p50 us':>8s} {'p99 us':>8s}")
+    for kind, queries in by_kind.items():
+        samples, correct = [], 0
+        for text, want in queries:
+            t0 = time.perf_counter()
+            got = vocab.resolve(text)
+            samples.append(time.perf_counter() - t0)
+            correct += got == want
+        print(f"{kind:12s} {len(queries):8,d} {correct / len(queries):8.1%} {pct(samples, 50):8.1f} {pct(samples, 99):8.1f}")
+
+    builtin = SkillVocabulary()
+    merged = [(text, builtin.names[i]) for text in NEAR_MISSES if (i := builtin.resolve(text)) is not None]
+    print(f"near misses kept apart from the built-in terms: {len(NEAR_MISSES) - len(merged)} of {len(NEAR_MISSES)}"
+          + "".join(f"; {text!r} -> {name!r}" for text, name in merged))
+
+    # Cardinality on a pool whose skills are typed every which way.
+    seniors = synthetic_seniors(args.seniors, seed=3)
+    typed = [[respell(s, builtin, rng) for s in senior.skills] for senior in seniors]
+    t0 = time.perf_counter()
+    canonical = [builtin.canonicalize(skills) for skills in typed]
+    per_senior_us = (time.perf_counter() - t0) / len(seniors) * 1e6
+    raw = {s.strip() for skills in typed for s in skills}
+    ids = {i for _, term_ids in canonical for i in term_ids}
+    raw_terms = {t for skills in typed for t in tokens(" ".join(skills))}
+    canon_terms = {t for _, term_ids in canonical for t in tokens(" ".join(builtin.names[i] for i in term_ids))}
+    truth = [[builtin.resolve(s) for s in senior.skills] for senior in seniors]
+    right = sum(term_ids == tuple(dict.fromkeys(want)) for (_, term_ids), want in zip(canonical, truth))
+    print(f"\n{len(seniors):,} seniors with respelled skills: {len(raw):,} distinct skill strings -> {len(ids):,} ids "
+          f"({len(raw) / len(ids):.1f}x fewer); skill index terms {len(raw_terms):,} -> {len(canon_terms):,}")
+    print(f"canonicalize: {per_senior_us:.1f} us per senior, {right / len(seniors):.1%} resolved to the intended skills")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_store.py — append throughput and cold-start load of the profile store
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_store [--records 100000] [--threads 8]
+#
+# Also checks that rows which aren't records (a `null` line, an object
+# missing required fields) are skipped on load, both when the whole log
+# parses at once and when a corrupt line sends it down the line-by-line path.
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+
+from sample_data import synthetic_problems, synthetic_seniors
+from store import ProblemStore, SeniorStore
+
+
+def bench_writes(path: str, seniors: list, n_threads: int) -> float:
+    store = SeniorStore(path)
+    chunks = [seniors[i::n_threads] for i in range(n_threads)]
+
+    def writer(chunk):
+        for s in chunk:
+            store.append(s)
+
+    threads = [threading.Thread(target=writer, args=(c,)) for c in chunks]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    store.close()  # includes the final fsync
+    return len(seniors) / (time.perf_counter() - t0)
+
+
+def bench_load(path: str) -> tuple:
+    t0 = time.perf_counter()
+    store = SeniorStore(path)
+    elapsed = time.perf_counter() - t0
+    n = len(store)
+    store.close()
+    return n, elapsed
+
+
+def check_bad_rows(tmp: str) -> None:
+    bad_rows = ["null", '{"id":"x"}', '{"id":"y","name":"no other fields"}']
+    for store_type, records in ((SeniorStore, synthetic_seniors(3, seed=2)), (ProblemStore, synthetic_problems(3, seed=2))):
+        good = [json.dumps(asdict(r), separators=(",", ":")) for r in records]
+        for extra in ([], ["{not json"]):
+            path = os.path.join(tmp, f"bad-{store_type.__name__}-{len(extra)}.jsonl")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(good[:1] + bad_rows + good[1:] + extra) + "\n")
+            store = store_type(path)
+            ids = [r.id for r in store.all()]
+            store.close()
+            assert ids == [r.id for r in records], (store_type.__name__, ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    seniors = synthetic_seniors(args.records, seed=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "seniors.jsonl")
+        rate = bench_writes(path, seniors, args.threads)
+        print(f"append: {rate:,.0f} records/s across {args.threads} threads")
+        print(f"log size: {os.path.getsize(path) / 1e6:.1f} MB")
+        n, elapsed = bench_load(path)
+        print(f"cold start: {n:,} records indexed in {elapsed:.3f} s")
+
+        logging.disable(logging.WARNING)    # the skipped rows are logged
+        try:
+            check_bad_rows(tmp)
+        finally:
+            logging.disable(logging.NOTSET)
+        print("rows that aren't records skipped on load, on both parse paths: ok")
+
+
+if __name__ == "__main__":
+    main()
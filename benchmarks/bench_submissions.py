@@ -0,0 +1,118 @@
+# benchmarks/bench_submissions.py — form submit latency, inline vs the submission queue
+#
+# 200 sessions (threads) submit founder problems at once against a seeded
+# senior pool, embedding through the offline FakeGemini. "inline" runs
+# ai_text -> embed -> board inside the submit, as a page would before
+# st.rerun(); "queued" appends to the store and hands off to SubmissionQueue.
+#
+#   python -m benchmarks.bench_submissions [--sessions 200] [--per-session 5] [--seniors 20000]
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from app_cache import StoreMatcher
+from board_rules import virtual_board
+from fake_gemini import FakeGemini
+from gemini_client import GeminiClient, background_loop, run_sync
+from jobs import SubmissionQueue
+from models import build_problem_ai_text
+from sample_data import synthetic_problems, synthetic_seniors
+from store import ProblemStore, SeniorStore
+
+
+def percentile(values: list, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def run_sessions(n_sessions: int, per_session: list, submit) -> list:
+    """Start every session together; return each submit's latency in ms."""
+    latencies = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(n_sessions)
+
+    def session(problems):
+        barrier.wait()
+        mine = []
+        for p in problems:
+            t0 = time.perf_counter()
+            submit(p)
+            mine.append((time.perf_counter() - t0) * 1000)
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=session, args=(ps,)) for ps in per_session]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies
+
+
+def report(label: str, latencies: list, wall: float) -> None:
+    print(f"{label:<26} p50 {statistics.median(latencies):9.1f} ms   p99 {percentile(latencies, 0.99):9.1f} ms   "
+          f"{len(latencies) / wall:8.0f} submits/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--per-session", type=int, default=5)
+    parser.add_argument("--seniors", type=int, default=20_000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="bench-submissions-")
+    seniors = SeniorStore(os.path.join(directory, "seniors.jsonl"))
+    for s in synthetic_seniors(args.seniors, seed=7):
+        seniors.append(s)
+    problems_store = ProblemStore(os.path.join(directory, "problems.jsonl"))
+    matcher = StoreMatcher(seniors)
+
+    problems = synthetic_problems(args.sessions * args.per_session * 2, seed=11)
+    half = len(problems) // 2
+    split = lambda ps: [ps[i :: args.sessions] for i in range(args.sessions)]
+    client = GeminiClient(FakeGemini())
+
+    print(f"{args.sessions} sessions x {args.per_session} submits, {args.seniors:,} seniors, FakeGemini embeddings")
+
+    def inline(p):
+        problems_store.append(p)
+        run_sync(client.embed(build_problem_ai_text(p)), timeout=60)
+        virtual_board(p)
+
+    t0 = time.perf_counter()
+    latencies = run_sessions(args.sessions, split(problems[:half]), inline)
+    report("inline pipeline", latencies, time.perf_counter() - t0)
+
+    embed = lambda text: asyncio.run_coroutine_threadsafe(client.embed(text), background_loop())
+    queue = SubmissionQueue(matcher=matcher.sync, embed=embed)
+
+    def queued(p):
+        problems_store.append(p)
+        queue.submit_problem(p)
+
+    t0 = time.perf_counter()
+    latencies = run_sessions(args.sessions, split(problems[half:]), queued)
+    submitted = time.perf_counter() - t0
+    report("submission queue", latencies, submitted)
+
+    ready = []
+    for p in problems[half:]:
+        job = queue.wait(p.id)
+        assert job.status == "done", job.error
+        ready.append((job.finished_at - job.submitted_at) * 1000)
+    print(f"{'  time until result ready':<26} p50 {statistics.median(ready):9.1f} ms   p99 {percentile(ready, 0.99):9.1f} ms   "
+          f"all done after {time.perf_counter() - t0:.2f}s")
+    queue.close()
+    run_sync(client.close())
+    seniors.close()
+    problems_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# benchmarks/load_test.py — many concurrent sessions through the senior and founder forms
+#
+# Each simulated session is a Streamlit AppTest: its own session state and
+# script runs, sharing the process-wide stores, matcher, submission queue
+# and Gemini client exactly like browser sessions on one server. A session
+# opens its page, fills the form with synthetic data, submits, waits for its
+# background job like the progress fragment does, then views the results
+# and reruns a few times (widget interactions). Sessions run --concurrency
+# at a time. Gemini is the offline fake (GEMINI_FAKE=1); no network needed.
+#
+# AppTest swaps process-global Streamlit state (the Runtime instance, the
+# pages manager) for the length of each script run, so script runs execute
+# one at a time under RUN_LOCK; everything between runs (background jobs,
+# Gemini calls, waiting on the queue) overlaps across sessions. On a real
+# server the GIL serialises the Python parts of script runs in much the same
+# way. Time spent waiting for the lock is reported separately as "queued".
+#
+# Reports script-run latency percentiles per phase, time from submit to results,
+# completed sessions per second, and memory per session (process RSS growth
+# with every session kept open, the pickled size of its session state, and
+# what the shared session cache holds).
+#
+#   python -m benchmarks.load_test [--sessions 200] [--concurrency 16] [--founder-share 0.7]
+
+import argparse
+import os
+import pickle
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+POLL = 0.5          # the pages' progress fragment polls every half second
+RUN_LOCK = threading.Lock()
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)      # phase -> seconds per script run
+        self.errors = []
+        self._lock = threading.Lock()
+
+    def run(self, at, phase: str):
+        queued = time.perf_counter()
+        with RUN_LOCK:
+            t0 = time.perf_counter()
+            at.run()
+            t1 = time.perf_counter()
+        with self._lock:
+            self.latencies[phase].append(t1 - t0)
+            self.latencies["queued"].append(t0 - queued)
+        if at.exception:
+            raise RuntimeError(f"{phase}: {at.exception[0].message}")
+        return at
+
+
+def wait_for_job(queue, job_id: str, timeout: float) -> float:
+    t0 = time.perf_counter()
+    deadline = t0 + timeout
+    while True:
+        job = queue.job(job_id)
+        if job is None or job.finished:
+            return time.perf_counter() - t0
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"job {job_id} still {job.status} after {timeout}s")
+        time.sleep(POLL)
+
+
+def founder_session(rec: Recorder, problem, reruns: int, timeout: float):
+    from streamlit.testing.v1 import AppTest
+
+    from jobs import get_submission_queue
+
+    at = AppTest.from_file(os.path.join(ROOT, "founder_app.py"), default_timeout=timeout)
+    rec.run(at, "form")
+    at.text_input[0].input(problem.founder_name)
+    at.text_input[1].input(problem.founder_email)
+    at.text_input[2].input(problem.company_name)
+    at.text_input[3].input(problem.company_one_liner)
+    at.text_input[4].input(problem.main_problem_one_line)
+    at.multiselect[0].set_value(problem.impact_areas)
+    at.multiselect[1].set_value(problem.why_exists)
+    at.multiselect[2].set_value(problem.what_tried)
+    at.slider[0].set_value(problem.urgency)
+    at.selectbox[0].set_value(problem.company_stage)
+    at.text_area[0].input(problem.detailed_description)
+    at.button[0].click()
+    t0 = time.perf_counter()
+    rec.run(at, "submit")
+    wait_for_job(get_submission_queue(), at.session_state["problem_id"], timeout)
+    rec.run(at, "results")      # first full view: streams the advisory board
+    to_results = time.perf_counter() - t0
+    for _ in range(reruns):
+        rec.run(at, "results rerun")
+    return at, to_results
+
+
+def senior_session(rec: Recorder, senior, reruns: int, timeout: float):
+    from streamlit.testing.v1 import AppTest
+
+    from jobs import get_submission_queue
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=timeout)
+    rec.run(at, "form")
+    for i, value in enumerate([senior.name, senior.email, senior.linkedin_url, senior.headline]):
+        at.text_input[i].input(value)
+    at.text_area[0].input(", ".join(senior.skills))
+    at.text_area[1].input(senior.intro)
+    at.multiselect[0].set_value(senior.preferred_domains)
+    at.selectbox[0].set_value(senior.preferred_startup_stage)
+    at.multiselect[1].set_value(senior.preferred_problem_types)
+    at.slider[0].set_value(senior.availability_days_per_week)
+    at.slider[1].set_value(senior.availability_hours_per_day)
+    at.button[0].click()
+    t0 = time.perf_counter()
+    rec.run(at, "submit")
+    wait_for_job(get_submission_queue(), at.session_state["profile_id"], timeout)
+    rec.run(at, "results")
+    to_results = time.perf_counter() - t0
+    for _ in range(reruns):
+        rec.run(at, "results rerun")
+    return at, to_results
+
+
+def pct(values: list, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16, help="sessions in flight at once")
+    parser.add_argument("--founder-share", type=float, default=0.7, help="fraction of sessions that are founders")
+    parser.add_argument("--reruns", type=int, default=3, help="reruns of the results view per session")
+    parser.add_argument("--seniors", type=int, default=5_000, help="seniors already in the store")
+    parser.add_argument("--latency", type=float, default=0.3, help="fake Gemini seconds per call / to first token")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="load-test-")
+    os.environ["SENIOR_INTERN_DATA_DIR"] = directory
+    os.environ["GEMINI_FAKE"] = "1"
+    os.environ["GEMINI_FAKE_LATENCY"] = str(args.latency)
+    sys.path.insert(0, ROOT)
+
+    from sample_data import synthetic_problems, synthetic_seniors
+    from store import SeniorStore
+
+    store = SeniorStore(os.path.join(directory, "seniors.jsonl"))
+    for s in synthetic_seniors(args.seniors, seed=21):
+        store.append(s)
+    store.close()
+
+    rng = random.Random(0)
+    n_founders = round(args.sessions * args.founder_share)
+    plan = [("founder", p) for p in synthetic_problems(n_founders, seed=22)]
+    plan += [("senior", s) for s in synthetic_seniors(args.sessions - n_founders, seed=23)]
+    rng.shuffle(plan)
+
+    # Warm the process-wide state (matcher, stores, client) outside the measurement.
+    rec = Recorder()
+    founder_session(rec, synthetic_problems(1, seed=24)[0], 0, args.timeout)
+    rec = Recorder()
+    baseline = rss_mb()
+
+    print(f"{args.sessions} sessions ({n_founders} founders), {args.concurrency} concurrent, "
+          f"{args.seniors:,} seniors, fake Gemini at {args.latency * 1000:.0f} ms")
+    to_results = defaultdict(list)
+    kept = []       # (kind, AppTest)
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [
+            (kind, pool.submit(founder_session if kind == "founder" else senior_session, rec, record,
+                               args.reruns, args.timeout))
+            for kind, record in plan
+        ]
+        for kind, future in futures:
+            try:
+                at, seconds = future.result()
+            except Exception as exc:
+                rec.errors.append(f"{kind}: {type(exc).__name__}: {exc}")
+                continue
+            kept.append((kind, at))
+            to_results[kind].append(seconds)
+    wall = time.perf_counter() - t0
+    grown = rss_mb() - baseline
+
+    print(f"completed {len(kept)} sessions in {wall:.1f} s: {len(kept) / wall:.1f} sessions/s, "
+          f"{len(rec.errors)} errors")
+    for error in rec.errors[:5]:
+        print("  ", error)
+    print(f"{'script run':16s} {'runs':>6s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'max ms':>8s}")
+    for phase in ("form", "submit", "results", "results rerun", "queued"):
+        v = rec.latencies[phase]
+        if v:
+            print(f"{phase:16s} {len(v):6d} {pct(v, .5):8.1f} {pct(v, .95):8.1f} {pct(v, .99):8.1f} {max(v) * 1000:8.1f}")
+    for kind, v in sorted(to_results.items()):
+        print(f"submit -> results ({kind}): p50 {statistics.median(v) * 1000:.0f} ms, p95 {pct(v, .95):.0f} ms")
+    state = defaultdict(list)
+    for kind, at in kept:
+        state[kind].append(len(pickle.dumps(at.session_state.to_dict())))
+    if kept:
+        print(f"memory per open session: {grown / len(kept) * 1000:.0f} KB RSS (harness included)")
+        for kind, sizes in sorted(state.items()):
+            print(f"session state ({kind}): {statistics.mean(sizes):.0f} bytes pickled")
+        from session_cache import get_session_cache
+
+        print(f"session cache: {get_session_cache().stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+# benchmarks/suite.py — offline regression suite for the core paths
+#
+# Generates synthetic seniors / problems at a given scale (fixed seeds) and
+# measures, without network access:
+#
+#   ai_text   build_senior_ai_text / build_problem_ai_text throughput
+#   store     JSONL append throughput (fsync included), cold load, file size
+#   index     SeniorMatcher and IVFIndex build time and memory
+#   query     top_k latency (prefiltered and exhaustive) and IVF search latency
+#
+# Every timing is the best of --repeat runs (per query, for latencies), with
+# the garbage collector paused. Compare runs from the same machine; on a
+# shared VM identical runs can still differ by 20-40%, hence the default
+# --threshold of 25%.
+# Results are a flat {metric: value} map saved as JSON together with the
+# commit and machine they came from. Metric names end in their unit, which
+# also says which direction is better (_per_s higher; _ms, _s, _mb lower).
+#
+#   python -m benchmarks.suite [--scale 10000] [--out results.json]
+#   python -m benchmarks.suite --compare benchmarks/results/<old>.json [--fail-on-regression]
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Measure the code, not the timing spans around it (read at import).
+os.environ.setdefault("SENIOR_INTERN_TIMING", "0")
+
+import numpy as np
+
+from ann_index import IVFIndex
+from matching import SeniorMatcher
+from models import build_problem_ai_text, build_senior_ai_text
+from sample_data import synthetic_problems, synthetic_seniors
+from store import SeniorStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+ANN_DIM = 768
+HIGHER_IS_BETTER = ("_per_s",)
+
+
+def percentiles(samples: list, prefix: str) -> dict:
+    ms = np.asarray(samples) * 1000
+    return {f"{prefix}_p50_ms": float(np.percentile(ms, 50)), f"{prefix}_p99_ms": float(np.percentile(ms, 99))}
+
+
+def peak_mb(build) -> tuple:
+    """(result, peak traced allocation in MB) of build(); NumPy buffers are traced too."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        return result, tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def timed(fn) -> tuple:
+    # No collections mid-measurement: they land on whichever run allocates next.
+    gc.collect()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        result = fn()
+        return result, time.perf_counter() - t0
+    finally:
+        gc.enable()
+
+
+def best_of(fn, repeat: int) -> float:
+    return min(timed(fn)[1] for _ in range(repeat))
+
+
+# ---------- Measurements ----------
+
+def bench_ai_text(seniors: list, problems: list, repeat: int) -> dict:
+    senior_s = best_of(lambda: [build_senior_ai_text(s) for s in seniors], repeat)
+    problem_s = best_of(lambda: [build_problem_ai_text(p) for p in problems], repeat)
+    return {
+        "ai_text.senior_per_s": len(seniors) / senior_s,
+        "ai_text.problem_per_s": len(problems) / problem_s,
+    }
+
+
+def bench_store(seniors: list, repeat: int) -> dict:
+    def write(path):
+        store = SeniorStore(path)
+        for s in seniors:
+            store.append(s)
+        store.close()   # final flush + fsync
+
+    def load(path):
+        store = SeniorStore(path)
+        assert len(store) == len(seniors)
+        store.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"seniors{i}.jsonl") for i in range(repeat)]
+        write_s = min(timed(lambda: write(path))[1] for path in paths)
+        gc.collect()
+        path = paths[0]
+        load_s = best_of(lambda: load(path), repeat)
+        return {
+            "store.append_per_s": len(seniors) / write_s,
+            "store.load_s": load_s,
+            "store.file_mb": os.path.getsize(path) / 1e6,
+        }
+
+
+def bench_index(seniors: list, vectors: np.ndarray, repeat: int) -> dict:
+    def build_ivf():
+        index = IVFIndex(ANN_DIM)
+        index.train(vectors)
+        index.add_seniors(seniors, vectors)
+        return index
+
+    # Memory from a traced build (tracemalloc slows it down), times from untraced ones.
+    matcher, matcher_mb = peak_mb(lambda: SeniorMatcher(seniors))
+    ivf, ivf_mb = peak_mb(build_ivf)
+    build_s = best_of(lambda: SeniorMatcher(seniors), repeat)
+    ivf_s = best_of(build_ivf, repeat)
+    return {
+        "index.matcher_build_s": build_s,
+        "index.matcher_peak_mb": matcher_mb,
+        "index.ivf_build_s": ivf_s,
+        "index.ivf_peak_mb": ivf_mb,
+    }, matcher, ivf
+
+
+def latencies(fn, items, repeat: int) -> list:
+    """Per item, the best of repeat timed calls of fn(item)."""
+    best = [float("inf")] * len(items)
+    for _ in range(repeat):
+        for i, item in enumerate(items):
+            t0 = time.perf_counter()
+            fn(item)
+            best[i] = min(best[i], time.perf_counter() - t0)
+    return best
+
+
+def bench_query(matcher: SeniorMatcher, ivf: IVFIndex, problems: list, queries: np.ndarray, repeat: int) -> dict:
+    out = {}
+    out.update(percentiles(latencies(lambda p: matcher.top_k(p, k=3), problems, repeat), "query.top_k"))
+    out.update(percentiles(
+        latencies(lambda p: matcher.top_k(p, k=3, prefilter=False), problems, repeat), "query.top_k_exhaustive"
+    ))
+    out.update(percentiles(latencies(lambda q: ivf.search(q, k=10), list(queries), repeat), "query.ivf_search"))
+    return out
+
+
+# ---------- Runs and comparisons ----------
+
+def git_commit() -> tuple:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                                    capture_output=True, text=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def run_suite(scale: int, n_queries: int, repeat: int = 5) -> dict:
+    seniors = synthetic_seniors(scale, seed=1)
+    problems = synthetic_problems(scale, seed=2)
+    rng = np.random.default_rng(3)
+    vectors = rng.standard_normal((scale, ANN_DIM)).astype(np.float32)
+    queries = rng.standard_normal((n_queries, ANN_DIM)).astype(np.float32)
+    results = {}
+
+    results.update(bench_ai_text(seniors, problems, repeat))
+    results.update(bench_store(seniors, repeat))
+    index_results, matcher, ivf = bench_index(seniors, vectors, repeat)
+    results.update(index_results)
+    results.update(bench_query(matcher, ivf, problems[:n_queries], queries, repeat))
+    if sys.platform != "win32":
+        import resource
+
+        # ru_maxrss is KiB on Linux, bytes on macOS.
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        results["process.peak_rss_mb"] = rss / (1e6 if sys.platform == "darwin" else 1e3)
+
+    commit, dirty = git_commit()
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scale": scale,
+        "queries": n_queries,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": f"{platform.system()} {platform.machine()}, {os.cpu_count()} cpu",
+        "results": results,
+    }
+
+
+def compare(old: dict, new: dict, threshold: float) -> list:
+    """Print old vs new per metric; returns the metrics that got worse by more than threshold."""
+    if (old.get("scale"), old.get("queries")) != (new["scale"], new["queries"]):
+        print(f"warning: comparing scale {old.get('scale')} / {old.get('queries')} queries "
+              f"with {new['scale']} / {new['queries']}")
+    print(f"{'metric':32s} {old['commit']:>12s} {new['commit']:>12s} {'change':>8s}")
+    regressions = []
+    for name, value in new["results"].items():
+        before = old["results"].get(name)
+        if not before:
+            print(f"{name:32s} {'-':>12s} {value:12.4g}")
+            continue
+        change = value / before - 1
+        worse = change < -threshold if name.endswith(HIGHER_IS_BETTER) else change > threshold
+        flag = "  worse" if worse else ""
+        print(f"{name:32s} {before:12.4g} {value:12.4g} {change:+8.1%}{flag}")
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite; results as JSON.")
+    parser.add_argument("--scale", type=int, default=10_000, help="seniors in the synthetic pool")
+    parser.add_argument("--queries", type=int, default=500, help="problems / vectors queried")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement; the best is kept")
+    parser.add_argument("--out", help=f"results file (default: {os.path.relpath(RESULTS_DIR, ROOT)}/<commit>.json)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative change counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if any metric regressed")
+    args = parser.parse_args()
+
+    run = run_suite(args.scale, args.queries, args.repeat)
+    out = args.out or os.path.join(RESULTS_DIR, f"{run['commit']}{'-dirty' if run['dirty'] else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(run, f, indent=2)
+        f.write("\n")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(json.load(f), run, args.threshold)
+        if regressions and args.fail_on_regression:
+            raise SystemExit(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+    else:
+        for name, value in run["results"].items():
+            print(f"{name:32s} {value:12.4g}")
+    print(f"saved {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# board_rules.py — Senior Intern • Virtual Senior Advisory Board as data
+#
+# Each agent rule fires when the founder picked a given option in one of the
+# multiselect fields. The rules are compiled once, at import, into a table
+# from option to the bits of the rules it fires, so a problem's fired rules
+# are one small integer built from dict lookups. The rendered agent lines are
+# cached per combination of fired rules, and analyze_batch() runs the same
+# path over thousands of problems at once (nightly re-analysis, backfills).
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from models import IMPACT_AREAS, WHY_EXISTS_OPTIONS, FounderProblem
+
+
+@dataclass(frozen=True)
+class BoardRule:
+    agent: str
+    field: str      # "why_exists" or "impact_areas"
+    option: str
+    text: str
+
+
+BOARD_RULES = [
+    BoardRule(
+        "Strategy", "why_exists", "Weak or unclear strategy",
+        "🧭 Strategy Agent: The root cause seems to be an unclear strategy. You may not have a sharp definition of who you serve, with what offer, and why you are different.",
+    ),
+    BoardRule(
+        "Execution", "why_exists", "Poor execution / follow-through",
+        "⚙️ Execution Agent: You’ve already tried some actions, but follow-through and consistency look weak. The problem may not be the idea, but how rigorously it’s being executed.",
+    ),
+    BoardRule(
+        "Customer", "why_exists", "Not talking enough to customers",
+        "🗣️ Customer Agent: You are likely missing deep, structured conversations with customers. Without this, it’s hard to know whether the problem is pricing, product, or positioning.",
+    ),
+    BoardRule(
+        "Sales", "why_exists", "Low sales experience",
+        "💼 Sales Agent: Sales capability appears to be a gap. You may need senior guidance on building a repeatable sales motion instead of one-off efforts.",
+    ),
+    BoardRule(
+        "Finance", "impact_areas", "Cashflow / Runway",
+        "📊 Finance Agent: Cashflow is under pressure. Any solution must protect runway while you run experiments on product or marketing.",
+    ),
+]
+
+BOARD_SUMMARY = "🤝 Board Summary: Based on your inputs, you’re facing a mix of strategy, execution, and learning issues. A senior with hands-on experience in your stage and domain can help you avoid expensive mistakes and focus on what truly moves the needle."
+
+FIELD_OPTIONS = {
+    "why_exists": WHY_EXISTS_OPTIONS,
+    "impact_areas": IMPACT_AREAS,
+}
+
+
+class BoardAnalyzer:
+    def __init__(self, rules: list = BOARD_RULES, summary: str = BOARD_SUMMARY):
+        self.rules = list(rules)
+        self.summary = summary
+        # option -> OR of the bits (bit i = rule i) of every rule it fires, so a
+        # problem's key is a handful of dict lookups however many rules there are.
+        self.option_keys = {field: {} for field in FIELD_OPTIONS}
+        for i, r in enumerate(self.rules):
+            if r.field not in FIELD_OPTIONS or r.option not in FIELD_OPTIONS[r.field]:
+                raise ValueError(f"rule for {r.agent} uses unknown {r.field} option {r.option!r}")
+            keys = self.option_keys[r.field]
+            keys[r.option] = keys.get(r.option, 0) | 1 << i
+        self._bodies = {}
+
+    def key(self, problem: FounderProblem) -> int:
+        """Bitmask of the rules that fire for one problem."""
+        key = 0
+        for field, keys in self.option_keys.items():
+            for option in getattr(problem, field):
+                key |= keys.get(option, 0)
+        return key
+
+    def fired(self, problems: list) -> np.ndarray:
+        """(n_problems, n_rules) bool matrix of which agent rules fire."""
+        # Keys are Python ints of any width; unpack them as little-endian
+        # bytes rather than through an int64, which stops at 63 rules.
+        n = len(self.rules)
+        width = (n + 7) // 8
+        packed = b"".join(self.key(p).to_bytes(width, "little") for p in problems)
+        keys = np.frombuffer(packed, dtype=np.uint8).reshape(len(problems), width)
+        return np.unpackbits(keys, axis=1, count=n, bitorder="little").astype(bool)
+
+    def _body(self, key: int) -> str:
+        """Agent lines for one combination of fired rules."""
+        body = self._bodies.get(key)
+        if body is None:
+            lines = [r.text for i, r in enumerate(self.rules) if key >> i & 1]
+            body = self._bodies[key] = "\n".join(lines or [self.summary])
+        return body
+
+    def agents(self, problem: FounderProblem) -> list:
+        """Rules that fire for one problem, in board order."""
+        key = self.key(problem)
+        return [r for i, r in enumerate(self.rules) if key >> i & 1]
+
+    def analyze(self, problem: FounderProblem) -> str:
+        return f"Main problem identified: {problem.main_problem_one_line}\n\n{self._body(self.key(problem))}"
+
+    def analyze_batch(self, problems: list) -> list:
+        """analyze() over many problems, with the per-call lookups hoisted."""
+        bodies = self._bodies
+        option_keys = list(self.option_keys.items())
+        out = []
+        for p in problems:
+            key = 0
+            for field, keys in option_keys:
+                for option in getattr(p, field):
+                    key |= keys.get(option, 0)
+            body = bodies.get(key)
+            if body is None:
+                body = self._body(key)
+            out.append(f"Main problem identified: {p.main_problem_one_line}\n\n{body}")
+        return out
+
+
+BOARD = BoardAnalyzer()
+
+
+def virtual_board(problem: FounderProblem) -> str:
+    """Virtual Senior Advisory Board analysis for one problem."""
+    return BOARD.analyze(problem)
@@ -0,0 +1,382 @@
+# bulk.py — Senior Intern • bulk import / export of seniors and problems
+#
+#   python bulk.py import seniors profiles.csv [--embed] [--chunk 10000]
+#   python bulk.py import problems problems.jsonl
+#   python bulk.py export seniors seniors.csv
+#   python bulk.py export problems -            (JSONL to stdout)
+#
+# Import streams CSV (header row, list cells separated by ";" or written as
+# a JSON array) or JSONL, validates every row against the dataclass fields
+# and the forms' option lists, and appends valid rows straight to the
+# store's JSONL log, one write + fsync per chunk under the file lock the
+# store's flusher also takes (file_lock.py). Only the ids already in
+# the log are held in memory, so memory stays flat however big the file
+# is. The app's stores read the log once per process, so a running app
+# sees imported records after a restart.
+#
+# Seniors' skills are resolved on import as on the form (skills.py): the
+# typed names are kept and skill_ids filled in. Export streams the log back out as CSV or
+# JSONL; CSV carries the form fields only.
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import uuid
+from dataclasses import MISSING, dataclass, fields
+from datetime import datetime
+
+from models import (
+    COMPANY_STAGES,
+    DOMAINS,
+    IMPACT_AREAS,
+    PROBLEM_TYPES,
+    STARTUP_STAGES,
+    WHAT_TRIED_OPTIONS,
+    WHY_EXISTS_OPTIONS,
+    FounderProblem,
+    SeniorProfile,
+    build_problem_ai_text,
+    build_senior_ai_text,
+)
+from file_lock import locked
+from store import DATA_DIR, PROBLEMS_FILE, SENIORS_FILE
+
+CHUNK = 10_000
+LIST_SEP = ";"
+SHOW_ERRORS = 20
+
+
+@dataclass(frozen=True)
+class RecordKind:
+    record_type: type
+    filename: str
+    required: tuple     # must be non-empty, as on the form
+    choices: dict       # field -> allowed values (for lists: of each item)
+    ranges: dict        # int field -> (min, max)
+    ai_text: object
+    derive: object = None   # (row, data_dir) -> None, fills the fields that have defaults
+
+    @property
+    def fields(self) -> list:
+        """(name, type) of the form fields; fields with defaults are derived, not read."""
+        return [(f.name, f.type) for f in fields(self.record_type) if f.default is MISSING]
+
+
+def senior_skills(row: dict, data_dir: str) -> None:
+    """Typed skill names and their term ids, as the senior form stores them."""
+    from skills import get_skill_vocabulary
+
+    row["skills"], row["skill_ids"] = get_skill_vocabulary(data_dir).canonicalize(row["skills"])
+    if not row["skills"]:
+        raise ValueError("skills: no skill names, only punctuation")
+
+
+KINDS = {
+    "seniors": RecordKind(
+        SeniorProfile,
+        SENIORS_FILE,
+        required=("name", "email", "linkedin_url", "headline", "skills", "intro", "preferred_domains", "preferred_problem_types"),
+        choices={
+            "preferred_domains": set(DOMAINS),
+            "preferred_startup_stage": set(STARTUP_STAGES),
+            "preferred_problem_types": set(PROBLEM_TYPES),
+        },
+        ranges={"availability_days_per_week": (1, 7), "availability_hours_per_day": (1, 8)},
+        ai_text=build_senior_ai_text,
+        derive=senior_skills,
+    ),
+    "problems": RecordKind(
+        FounderProblem,
+        PROBLEMS_FILE,
+        required=(
+            "founder_name", "founder_email", "company_one_liner", "main_problem_one_line",
+            "impact_areas", "why_exists", "what_tried", "detailed_description",
+        ),
+        choices={
+            "impact_areas": set(IMPACT_AREAS),
+            "why_exists": set(WHY_EXISTS_OPTIONS),
+            "what_tried": set(WHAT_TRIED_OPTIONS),
+            "company_stage": set(COMPANY_STAGES),
+        },
+        ranges={"urgency": (1, 10)},
+        ai_text=build_problem_ai_text,
+    ),
+}
+
+
+# ---------- Validation ----------
+
+def parse_list(value) -> list:
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    if value is None:
+        return []
+    if not isinstance(value, str):
+        raise ValueError(f"expected a list or text, got {type(value).__name__} {value!r}")
+    value = value.strip()
+    if value.startswith("["):
+        return parse_list(json.loads(value))
+    return [v.strip() for v in value.split(LIST_SEP) if v.strip()]
+
+
+def clean(kind: RecordKind, row: dict) -> dict:
+    """Row as a store-ready dict (exactly the dataclass fields), or ValueError."""
+    out = {}
+    for name, type_ in kind.fields:
+        value = row.get(name)
+        if type_ is list:
+            try:
+                value = parse_list(value)
+            except ValueError as exc:
+                raise ValueError(f"{name}: {exc}") from None
+        elif type_ is int:
+            if value in (None, ""):
+                raise ValueError(f"{name} is required")
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{name} must be an integer, got {value!r}") from None
+            lo, hi = kind.ranges.get(name, (None, None))
+            if lo is not None and not lo <= value <= hi:
+                raise ValueError(f"{name} must be between {lo} and {hi}, got {value}")
+        else:
+            value = "" if value is None else str(value).strip()
+        if not value and name in kind.required:
+            raise ValueError(f"{name} is required")
+        allowed = kind.choices.get(name)
+        if allowed is not None:
+            bad = [v for v in (value if type_ is list else [value]) if v not in allowed]
+            if bad:
+                raise ValueError(f"{name}: unknown option {bad[0]!r}")
+        out[name] = value
+    out["id"] = out["id"] or str(uuid.uuid4())
+    out["created_at"] = out["created_at"] or datetime.utcnow().isoformat()
+    return out
+
+
+# ---------- Reading / writing files ----------
+
+def open_text(path: str, mode: str):
+    if path == "-":
+        fd = sys.stdin.fileno() if "r" in mode else sys.stdout.fileno()
+        return open(fd, mode, encoding="utf-8", newline="", closefd=False)
+    # utf-8-sig: spreadsheet CSV exports often start with a BOM.
+    return open(path, mode, encoding="utf-8-sig" if "r" in mode else "utf-8", newline="")
+
+
+def file_format(path: str, given: str = None) -> str:
+    if given:
+        return given
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def read_rows(f, fmt: str):
+    """(line number, dict) per input row; unparsable JSON lines yield the error."""
+    if fmt == "csv":
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for n, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield n, exc
+            continue
+        yield n, row
+
+
+def existing_ids(path: str) -> set:
+    """Ids already in a store log, read without building any records.
+
+    Lines that don't parse or have no id are skipped, as the store skips them.
+    """
+    ids = set()
+    if not os.path.exists(path):
+        return ids
+    with open(path, "rb") as f:
+        for line in f:
+            # The store writes compact asdict() output, so lines start with
+            # {"id":"...". Anything else goes through the JSON parser.
+            if line.startswith(b'{"id":"'):
+                end = line.find(b'"', 7)
+                if end > 0 and b"\\" not in line[7:end]:
+                    ids.add(line[7:end].decode())
+                    continue
+            if not line.endswith(b"\n") or not line.strip():
+                continue
+            try:
+                ids.add(json.loads(line)["id"])
+            except (ValueError, TypeError, KeyError):
+                continue
+    return ids
+
+
+def append_lines(f, text: str) -> None:
+    """Append whole lines to a store log opened "a+b", under the file lock.
+
+    The app's flusher may be appending to the same log, so nothing already
+    there is rewritten: a torn last line (crash mid-write) is ended with a
+    leading newline instead, and the store skips it on load.
+    """
+    with locked(f):
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                text = "\n" + text
+        f.write(text.encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+# ---------- Import ----------
+
+def embed_chunk(kind: RecordKind, rows: list, data_dir: str) -> None:
+    from gemini_client import get_gemini_client, run_sync
+
+    texts = []
+    for row in rows:
+        record = object.__new__(kind.record_type)
+        record.__dict__ = row
+        texts.append(kind.ai_text(record))
+    client = get_gemini_client(data_dir)
+    run_sync(client.embed_many(texts))
+
+
+def import_records(kind_name: str, source: str, data_dir: str = DATA_DIR, fmt: str = None,
+                   chunk: int = CHUNK, embed: bool = False, strict: bool = False, log=sys.stderr) -> dict:
+    kind = KINDS[kind_name]
+    path = os.path.join(data_dir, kind.filename)
+    os.makedirs(data_dir, exist_ok=True)
+    seen = existing_ids(path)
+
+    stats = {"read": 0, "imported": 0, "duplicates": 0, "rejected": 0}
+    t0 = time.perf_counter()
+    pending = []
+
+    def commit(out) -> None:
+        append_lines(out, "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in pending))
+        if embed:
+            embed_chunk(kind, pending, data_dir)
+        stats["imported"] += len(pending)
+        pending.clear()
+
+    with open_text(source, "r") as f, open(path, "a+b") as out:
+        for line_no, row in read_rows(f, file_format(source, fmt)):
+            stats["read"] += 1
+            try:
+                if isinstance(row, Exception):
+                    raise ValueError(f"invalid JSON: {row}")
+                if not isinstance(row, dict):
+                    raise ValueError("expected a JSON object")
+                record = clean(kind, row)
+                if kind.derive is not None:
+                    kind.derive(record, data_dir)
+            except ValueError as exc:
+                stats["rejected"] += 1
+                if strict:
+                    raise SystemExit(f"{source}:{line_no}: {exc}")
+                if stats["rejected"] <= SHOW_ERRORS:
+                    print(f"{source}:{line_no}: {exc}", file=log)
+                continue
+            if record["id"] in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(record["id"])
+            pending.append(record)
+            if len(pending) >= chunk:
+                commit(out)
+        if pending:
+            commit(out)
+
+    stats["seconds"] = round(time.perf_counter() - t0, 2)
+    return stats
+
+
+# ---------- Export ----------
+
+def csv_cell(value):
+    if not isinstance(value, list):
+        return value
+    if any(LIST_SEP in v for v in value):
+        return json.dumps(value, ensure_ascii=False)
+    return LIST_SEP.join(value)
+
+
+def export_records(kind_name: str, target: str, data_dir: str = DATA_DIR, fmt: str = None) -> int:
+    kind = KINDS[kind_name]
+    path = os.path.join(data_dir, kind.filename)
+    fmt = file_format(target, fmt)
+    names = [name for name, _ in kind.fields]
+    n = 0
+    if not os.path.exists(path):
+        raise SystemExit(f"no {kind_name} store at {path}")
+    with open(path, encoding="utf-8") as f, open_text(target, "w") as out:
+        writer = None
+        if fmt == "csv":
+            writer = csv.writer(out)
+            writer.writerow(names)
+        for line in f:
+            if not line.endswith("\n") or not line.strip():
+                continue    # torn last line or blank
+            if writer is None:
+                out.write(line)
+            else:
+                row = json.loads(line)
+                writer.writerow([csv_cell(row.get(name)) for name in names])
+            n += 1
+    return n
+
+
+# ---------- CLI ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import / export of Senior Intern records.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="validate and append records from CSV or JSONL")
+    imp.add_argument("kind", choices=sorted(KINDS))
+    imp.add_argument("source", help="input file, or - for stdin")
+    imp.add_argument("--format", choices=["csv", "jsonl"], help="default: from the file extension")
+    imp.add_argument("--chunk", type=int, default=CHUNK, help="records per write + fsync")
+    imp.add_argument("--embed", action="store_true", help="embed each chunk with Gemini (GEMINI_FAKE=1 for offline)")
+    imp.add_argument("--strict", action="store_true", help="stop at the first invalid row")
+    imp.add_argument("--data-dir", default=DATA_DIR)
+
+    exp = sub.add_parser("export", help="stream stored records to CSV or JSONL")
+    exp.add_argument("kind", choices=sorted(KINDS))
+    exp.add_argument("target", help="output file, or - for stdout")
+    exp.add_argument("--format", choices=["csv", "jsonl"], help="default: from the file extension")
+    exp.add_argument("--data-dir", default=DATA_DIR)
+
+    args = parser.parse_args(argv)
+    if args.command == "import":
+        stats = import_records(
+            args.kind, args.source, data_dir=args.data_dir, fmt=args.format,
+            chunk=args.chunk, embed=args.embed, strict=args.strict,
+        )
+        rate = stats["imported"] / stats["seconds"] if stats["seconds"] else 0
+        print(
+            f"{stats['imported']:,} imported, {stats['duplicates']:,} duplicates skipped, "
+            f"{stats['rejected']:,} rejected of {stats['read']:,} rows in {stats['seconds']}s "
+            f"({rate:,.0f}/s)",
+            file=sys.stderr,
+        )
+    else:
+        try:
+            n = export_records(args.kind, args.target, data_dir=args.data_dir, fmt=args.format)
+        except BrokenPipeError:
+            # Piped into head & co., which stopped reading: not an error.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+            return
+        print(f"{n:,} {args.kind} exported", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# embedding_cache.py — Senior Intern • two-tier cache for build_ai_text embeddings
+#
+# Key: sha256 of the normalised build_ai_text output plus the model name, so
+# whitespace-only differences between reruns never cost a second call.
+#
+# Tier 1 is an in-process LRU of NumPy vectors. Tier 2 lives on disk per
+# model: <slug>.f32 is a raw float32 matrix that is memory-mapped for reads
+# and appended to on writes, and <slug>.idx maps each key to its row. Both
+# files are append-only, so a restart only re-reads the small index. The app
+# and bulk imports share them, so put() appends under a file lock after
+# reading the index lines other processes added since.
+
+import hashlib
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
+
+from file_lock import locked
+from store import DATA_DIR
+
+LRU_SIZE = 4096
+
+_SPACES = re.compile(r"[ \t]+")
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of an AI text: NFC, trimmed lines, collapsed spaces, no blank edges."""
+    text = unicodedata.normalize("NFC", text)
+    lines = [_SPACES.sub(" ", line).strip() for line in text.strip().splitlines()]
+    return "\n".join(lines)
+
+
+def cache_key(text: str, model: str) -> str:
+    h = hashlib.sha256()
+    h.update(model.encode())
+    h.update(b"\0")
+    h.update(normalize_text(text).encode())
+    return h.hexdigest()
+
+
+def _slug(model: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", model)
+
+
+class _DiskTier:
+    """Append-only float32 matrix + key -> row index for one model."""
+
+    def __init__(self, directory: str, model: str):
+        base = os.path.join(directory, _slug(model))
+        self.vectors_path = base + ".f32"
+        self.index_path = base + ".idx"
+        self.dim = None
+        self.rows = {}
+        self._offset = 0    # bytes of the index file already read
+        self._map = None
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "rb") as f, locked(f):
+                self._read_new(f)
+
+    def _read_new(self, f) -> None:
+        """Fold in the complete index lines past the offset (any process's)."""
+        f.seek(self._offset)
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].split(b"\n")
+        if self.dim is None:
+            if not lines[0].startswith(b"dim "):
+                return      # empty, or the header itself is torn
+            self.dim = int(lines[0].split()[1])
+            lines = lines[1:]
+        n_rows = 0
+        if os.path.exists(self.vectors_path):
+            n_rows = os.path.getsize(self.vectors_path) // (4 * self.dim)
+        for line in lines:
+            parts = line.split()
+            # Ignore torn lines and rows whose vector never made it to disk.
+            if len(parts) == 2 and parts[1].isdigit() and int(parts[1]) < n_rows:
+                self.rows[parts[0].decode("ascii")] = int(parts[1])
+        self._offset += end
+
+    def get(self, key: str):
+        row = self.rows.get(key)
+        if row is None:
+            return None
+        if self._map is None or row >= self._map.shape[0]:
+            # Re-map to pick up rows appended since the last mapping.
+            n_rows = os.path.getsize(self.vectors_path) // (4 * self.dim)
+            self._map = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(n_rows, self.dim))
+        return np.array(self._map[row])
+
+    def put(self, key: str, vector: np.ndarray) -> None:
+        if key in self.rows:
+            return
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        # The app and bulk imports append side by side: under the lock, read
+        # what other processes added, then take the next row.
+        with open(self.index_path, "a+b") as idx, locked(idx):
+            self._read_new(idx)
+            if key in self.rows:
+                return
+            if self.dim is None:
+                self.dim = len(vector)
+                header = f"dim {self.dim}\n".encode("ascii")
+                idx.truncate(0)
+                idx.write(header)
+                self._offset = len(header)
+            if len(vector) != self.dim:
+                raise ValueError(f"expected a {self.dim}-d vector for this model, got {len(vector)}")
+            row_bytes = 4 * self.dim
+            with open(self.vectors_path, "a+b") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size % row_bytes:
+                    # Writers hold the lock, so a partial row is a torn append
+                    # from a crash: drop it so this row stays aligned.
+                    size -= size % row_bytes
+                    f.truncate(size)
+                f.write(np.asarray(vector, dtype=np.float32).tobytes())
+            row = size // row_bytes
+            # Vector first, index line second: the index never points past the data.
+            if idx.seek(0, os.SEEK_END) > self._offset:
+                # Likewise a torn index line: its row number may be cut short.
+                idx.truncate(self._offset)
+            line = f"{key} {row}\n".encode("ascii")
+            idx.write(line)
+            idx.flush()     # before the lock is released, not at close
+            self._offset += len(line)
+        self.rows[key] = row
+
+
+class EmbeddingCache:
+    """LRU in memory, memory-mapped float32 rows on disk, with hit/miss counters."""
+
+    def __init__(self, directory: str = None, lru_size: int = LRU_SIZE):
+        self.directory = directory or os.path.join(DATA_DIR, "embeddings")
+        self.lru_size = lru_size
+        self._lru = OrderedDict()
+        self._disk = {}
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _tier(self, model: str) -> _DiskTier:
+        tier = self._disk.get(model)
+        if tier is None:
+            tier = self._disk[model] = _DiskTier(self.directory, model)
+        return tier
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._lru[key] = vector
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def get(self, text: str, model: str):
+        """Cached vector for text under model, or None."""
+        key = cache_key(text, model)
+        with self._lock:
+            vector = self._lru.get(key)
+            if vector is not None:
+                self._lru.move_to_end(key)
+                self.memory_hits += 1
+                return vector
+            vector = self._tier(model).get(key)
+            if vector is not None:
+                self._remember(key, vector)
+                self.disk_hits += 1
+                return vector
+            self.misses += 1
+            return None
+
+    def put(self, text: str, model: str, vector) -> np.ndarray:
+        key = cache_key(text, model)
+        vector = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            self._tier(model).put(key, vector)
+            self._remember(key, vector)
+        return vector
+
+    def get_or_embed(self, texts: list, model: str, embed_many) -> list:
+        """Vectors for texts, calling embed_many(list_of_texts) once for all misses.
+
+        Duplicate texts in the same batch are only sent once.
+        """
+        results = [self.get(t, model) for t in texts]
+        pending = {}
+        for i, (t, v) in enumerate(zip(texts, results)):
+            if v is None:
+                pending.setdefault(cache_key(t, model), []).append(i)
+        if pending:
+            todo = [texts[idx[0]] for idx in pending.values()]
+            for t, idx, vector in zip(todo, pending.values(), embed_many(todo)):
+                vector = self.put(t, model, vector)
+                for i in idx:
+                    results[i] = vector
+        return results
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "lru_entries": len(self._lru),
+            "disk_entries": sum(len(t.rows) for t in self._disk.values()),
+        }
+
+
+# ---------- Process-wide cache ----------
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(data_dir: str = DATA_DIR) -> EmbeddingCache:
+    """Process-wide cache for the data directory's embeddings/."""
+    directory = os.path.join(data_dir, "embeddings")
+    with _caches_lock:
+        if directory not in _caches:
+            _caches[directory] = EmbeddingCache(directory)
+        return _caches[directory]
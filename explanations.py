@@ -0,0 +1,213 @@
+# explanations.py — Senior Intern • why a senior fits: templates for every match, Gemini for the best
+#
+# Every match gets a templated reason: the senior's intro followed by one
+# sentence per matched feature (shared problem types, shared domains, stage
+# fit, the founder's impact areas); the fixed sentences are built at import.
+# That costs about a microsecond per match, so nothing is memoized (a cache
+# key costs as much as the string) and no model is involved.
+#
+# Only the top match gets a Gemini-written explanation. Requests from
+# concurrent founders queue up on the client's loop and are coalesced into
+# one numbered generateContent prompt ("[1] ...", "[2] ..."), answered one
+# line per item, like the client batches embeddings. Answers are kept in the
+# generation cache per item, so reruns don't ask again; an item missing
+# from the reply, a failed call or no Gemini at all leaves the templated
+# reason in place. The founder page starts the request before streaming the
+# board and collects it when rendering the matches, so the two overlap.
+
+import asyncio
+import re
+import threading
+import time
+
+from gemini_client import background_loop, get_gemini_client
+from generation_cache import get_generation_cache
+from instrumentation import timed
+from models import STARTUP_STAGES, FounderProblem
+
+MAX_BATCH = 16              # explanations per Gemini prompt
+MAX_WAIT = 0.05             # seconds to wait for more founders before sending a batch
+EXPLAIN_TIMEOUT = 15.0
+EXPLAIN_SCOPE = "explain"
+
+# ---------- Templated reasons ----------
+
+STAGE_SENTENCES = {
+    stage: " They are happy to help at any stage." if stage == "Any"
+    else f" They like working with companies at the {stage.lower()} stage."
+    for stage in STARTUP_STAGES
+}
+REVENUE_SENTENCE = " Given that revenue and GTM are central for you, their experience will shortcut a lot of trial-and-error."
+SATISFACTION_SENTENCE = " They have seen similar churn or satisfaction issues and know how to improve experience step by step."
+
+
+def fit_reason(problem: FounderProblem, match) -> str:
+    """Short human explanation for why a senior was matched."""
+    s = match.senior
+    reason = s.intro
+    if match.shared_problem_types:
+        reason += f" They enjoy solving {', '.join(match.shared_problem_types)} problems."
+    if match.shared_domains:
+        reason += f" They want to work in {', '.join(match.shared_domains)}."
+    if match.stage_fit:
+        reason += STAGE_SENTENCES.get(s.preferred_startup_stage, "")
+    if "Revenue / Sales" in problem.impact_areas:
+        reason += REVENUE_SENTENCE
+    if "Customer satisfaction" in problem.impact_areas:
+        reason += SATISFACTION_SENTENCE
+    return reason
+
+
+# ---------- Gemini for the top match ----------
+
+EXPLAIN_PROMPT = """You are the matchmaker of Senior Intern, which pairs startup founders with experienced senior advisors.
+For each numbered founder and senior below, write two sentences telling the founder why this senior can help with their problem. Be concrete and call the senior by their first name.
+Answer with exactly one line per item, starting with the item's number in brackets, like "[1] ...".
+
+{items}"""
+
+ANSWER_RE = re.compile(r"^\s*\[(\d+)\]\s*(.+?)\s*$", re.MULTILINE)
+
+
+def item_text(problem: FounderProblem, match) -> str:
+    """One line describing a founder / senior pair for EXPLAIN_PROMPT."""
+    s = match.senior
+    shared = ", ".join([*match.shared_problem_types, *match.shared_domains]) or "none"
+    text = (
+        f"Founder: {problem.company_one_liner} Problem: {problem.main_problem_one_line} "
+        f"{problem.detailed_description} | Senior: {s.name}, {s.headline}. {s.intro} | Shared: {shared}"
+    )
+    return " ".join(text.split())
+
+
+class ExplanationBatcher:
+    """Coalesces concurrent explanation requests into numbered Gemini prompts."""
+
+    def __init__(self, client, cache=None, max_batch: int = MAX_BATCH, max_wait: float = MAX_WAIT):
+        self.client = client
+        self.cache = get_generation_cache() if cache is None else cache
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = None
+        self._batcher = None
+        self._tasks = set()
+        self._pending = {}
+        self.batches = 0
+        self.explained = 0
+
+    def _ensure_started(self) -> None:
+        # asyncio primitives bind to the running loop, so create them lazily.
+        if self._batcher is None:
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.create_task(self._batch_loop())
+
+    async def close(self) -> None:
+        if self._batcher is not None:
+            self._batcher.cancel()
+            self._batcher = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def explain(self, problem: FounderProblem, match):
+        """Gemini's explanation for the pair, or None if the reply had none."""
+        text = item_text(problem, match)
+        cached = self.cache.get(text, self.client.generate_model, scope=EXPLAIN_SCOPE)
+        if cached is not None:
+            return cached
+        pending = self._pending.get(text)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[text] = future
+        await self._queue.put((text, future))
+        return await asyncio.shield(future)
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            task = asyncio.create_task(self._explain_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _explain_batch(self, batch: list) -> None:
+        model = self.client.generate_model
+        prompt = EXPLAIN_PROMPT.format(items="\n".join(f"[{i}] {text}" for i, (text, _) in enumerate(batch, 1)))
+        t0 = time.perf_counter()
+        try:
+            reply = await self.client.generate(prompt)
+        except Exception as exc:
+            for text, future in batch:
+                self._pending.pop(text, None)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        latency = (time.perf_counter() - t0) / len(batch)
+        self.batches += 1
+        answers = {int(n): answer for n, answer in ANSWER_RE.findall(reply)}
+        for i, (text, future) in enumerate(batch, 1):
+            answer = answers.get(i)
+            if answer:
+                self.cache.put(text, model, answer, latency=latency, scope=EXPLAIN_SCOPE)
+                self.explained += 1
+            self._pending.pop(text, None)
+            if not future.done():
+                future.set_result(answer)
+
+
+# ---------- Sync bridge for Streamlit ----------
+
+_batcher = None
+_batcher_lock = threading.Lock()
+
+
+def get_explanation_batcher() -> ExplanationBatcher:
+    """Process-wide batcher on the Gemini client (raises like get_gemini_client)."""
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = ExplanationBatcher(get_gemini_client())
+        return _batcher
+
+
+def start_top_explanation(problem: FounderProblem, matches: list):
+    """Start explaining the best of [(Match, reason), ...] on the client's loop.
+
+    Returns a concurrent Future of the text (None inside if the reply had
+    none), or None when there is nothing to explain or Gemini isn't
+    configured. Start it early and resolve it with with_top_explanation()
+    at render time, so the call overlaps whatever the page does in between.
+    """
+    if not matches:
+        return None
+    try:
+        batcher = get_explanation_batcher()
+    except (ImportError, RuntimeError):
+        # No google-generativeai or no GEMINI_API_KEY: templated reasons only.
+        return None
+    return asyncio.run_coroutine_threadsafe(batcher.explain(problem, matches[0][0]), background_loop())
+
+
+@timed("explain.top")
+def with_top_explanation(matches: list, explanation, timeout: float = EXPLAIN_TIMEOUT) -> list:
+    """[(Match, reason), ...] with the first reason replaced by the started
+    explanation, when it arrives in time with one."""
+    if explanation is None or not matches:
+        return matches
+    try:
+        text = explanation.result(timeout)
+    except Exception:
+        explanation.cancel()
+        text = None
+    top, reason = matches[0]
+    return [(top, text or reason), *matches[1:]]
@@ -0,0 +1,111 @@
+# fake_gemini.py — Senior Intern • offline stand-in for the Gemini API
+#
+# Implements the same backend interface as gemini_client.GenAIBackend
+# (async embed / generate / generate_stream) with configurable latency, a
+# requests-per-minute quota that answers with RateLimited like the real API,
+# and random transient failures. Benchmarks, load tests and local runs use it so
+# nothing needs network access or burns quota.
+
+import asyncio
+import hashlib
+import random
+import re
+import time
+from collections import deque
+from types import SimpleNamespace
+
+import numpy as np
+
+
+class RateLimited(Exception):
+    """Stand-in for google.api_core.exceptions.ResourceExhausted (HTTP 429)."""
+
+
+class Unavailable(Exception):
+    """Stand-in for google.api_core.exceptions.ServiceUnavailable (HTTP 503)."""
+
+
+def fake_vector(text: str, dim: int) -> np.ndarray:
+    """Deterministic unit vector for text."""
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+    v = np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return v / np.linalg.norm(v)
+
+
+NUMBERED_ITEM = re.compile(r"^\[(\d+)\] (.*)$", re.MULTILINE)
+
+FAKE_MODELS = [
+    SimpleNamespace(name="models/embedding-001", supported_generation_methods=["embedContent"]),
+    SimpleNamespace(name="models/text-embedding-004", supported_generation_methods=["embedContent"]),
+    SimpleNamespace(name="models/gemini-1.0-pro", supported_generation_methods=["generateContent", "countTokens"]),
+    SimpleNamespace(name="models/gemini-1.5-flash", supported_generation_methods=["generateContent", "countTokens"]),
+]
+
+
+class FakeGemini:
+    def __init__(
+        self,
+        latency: float = 0.05,
+        per_item_latency: float = 0.0005,
+        token_latency: float = 0.02,
+        dim: int = 768,
+        rpm_limit: int = None,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.per_item_latency = per_item_latency
+        self.token_latency = token_latency
+        self.dim = dim
+        self.rpm_limit = rpm_limit
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self._recent = deque()
+        self.calls = 0
+        self.items = 0
+        self.rejected = 0
+
+    def _admit(self) -> None:
+        self.calls += 1
+        now = time.monotonic()
+        if self.rpm_limit is not None:
+            while self._recent and now - self._recent[0] > 60:
+                self._recent.popleft()
+            if len(self._recent) >= self.rpm_limit:
+                self.rejected += 1
+                raise RateLimited("429 Resource has been exhausted (e.g. check quota).")
+            self._recent.append(now)
+        if self.failure_rate and self._rng.random() < self.failure_rate:
+            self.rejected += 1
+            raise Unavailable("503 The service is currently unavailable.")
+
+    def list_models(self, latency: float = None) -> list:
+        """Synchronous, like genai.list_models()."""
+        self._admit()
+        time.sleep(self.latency if latency is None else latency)
+        return list(FAKE_MODELS)
+
+    async def embed(self, texts: list, model: str) -> list:
+        self._admit()
+        self.items += len(texts)
+        await asyncio.sleep(self.latency + self.per_item_latency * len(texts))
+        return [fake_vector(t, self.dim) for t in texts]
+
+    async def generate(self, prompt: str, model: str) -> str:
+        self._admit()
+        self.items += 1
+        await asyncio.sleep(self.latency)
+        items = NUMBERED_ITEM.findall(prompt)
+        if items:
+            # Batched prompts ("[1] ...", "[2] ...") get one answer line per item.
+            return "\n".join(f"[{n}] [{model}] Fake explanation for: {text[:80]}" for n, text in items)
+        first_line = next((line for line in prompt.splitlines() if line.strip()), "")
+        return f"[{model}] Fake analysis for: {first_line.strip()}"
+
+    async def generate_stream(self, prompt: str, model: str):
+        """generate()'s text word by word: the first after `latency`, then one per `token_latency`."""
+        text = await self.generate(prompt, model)
+        for i, word in enumerate(text.split(" ")):
+            if i:
+                await asyncio.sleep(self.token_latency)
+            yield word if i == 0 else " " + word
@@ -0,0 +1,47 @@
+# file_lock.py — Senior Intern • exclusive locks on data files shared between processes
+#
+# The app and the bulk CLI run side by side against the same DATA_DIR, so a
+# read-then-append on a shared file (the skill vocabulary, the embedding
+# cache, the profile logs) takes an exclusive lock on it first. fcntl.flock
+# on POSIX, msvcrt.locking on Windows: both are advisory between processes
+# that use this helper, and both are per open file, so threads of one
+# process that open the file separately also wait for each other.
+
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+    import msvcrt
+
+RETRY_SECONDS = 0.01
+
+
+@contextmanager
+def locked(f):
+    """Hold an exclusive lock on the open file f for the duration of the block."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield f
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return
+    # msvcrt locks a byte range from the current position: use the first byte.
+    position = f.tell()
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            break
+        except OSError:
+            time.sleep(RETRY_SECONDS)
+    f.seek(position)
+    try:
+        yield f
+    finally:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        f.seek(position)
@@ -1,8 +1,24 @@
 import streamlit as st
-from dataclasses import dataclass, asdict
+from dataclasses import asdict
 from datetime import datetime
 import uuid
 
+from advisory_board import start_advisory_stream
+from app_cache import hybrid_matches, problem_analysis
+from explanations import start_top_explanation, with_top_explanation
+from instrumentation import span, timing_panel
+from jobs import get_submission_queue
+from models import (
+    COMPANY_STAGES,
+    IMPACT_AREAS,
+    WHAT_TRIED_OPTIONS,
+    WHY_EXISTS_OPTIONS,
+    FounderProblem,
+    build_problem_ai_text,
+)
+from session_cache import get_session_cache
+from store import get_problem_store
+
 # ---------- Page setup ----------
 
 st.set_page_config(
@@ -46,63 +62,31 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# ---------- Data model ----------
-
-@dataclass
-class FounderProblem:
-    id: str
-    founder_name: str
-    founder_email: str
-    company_name: str
-    company_one_liner: str
-    main_problem_one_line: str
-    impact_areas: list
-    why_exists: list
-    what_tried: list
-    urgency: int
-    company_stage: str
-    detailed_description: str
-    created_at: str
-
-
-def build_ai_text(p: FounderProblem) -> str:
-    return f"""
-Startup problem:
-
-Founder: {p.founder_name} ({p.founder_email})
-Company: {p.company_name}
-One-liner: {p.company_one_liner}
-
-Main problem (one line):
-{p.main_problem_one_line}
-
-Impact areas: {", ".join(p.impact_areas)}
-
-Why the founder thinks this problem exists:
-{", ".join(p.why_exists)}
-
-What they have tried so far:
-{", ".join(p.what_tried)}
+# ---------- Session state ----------
+# Ids only: the problem is in the problem store and the streamed board
+# analysis in the process-wide session cache (see session_cache).
 
-Urgency (1-10): {p.urgency}
-Company stage: {p.company_stage}
+if "sid" not in st.session_state:
+    st.session_state.sid = uuid.uuid4().hex
+if "problem_id" not in st.session_state:
+    st.session_state.problem_id = None
+sessions = get_session_cache()
+p = get_problem_store().get(st.session_state.problem_id)
 
-Detailed description:
-{p.detailed_description}
-"""
 
-# ---------- Session state ----------
+@st.fragment(run_every=0.5)
+def show_job_progress(job_id: str):
+    job = get_submission_queue().job(job_id)
+    if job is None or job.finished:
+        st.rerun()
+    st.info(f"⏳ {job.label}…")
 
-if "problem" not in st.session_state:
-    st.session_state.problem = None
-if "problem_ai_text" not in st.session_state:
-    st.session_state.problem_ai_text = ""
 
 # ==========================================================
 # VIEW 1: FORM – FOUNDER DESCRIBES PROBLEM
 # ==========================================================
 
-if st.session_state.problem is None:
+if p is None:
     st.markdown(
         '<div class="main-title">Describe Your Startup Problem</div>',
         unsafe_allow_html=True,
@@ -128,48 +112,17 @@ if st.session_state.problem is None:
 
         impact_areas = st.multiselect(
             "Where is this problem hurting you the most? *",
-            options=[
-                "Revenue / Sales",
-                "Growth / New customers",
-                "Customer satisfaction",
-                "Operations / Delivery",
-                "Team clarity / morale",
-                "Cashflow / Runway",
-                "Other"
-            ],
+            options=IMPACT_AREAS,
         )
 
         why_exists = st.multiselect(
             "Why do you think this problem exists? (be honest) *",
-            options=[
-                "Lack of experience in this area",
-                "Limited budget",
-                "Weak or unclear strategy",
-                "Poor execution / follow-through",
-                "No mentor / guidance",
-                "Team too junior",
-                "Wrong product positioning",
-                "Not talking enough to customers",
-                "Low sales experience",
-                "Market might not be right",
-                "I am not sure",
-                "Other"
-            ],
+            options=WHY_EXISTS_OPTIONS,
         )
 
         what_tried = st.multiselect(
             "What have you already tried so far? *",
-            options=[
-                "Paid ads / performance marketing",
-                "Content or social media marketing",
-                "Discounts / offers",
-                "Changing pricing",
-                "Hiring new people",
-                "Talking to customers",
-                "Changing the product",
-                "Nothing yet",
-                "Other"
-            ],
+            options=WHAT_TRIED_OPTIONS,
         )
 
         urgency = st.slider(
@@ -181,7 +134,7 @@ if st.session_state.problem is None:
 
         company_stage = st.selectbox(
             "What stage is your startup at? *",
-            ["Idea", "Prototype", "MVP", "Early revenue", "Scaling"]
+            COMPANY_STAGES
         )
 
         detailed_description = st.text_area(
@@ -221,8 +174,9 @@ if st.session_state.problem is None:
                 created_at=datetime.utcnow().isoformat(),
             )
 
-            st.session_state.problem = problem
-            st.session_state.problem_ai_text = build_ai_text(problem)
+            get_problem_store().append(problem)
+            get_submission_queue().submit_problem(problem)
+            st.session_state.problem_id = problem.id
             st.rerun()
 
 # ==========================================================
@@ -230,67 +184,22 @@ if st.session_state.problem is None:
 # ==========================================================
 
 else:
-    p: FounderProblem = st.session_state.problem
-
-    # --- Mock senior “database” ---
-    mock_seniors = [
-        {
-            "name": "Anita Rao",
-            "headline": "Ex-COO, 25+ yrs in Retail & Operations",
-            "strengths": ["Operations & Execution", "Turnaround / Crisis", "People & Culture"],
-            "fit_reason": "She has led multiple retail turnarounds where repeat customers and store-level execution were the main issues.",
-        },
-        {
-            "name": "Vikram Mehta",
-            "headline": "Ex-CPO, B2B SaaS & Product Strategy",
-            "strengths": ["Product & UX", "Strategy & Direction", "Growth / New customers"],
-            "fit_reason": "He’s scaled SaaS products from MVP to thousands of paying customers and knows how to fix retention and positioning problems.",
-        },
-        {
-            "name": "Sara Al Mansoori",
-            "headline": "Ex-CFO, 20+ yrs in Finance & Unit Economics",
-            "strengths": ["Finance & Unit Economics", "Cashflow / Runway"],
-            "fit_reason": "She is ideal when pricing, margins, or runway are the hidden reason behind a growth or retention issue.",
-        },
-    ]
-
-    # --- Mock Virtual Advisory Board reasoning ---
-    def mock_virtual_board(problem: FounderProblem) -> str:
-        lines = []
-        lines.append(f"Main problem identified: {problem.main_problem_one_line}")
-        lines.append("")
-
-        if "Weak or unclear strategy" in problem.why_exists:
-            lines.append("🧭 Strategy Agent: The root cause seems to be an unclear strategy. You may not have a sharp definition of who you serve, with what offer, and why you are different.")
-        if "Poor execution / follow-through" in problem.why_exists:
-            lines.append("⚙️ Execution Agent: You’ve already tried some actions, but follow-through and consistency look weak. The problem may not be the idea, but how rigorously it’s being executed.")
-        if "Not talking enough to customers" in problem.why_exists:
-            lines.append("🗣️ Customer Agent: You are likely missing deep, structured conversations with customers. Without this, it’s hard to know whether the problem is pricing, product, or positioning.")
-        if "Low sales experience" in problem.why_exists:
-            lines.append("💼 Sales Agent: Sales capability appears to be a gap. You may need senior guidance on building a repeatable sales motion instead of one-off efforts.")
-        if "Cashflow / Runway" in problem.impact_areas:
-            lines.append("📊 Finance Agent: Cashflow is under pressure. Any solution must protect runway while you run experiments on product or marketing.")
-
-        if len(lines) <= 2:
-            lines.append("🤝 Board Summary: Based on your inputs, you’re facing a mix of strategy, execution, and learning issues. A senior with hands-on experience in your stage and domain can help you avoid expensive mistakes and focus on what truly moves the needle.")
-
-        return "\n".join(lines)
-
-    advisory_text = mock_virtual_board(p)
-
-    # --- Mock matching logic ---
-    def mock_match_seniors(problem: FounderProblem, seniors: list):
-        matches = []
-        for s in seniors:
-            match = s.copy()
-            if "Revenue / Sales" in problem.impact_areas:
-                match["fit_reason"] += " Given that revenue and GTM are central for you, their experience will shortcut a lot of trial-and-error."
-            if "Customer satisfaction" in problem.impact_areas:
-                match["fit_reason"] += " They have seen similar churn or satisfaction issues and know how to improve experience step by step."
-            matches.append(match)
-        return matches[:3]
-
-    matched_seniors = mock_match_seniors(p, mock_seniors)
+    # --- Virtual Advisory Board (run by the submission queue, see jobs) + matching ---
+    job = get_submission_queue().job(p.id)
+    if job is not None and not job.finished:
+        show_job_progress(job.id)
+        st.stop()
+    if job is not None and job.status == "done":
+        advisory_text = job.result["advisory_text"]
+    else:
+        # Failed, or too old to still be in the queue's history.
+        advisory_text = problem_analysis(p)["advisory_text"]
+    # Ranked with the founder's own words and the pool as it is now (see
+    # hybrid); the categorical top-k only if that finds no one.
+    matched_seniors = hybrid_matches(p) or problem_analysis(p)["matches"]
+    # Templated reasons throughout; Gemini writes only the best match's,
+    # while the board streams.
+    explanation = start_top_explanation(p, matched_seniors)
 
     # ---------- UI ----------
 
@@ -309,15 +218,31 @@ else:
     )
 
     st.write("")
-    st.subheader("🧠 Virtual Senior Advisory Board – Mock Analysis")
-    st.write(advisory_text)
+    st.subheader("🧠 Virtual Senior Advisory Board")
+    # (text, seconds to first token, agents answered from cache) once streamed
+    board = sessions.get(st.session_state.sid, "board")
+    stream = None if board else start_advisory_stream(p)
+    if stream is None:
+        st.write(board[0] if board else advisory_text)
+    else:
+        # Agents generate concurrently; each renders as soon as the one above is done.
+        heading = f"Main problem identified: {p.main_problem_one_line}"
+        st.write(heading)
+        try:
+            with span("render.board_stream"):
+                sections = [st.write_stream(stream.section(i)) for i in range(len(stream))]
+        finally:
+            stream.cancel()
+        board = ("\n\n".join([heading, *sections]), stream.first_token, stream.cached)
+        sessions.put(st.session_state.sid, "board", board)
 
     st.subheader("👥 Suggested Senior Interns (Demo)")
-    for s in matched_seniors:
+    for m, reason in with_top_explanation(matched_seniors, explanation):
+        s = m.senior
         with st.container(border=True):
-            st.markdown(f"**{s['name']}** – {s['headline']}")
-            st.markdown(f"**Key strengths:** {', '.join(s['strengths'])}")
-            st.markdown(f"**Why they’re a fit for you:** {s['fit_reason']}")
+            st.markdown(f"**{s.name}** – {s.headline}")
+            st.markdown(f"**Key strengths:** {', '.join(s.preferred_problem_types)}")
+            st.markdown(f"**Why they’re a fit for you:** {reason}")
 
     st.write("")
     with st.expander("🔍 Developer View: Structured Problem (for judges)"):
@@ -325,13 +250,21 @@ else:
         st.json(asdict(p))
 
         st.subheader("Text we would send to Gemini (when quota is available)")
-        st.code(st.session_state.problem_ai_text.strip(), language="markdown")
-        st.caption(
-            "For the hackathon demo, the analysis above is mock logic. In production, this will be replaced with Gemini + Qdrant powered reasoning and matching."
-        )
+        st.code(build_problem_ai_text(p).strip(), language="markdown")
+        if board is not None and board[1] is not None:
+            st.caption(
+                f"Board analysis streamed from Gemini, one prompt per agent; first token after {board[1] * 1000:.0f} ms, "
+                f"{board[2]} agent(s) answered from the generation cache."
+            )
+        else:
+            st.caption(
+                "Without a Gemini key the board analysis above is the rule-based mock."
+            )
+
+        timing_panel()
 
     st.write("")
     if st.button("⬅️ Describe another problem"):
-        st.session_state.problem = None
-        st.session_state.problem_ai_text = ""
+        st.session_state.problem_id = None
+        sessions.clear_session(st.session_state.sid)
         st.rerun()
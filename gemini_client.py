@@ -0,0 +1,379 @@
+# gemini_client.py — Senior Intern • batched, rate-limited async Gemini client
+#
+# Callers await embed(text) / generate(prompt) one payload at a time, or
+# iterate generate_stream(prompt) to render a response as it arrives. Behind
+# that, embedding requests queue up and are coalesced into batch calls,
+# identical pending payloads share one request, every API call waits on a
+# token bucket sized to the project's quota, transient errors (429 / 503 /
+# timeouts) are retried with full-jitter exponential backoff, and a
+# semaphore bounds how many calls are in flight at once.
+#
+# The backend is pluggable: GenAIBackend talks to google.generativeai,
+# fake_gemini.FakeGemini runs everything offline.
+
+import asyncio
+import atexit
+import os
+import random
+import threading
+import time
+
+import numpy as np
+
+from instrumentation import observe, timed
+from store import DATA_DIR
+
+# Defaults for the offline fake; real clients resolve models via model_resolver.
+EMBED_MODEL = "models/text-embedding-004"
+GENERATE_MODEL = "models/gemini-1.5-flash"
+
+MAX_BATCH = 100           # batchEmbedContents accepts up to 100 texts
+MAX_WAIT = 0.02           # seconds to wait for more texts before sending a batch
+MAX_IN_FLIGHT = 8
+REQUESTS_PER_MINUTE = 1500
+BURST = 20
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 20.0
+
+RETRYABLE = {
+    "ResourceExhausted",
+    "TooManyRequests",
+    "ServiceUnavailable",
+    "DeadlineExceeded",
+    "InternalServerError",
+    "RateLimited",
+    "Unavailable",
+    "TimeoutError",
+}
+
+
+def is_retryable(exc: BaseException) -> bool:
+    # Match on class names so we don't need google.api_core installed to
+    # classify errors (and so the fake's exceptions are treated the same).
+    return any(cls.__name__ in RETRYABLE for cls in type(exc).__mro__)
+
+
+class GenAIBackend:
+    """google.generativeai behind the async embed / generate interface."""
+
+    def __init__(self, api_key: str = None):
+        import google.generativeai as genai
+
+        if api_key is None:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise RuntimeError("GEMINI_API_KEY is not set in .env")
+        genai.configure(api_key=api_key)
+        self._genai = genai
+        self._models = {}
+
+    async def embed(self, texts: list, model: str) -> list:
+        result = await asyncio.to_thread(
+            self._genai.embed_content, model=model, content=texts, task_type="retrieval_document"
+        )
+        return result["embedding"]
+
+    def _model(self, model: str):
+        if model not in self._models:
+            self._models[model] = self._genai.GenerativeModel(model)
+        return self._models[model]
+
+    async def generate(self, prompt: str, model: str) -> str:
+        response = await self._model(model).generate_content_async(prompt)
+        return response.text
+
+    async def generate_stream(self, prompt: str, model: str):
+        response = await self._model(model).generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            yield chunk.text
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, bursting up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.waited = 0.0
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return
+            delay = (tokens - self.tokens) / self.rate
+            self.waited += delay
+            await asyncio.sleep(delay)
+
+
+class GeminiClient:
+    def __init__(
+        self,
+        backend,
+        embed_model: str = EMBED_MODEL,
+        generate_model: str = GENERATE_MODEL,
+        max_batch: int = MAX_BATCH,
+        max_wait: float = MAX_WAIT,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        requests_per_minute: float = REQUESTS_PER_MINUTE,
+        burst: float = BURST,
+        max_retries: int = MAX_RETRIES,
+        cache=None,
+    ):
+        self.backend = backend
+        self.embed_model = embed_model
+        self.generate_model = generate_model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.bucket = TokenBucket(requests_per_minute / 60.0, burst)
+        self.cache = cache
+
+        self._queue = None
+        self._semaphore = None
+        self._batcher = None
+        self._tasks = set()
+        self._pending_embeds = {}
+        self._pending_generations = {}
+
+        self.requests = 0
+        self.retries = 0
+        self.embedded = 0
+        self.generated = 0
+
+    # ---------- Lifecycle ----------
+
+    def _ensure_started(self) -> None:
+        # asyncio primitives bind to the running loop, so create them lazily.
+        if self._batcher is None:
+            self._queue = asyncio.Queue()
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._batcher = asyncio.create_task(self._batch_loop())
+
+    async def close(self) -> None:
+        if self._batcher is not None:
+            self._batcher.cancel()
+            self._batcher = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    # ---------- Public API ----------
+
+    @timed("gemini.embed")
+    async def embed(self, text: str) -> np.ndarray:
+        if self.cache is not None:
+            vector = self.cache.get(text, self.embed_model)
+            if vector is not None:
+                return vector
+        pending = self._pending_embeds.get(text)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        self._pending_embeds[text] = future
+        await self._queue.put((text, future))
+        return await asyncio.shield(future)
+
+    async def embed_many(self, texts: list) -> list:
+        return list(await asyncio.gather(*(self.embed(t) for t in texts)))
+
+    @timed("gemini.generate")
+    async def generate(self, prompt: str) -> str:
+        # Gemini takes one prompt per generateContent request, so generation
+        # is coalesced by sharing identical in-flight prompts, not by batching.
+        pending = self._pending_generations.get(prompt)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        self._ensure_started()
+        task = asyncio.ensure_future(self._generate_once(prompt))
+        self._pending_generations[prompt] = task
+        task.add_done_callback(lambda _: self._pending_generations.pop(prompt, None))
+        return await asyncio.shield(task)
+
+    async def generate_stream(self, prompt: str):
+        """Yield the response to prompt in chunks, as the model produces them.
+
+        Not coalesced with identical prompts: each caller renders its own
+        stream. Retried like generate() until the first chunk arrives, and
+        holds an in-flight slot only until then: the rest of the stream is
+        paced by the caller, and a slow reader mustn't starve other calls.
+        """
+        self._ensure_started()
+        t0 = time.perf_counter()
+        await self._semaphore.acquire()
+        holding = True
+        try:
+            attempt = 0
+            while True:
+                await self.bucket.acquire()
+                self.requests += 1
+                started = False
+                try:
+                    async for chunk in self.backend.generate_stream(prompt, self.generate_model):
+                        if not started:
+                            observe("gemini.first_token", time.perf_counter() - t0)
+                            started = True
+                            self._semaphore.release()
+                            holding = False
+                        yield chunk
+                    break
+                except Exception as exc:
+                    if started:
+                        raise
+                    await self._backoff(attempt, exc)
+                    attempt += 1
+        finally:
+            if holding:
+                self._semaphore.release()
+        self.generated += 1
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "embedded": self.embedded,
+            "generated": self.generated,
+            "throttle_wait_total_s": round(self.bucket.waited, 3),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+    # ---------- Internals ----------
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Waiting for a slot here is the back-pressure: while every slot
+            # is busy the queue keeps filling, so the next batch is bigger.
+            await self._semaphore.acquire()
+            task = asyncio.create_task(self._embed_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _embed_batch(self, batch: list) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            vectors = await self._call(self.backend.embed, texts, self.embed_model)
+            if len(vectors) != len(texts):
+                # Can't tell which text a vector belongs to, so fail them all
+                # rather than leave the unpaired callers waiting forever.
+                raise RuntimeError(f"embedding backend returned {len(vectors)} vectors for {len(texts)} texts")
+        except Exception as exc:
+            self._fail_embeds(batch, exc)
+            return
+        finally:
+            self._semaphore.release()
+        self.embedded += len(texts)
+        try:
+            for (text, future), vector in zip(batch, vectors):
+                vector = np.asarray(vector, dtype=np.float32)
+                if self.cache is not None:
+                    self.cache.put(text, self.embed_model, vector)
+                self._pending_embeds.pop(text, None)
+                if not future.done():
+                    future.set_result(vector)
+        except Exception as exc:
+            self._fail_embeds(batch, exc)
+
+    def _fail_embeds(self, batch: list, exc: BaseException) -> None:
+        for text, future in batch:
+            self._pending_embeds.pop(text, None)
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _generate_once(self, prompt: str) -> str:
+        async with self._semaphore:
+            text = await self._call(self.backend.generate, prompt, self.generate_model)
+        self.generated += 1
+        return text
+
+    @timed("gemini.request")
+    async def _call(self, fn, *args):
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            self.requests += 1
+            try:
+                return await fn(*args)
+            except Exception as exc:
+                await self._backoff(attempt, exc)
+                attempt += 1
+
+    async def _backoff(self, attempt: int, exc: Exception) -> None:
+        """Sleep before retry number attempt + 1, or re-raise exc if it is not worth one."""
+        if attempt >= self.max_retries or not is_retryable(exc):
+            raise exc
+        # Full jitter: uniform in [0, min(cap, base * 2^attempt)].
+        delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+        self.retries += 1
+        await asyncio.sleep(delay)
+
+
+# ---------- Sync bridge for Streamlit ----------
+
+# Streamlit scripts are synchronous and rerun on every interaction, so the
+# client lives on one background event loop per process and page code
+# submits coroutines to it.
+_loop = None
+_clients = {}
+_lock = threading.Lock()
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="gemini-loop", daemon=True).start()
+        return _loop
+
+
+def run_sync(coro, timeout: float = None):
+    """Run a coroutine on the background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, background_loop()).result(timeout)
+
+
+def get_gemini_client(data_dir: str = DATA_DIR) -> GeminiClient:
+    """Process-wide client caching embeddings under data_dir. Set
+    GEMINI_FAKE=1 to use the offline stand-in (GEMINI_FAKE_LATENCY=seconds
+    per call, default 0.05)."""
+    with _lock:
+        client = _clients.get(data_dir)
+        if client is None:
+            from embedding_cache import get_embedding_cache
+
+            if os.getenv("GEMINI_FAKE"):
+                from fake_gemini import FakeGemini
+
+                backend = FakeGemini(latency=float(os.getenv("GEMINI_FAKE_LATENCY", 0.05)))
+                models = {}
+            else:
+                from model_resolver import resolve_model
+
+                backend = GenAIBackend()
+                models = {"embed_model": resolve_model("embed"), "generate_model": resolve_model("generate")}
+            client = _clients[data_dir] = GeminiClient(backend, cache=get_embedding_cache(data_dir), **models)
+            atexit.register(lambda: run_sync(client.close(), timeout=5))
+        return client
@@ -0,0 +1,184 @@
+# generation_cache.py — Senior Intern • cache of Gemini generations for repeat situations
+#
+# Many founders describe near-identical problems, and the board's answer to
+# a situation doesn't change from one founder to the next. Generations are
+# cached two ways:
+#
+#   * exact: key is sha256 of the model plus the normalised prompt (as in
+#     embedding_cache), so whitespace-only differences still hit;
+#   * semantic (optional): the caller passes the problem's embedding, and a
+#     cached generation from the same scope (e.g. the same board agent) whose
+#     embedding has cosine similarity >= threshold is returned. threshold=None
+#     turns this off.
+#
+# Entries expire after ttl seconds and the cache holds at most max_entries,
+# evicting the least recently used. stats() reports the hit rate plus the
+# requests and generation seconds that hits saved.
+
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from embedding_cache import cache_key
+
+MAX_ENTRIES = 2048
+TTL = 24 * 3600.0
+SEMANTIC_THRESHOLD = 0.95
+
+
+class _Entry:
+    __slots__ = ("text", "created", "latency", "scope", "slot")
+
+    def __init__(self, text: str, created: float, latency: float, scope, slot):
+        self.text = text
+        self.created = created
+        self.latency = latency      # seconds the generation took: what a hit saves
+        self.scope = scope
+        self.slot = slot
+
+
+class _ScopeVectors:
+    """Unit vectors of one scope's entries, one row per slot; free rows are zero."""
+
+    def __init__(self, dim: int):
+        self.matrix = np.zeros((16, dim), dtype=np.float32)
+        self.keys = []
+        self.free = []
+
+    def add(self, key: str, vector: np.ndarray) -> int:
+        if self.free:
+            slot = self.free.pop()
+            self.keys[slot] = key
+        else:
+            slot = len(self.keys)
+            self.keys.append(key)
+            if slot == len(self.matrix):
+                self.matrix = np.concatenate([self.matrix, np.zeros_like(self.matrix)])
+        self.matrix[slot] = vector
+        return slot
+
+    def remove(self, slot: int) -> None:
+        self.matrix[slot] = 0
+        self.keys[slot] = None
+        self.free.append(slot)
+
+    def ranked(self, vector: np.ndarray, threshold: float):
+        """Keys at or above threshold similarity, most similar first."""
+        sims = self.matrix[: len(self.keys)] @ vector
+        for slot in np.flatnonzero(sims >= threshold)[np.argsort(-sims[sims >= threshold], kind="stable")]:
+            yield self.keys[slot]
+
+
+def _unit(vector) -> np.ndarray:
+    v = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(v)
+    return v / norm if norm else v
+
+
+class GenerationCache:
+    """LRU + TTL cache of generated text, with optional embedding-similarity lookup."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl: float = TTL,
+                 threshold: float = SEMANTIC_THRESHOLD, clock=time.time):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.threshold = threshold
+        self.clock = clock
+        self._entries = OrderedDict()   # key -> _Entry, least recently used first
+        self._vectors = {}              # (model, scope) -> _ScopeVectors
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        self.saved_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        if entry.slot is not None:
+            self._vectors[entry.scope].remove(entry.slot)
+
+    def _live(self, key: str, now: float):
+        entry = self._entries.get(key)
+        if entry is not None and now - entry.created > self.ttl:
+            self._drop(key)
+            self.expired += 1
+            return None
+        return entry
+
+    def _hit(self, key: str, entry: _Entry) -> str:
+        self._entries.move_to_end(key)
+        self.saved_seconds += entry.latency
+        return entry.text
+
+    def get(self, prompt: str, model: str, scope: str = None, vector=None):
+        """Cached text for prompt, or for a similar vector within scope; None on a miss."""
+        key = cache_key(prompt, model)
+        with self._lock:
+            now = self.clock()
+            entry = self._live(key, now)
+            if entry is not None:
+                self.exact_hits += 1
+                return self._hit(key, entry)
+            vectors = self._vectors.get((model, scope))
+            if vector is not None and vectors is not None and self.threshold is not None:
+                for similar in list(vectors.ranked(_unit(vector), self.threshold)):
+                    entry = self._live(similar, now)
+                    if entry is not None:
+                        self.semantic_hits += 1
+                        return self._hit(similar, entry)
+            self.misses += 1
+            return None
+
+    def put(self, prompt: str, model: str, text: str, latency: float = 0.0,
+            scope: str = None, vector=None) -> None:
+        key = cache_key(prompt, model)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            slot = None
+            if vector is not None:
+                vector = _unit(vector)
+                vectors = self._vectors.get((model, scope))
+                if vectors is None:
+                    vectors = self._vectors[(model, scope)] = _ScopeVectors(len(vector))
+                slot = vectors.add(key, vector)
+            self._entries[key] = _Entry(text, self.clock(), latency, (model, scope), slot)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evicted += 1
+
+    def stats(self) -> dict:
+        hits = self.exact_hits + self.semantic_hits
+        lookups = hits + self.misses
+        return {
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "requests_saved": hits,
+            "seconds_saved": round(self.saved_seconds, 3),
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "entries": len(self._entries),
+        }
+
+
+# ---------- Process-wide cache ----------
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_generation_cache() -> GenerationCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = GenerationCache()
+        return _cache
@@ -1,4 +1,5 @@
 # home.py – Senior Intern Landing Page (FINAL)
+# Default page of streamlit_app.py.
 
 import streamlit as st
 
@@ -262,10 +263,7 @@ with cta_col1:
         unsafe_allow_html=True,
     )
     if st.button("Create my Senior Intern profile"):
-        st.info(
-            "For this prototype, open the Senior app with:\n\n"
-            "`streamlit run app.py`"
-        )
+        st.switch_page("app.py")
     st.markdown('</div>', unsafe_allow_html=True)
 
 with cta_col2:
@@ -282,16 +280,13 @@ with cta_col2:
         unsafe_allow_html=True,
     )
     if st.button("Describe my startup challenge"):
-        st.info(
-            "For this prototype, open the Founder app with:\n\n"
-            "`streamlit run founder_app.py`"
-        )
+        st.switch_page("founder_app.py")
     st.markdown('</div>', unsafe_allow_html=True)
 
 st.write("")
 st.caption(
-    "Prototype note: In the full product these CTAs route directly into the Senior and Startup experiences. "
-    "For the hackathon demo, the Senior and Founder flows run as two Streamlit apps (app.py and founder_app.py)."
+    "Prototype note: the Senior and Founder flows are pages of this app (run it with `streamlit run streamlit_app.py`), "
+    "sharing one profile store and matcher."
 )
 
 st.markdown('</div>', unsafe_allow_html=True)
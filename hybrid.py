@@ -0,0 +1,243 @@
+# hybrid.py — Senior Intern • hybrid lexical + vector retrieval of seniors
+#
+# SeniorMatcher ranks seniors on the founder form's categorical fields; the
+# founder's own words only reach it as hashed skill buckets. HybridRetriever
+# ranks the same matcher rows three ways:
+#
+#   * categorical: SeniorMatcher's score, as today;
+#   * lexical: BM25 over each senior's headline, intro and skills, against
+#     the problem's one-liners and description (BM25Index, in-process and
+#     appended to as seniors join);
+#   * semantic: cosine similarity of Gemini embeddings of the senior and
+#     problem AI texts, for seniors whose vectors are in the embedding cache
+#     (IVFIndex keyed by matcher row);
+#
+# and fuses the top DEPTH of each by reciprocal rank fusion: a senior scores
+# sum(weight / (RRF_K + rank)) over the rankings it appears in. Ranks, unlike
+# raw scores, need no calibration between the three. The categorical ranking
+# is weighted CATEGORICAL_WEIGHT: it knows nothing of what the founder
+# wrote, and at full weight it outvoted BM25 on problems it can't tell apart
+# (benchmarks/bench_hybrid.py). A ranking with nothing to say (no query
+# vector, no shared words) simply drops out, so without Gemini the result
+# is BM25 + categorical.
+
+import math
+import threading
+import time
+from array import array
+
+import numpy as np
+
+from ann_index import IVFIndex, senior_payload
+from instrumentation import timed
+from inverted_index import STOPWORDS, TOKEN_RE
+from matching import SeniorMatcher, top_k_indices
+from models import FounderProblem, SeniorProfile, build_senior_ai_text
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+RRF_K = 60
+CATEGORICAL_WEIGHT = 0.5
+DEPTH = 100             # candidates taken from each ranking
+IVF_TRAIN_AT = 10_000   # vectors held before the IVF index is clustered
+RETRY_VECTORS = 256     # seniors without a vector yet, looked up again on later syncs...
+RETRY_SECONDS = 60.0    # ...for this long after they joined
+
+EMPTY = np.empty(0, dtype=np.intp)
+
+
+def terms(text: str) -> list:
+    """Tokens of text with repeats (BM25 needs term frequencies)."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 2 and t not in STOPWORDS]
+
+
+def senior_text(s: SeniorProfile) -> str:
+    return " ".join([s.headline, s.intro, " ".join(s.skills)])
+
+
+def problem_text(p: FounderProblem) -> str:
+    return " ".join([p.company_one_liner, p.main_problem_one_line, p.detailed_description])
+
+
+class BM25Index:
+    """Okapi BM25 over documents with dense ids, maintained incrementally."""
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self._postings = {}         # term -> (doc ids array('I'), term frequencies array('H'))
+        self._lengths = array("I")  # doc id -> number of terms
+        self._total = 0
+        self._norm = None           # (n docs, k1 * (1 - b + b * len / avg len)) of the last query
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, doc_id: int, text: str) -> None:
+        """Index a document. doc ids must be added in order, starting at 0."""
+        if doc_id != len(self._lengths):
+            raise ValueError(f"expected doc id {len(self._lengths)}, got {doc_id}")
+        counts = {}
+        for t in terms(text):
+            counts[t] = counts.get(t, 0) + 1
+        with self._lock:
+            for t, tf in counts.items():
+                postings = self._postings.get(t)
+                if postings is None:
+                    postings = self._postings[t] = (array("I"), array("H"))
+                postings[0].append(doc_id)
+                postings[1].append(min(tf, 0xFFFF))
+            self._total += sum(counts.values())
+            # Published last: queries only score docs they know the length of.
+            self._lengths.append(sum(counts.values()))
+
+    def _doc_norm(self, n: int) -> np.ndarray:
+        cached = self._norm
+        if cached is not None and cached[0] == n:
+            return cached[1]
+        lengths = np.frombuffer(self._lengths, dtype=np.uint32)[:n].astype(np.float32)
+        avg = max(self._total / n, 1.0)
+        norm = self.k1 * (1 - self.b + self.b * lengths / avg)
+        self._norm = (n, norm)
+        return norm
+
+    def scores(self, text: str) -> tuple:
+        """(doc ids, BM25 scores) of the docs sharing a term with text, in id order."""
+        query = set(terms(text))
+        with self._lock:
+            n = len(self._lengths)
+            if not n:
+                return EMPTY, np.empty(0, dtype=np.float32)
+            norm = self._doc_norm(n)
+            lists = []
+            for t in query:
+                postings = self._postings.get(t)
+                if postings is not None:
+                    docs = np.frombuffer(postings[0], dtype=np.uint32).copy()
+                    tf = np.frombuffer(postings[1], dtype=np.uint16).astype(np.float32)
+                    lists.append((docs, tf))
+        if not lists:
+            return EMPTY, np.empty(0, dtype=np.float32)
+        all_docs, all_weights = [], []
+        for docs, tf in lists:
+            df = len(docs)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            all_docs.append(docs)
+            all_weights.append(idf * tf * (self.k1 + 1) / (tf + norm[docs]))
+        ids, inverse = np.unique(np.concatenate(all_docs), return_inverse=True)
+        return ids.astype(np.intp), np.bincount(inverse, np.concatenate(all_weights)).astype(np.float32)
+
+    def top(self, text: str, n: int = DEPTH) -> np.ndarray:
+        """The n best-scoring doc ids for text, best first (ties in id order)."""
+        ids, scores = self.scores(text)
+        return ids[top_k_indices(scores, n)]
+
+
+def reciprocal_rank_fusion(rankings: list, weights: list = None, k: int = RRF_K) -> tuple:
+    """(rows, fused scores), best first, of rankings given as row arrays
+    best first, each counted with its weight (default 1). Ties keep pool order."""
+    if weights is None:
+        weights = [1.0] * len(rankings)
+    pairs = [(r, w) for r, w in zip(rankings, weights) if len(r)]
+    if not pairs:
+        return EMPTY, np.empty(0)
+    rows = np.concatenate([r for r, _ in pairs])
+    contributions = np.concatenate([w / (k + 1 + np.arange(len(r))) for r, w in pairs])
+    ids, inverse = np.unique(rows, return_inverse=True)
+    fused = np.bincount(inverse, contributions)
+    order = np.lexsort((ids, -fused))
+    return ids[order], fused[order]
+
+
+class HybridRetriever:
+    """BM25, embedding and categorical rankings of a SeniorMatcher's pool, fused."""
+
+    def __init__(self, matcher: SeniorMatcher):
+        self.matcher = matcher
+        self.bm25 = BM25Index()
+        self.vectors = None         # IVFIndex of matcher row -> senior vector, once one is known
+        self.seen = 0               # matcher rows indexed
+        self._missing = []          # (row, first seen) of recent rows whose vector wasn't cached yet
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.seen
+
+    @property
+    def n_vectors(self) -> int:
+        return len(self.vectors) if self.vectors is not None else 0
+
+    @timed("hybrid.sync")
+    def sync(self, embedding_for=None) -> None:
+        """Index seniors added to the matcher since the last sync.
+
+        embedding_for(text) returns the cached vector of an AI text or None;
+        seniors without one are looked up again on syncs in the next
+        RETRY_SECONDS (their embedding may still be in flight), then left to
+        the other rankings.
+        """
+        if self.seen == len(self.matcher) and not (embedding_for and self._missing):
+            return
+        with self._lock:
+            n = len(self.matcher)
+            new = self.matcher.seniors[self.seen : n]
+            for row, s in enumerate(new, self.seen):
+                self.bm25.add(row, senior_text(s))
+            now = time.monotonic()
+            pending = [(row, t) for row, t in self._missing if now - t < RETRY_SECONDS]
+            pending += [(row, now) for row in range(self.seen, n)]
+            self.seen = n
+            if embedding_for is None:
+                self._missing = pending[-RETRY_VECTORS:]
+                return
+            found, vectors, missing = [], [], []
+            for row, t in pending:
+                v = embedding_for(build_senior_ai_text(self.matcher.seniors[row]))
+                if v is None:
+                    missing.append((row, t))
+                else:
+                    found.append(row)
+                    vectors.append(v)
+            self._missing = missing[-RETRY_VECTORS:]
+            if found:
+                self._add_vectors(found, np.stack(vectors))
+
+    def add_vectors(self, rows: list, vectors: np.ndarray) -> None:
+        """Give matcher rows their embedding (replacing any earlier one)."""
+        with self._lock:
+            self._add_vectors(list(rows), vectors)
+
+    def _add_vectors(self, rows: list, vectors: np.ndarray) -> None:
+        if self.vectors is None:
+            self.vectors = IVFIndex(vectors.shape[1])
+        seniors = self.matcher.seniors
+        self.vectors.add(rows, vectors, [senior_payload(seniors[r]) for r in rows])
+        if not self.vectors.trained and len(self.vectors) >= IVF_TRAIN_AT:
+            self.vectors.train()
+
+    # ---------- Rankings ----------
+
+    def categorical(self, problem: FounderProblem, depth: int = DEPTH) -> np.ndarray:
+        return self.matcher.ranked(problem, depth)[0]
+
+    def lexical(self, problem: FounderProblem, depth: int = DEPTH) -> np.ndarray:
+        return self.bm25.top(problem_text(problem), depth)
+
+    def semantic(self, query_vector, depth: int = DEPTH) -> np.ndarray:
+        if query_vector is None or self.vectors is None:
+            return EMPTY
+        with self._lock:
+            hits = self.vectors.search(query_vector, k=depth)
+        return np.array([row for row, _ in hits], dtype=np.intp)
+
+    @timed("hybrid.top_k")
+    def top_k(self, problem: FounderProblem, k: int = 3, query_vector=None, depth: int = DEPTH) -> list:
+        """Matches for the k best seniors by fused rank; Match.score is the RRF score."""
+        rankings = [
+            self.categorical(problem, depth),
+            self.lexical(problem, depth),
+            self.semantic(query_vector, depth),
+        ]
+        rows, fused = reciprocal_rank_fusion(rankings, [CATEGORICAL_WEIGHT, 1.0, 1.0])
+        return self.matcher.matches_for(problem, rows[:k], fused[:k])
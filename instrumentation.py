@@ -0,0 +1,260 @@
+# instrumentation.py — Senior Intern • timing spans and per-process histograms
+#
+#   with span("store.append"): ...
+#   @timed("match.top_k")          (sync or async functions)
+#
+# Every span's duration (time.perf_counter, monotonic) goes into a histogram
+# per span name with fixed Prometheus-style buckets, kept for the life of the
+# process. The Developer View expanders show them (timing_panel), and they
+# export as Prometheus text or JSON: on demand from the panel, or every
+# EXPORT_INTERVAL seconds to the file named by SENIOR_INTERN_METRICS_FILE
+# (.json for JSON, anything else for the Prometheus textfile format).
+#
+# SENIOR_INTERN_TIMING=0 turns it all off: span() hands back one shared
+# no-op object and @timed returns the function unchanged, so disabled
+# instrumentation costs one call per span and nothing per decorated call.
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+ENABLED = os.getenv("SENIOR_INTERN_TIMING", "1") != "0"
+METRICS_FILE = os.getenv("SENIOR_INTERN_METRICS_FILE")
+EXPORT_INTERVAL = 10.0
+
+# Upper bounds in seconds; a final +Inf bucket catches the rest.
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC = "senior_intern_span_seconds"
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "min", "max", "_lock")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.counts[bisect_left(BUCKETS, seconds)] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Estimate, interpolating linearly inside the bucket the quantile falls in
+        (narrowed to the observed min / max)."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lo = max(BUCKETS[i - 1] if i else 0.0, self.min)
+                hi = min(BUCKETS[i] if i < len(BUCKETS) else self.max, self.max)
+                return lo + (hi - lo) * (rank - seen) / n
+            seen += n
+        return self.max
+
+
+class Registry:
+    """Histograms by span name, shared by every thread of the process."""
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> Histogram:
+        h = self._histograms.get(name)
+        if h is None:
+            with self._lock:
+                h = self._histograms.setdefault(name, Histogram())
+        return h
+
+    def observe(self, name: str, seconds: float) -> None:
+        self.histogram(name).observe(seconds)
+
+    def reset(self) -> None:
+        # Cleared in place: decorated functions hold on to their histograms.
+        with self._lock:
+            for h in self._histograms.values():
+                h.clear()
+
+    def snapshot(self) -> dict:
+        """{name: {count, sum, mean, p50, p95, max, buckets}}, seconds throughout."""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        items = []
+        for name, h in histograms:
+            with h._lock:
+                if h.count:
+                    items.append((name, h.count, h.total, h.max, list(h.counts), h.quantile(0.5), h.quantile(0.95)))
+        return {
+            name: {
+                "count": count,
+                "sum": total,
+                "mean": total / count,
+                "p50": p50,
+                "p95": p95,
+                "max": max_,
+                "buckets": dict(zip([*map(str, BUCKETS), "+Inf"], counts)),
+            }
+            for name, count, total, max_, counts, p50, p95 in items
+        }
+
+    def to_json(self) -> str:
+        return json.dumps({"pid": os.getpid(), "time": time.time(), "spans": self.snapshot()}, indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = [f"# HELP {METRIC} Time spent in instrumented Senior Intern spans.", f"# TYPE {METRIC} histogram"]
+        for name, h in self.snapshot().items():
+            cumulative = 0
+            for le, n in h["buckets"].items():
+                cumulative += n
+                lines.append(f'{METRIC}_bucket{{span="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{METRIC}_sum{{span="{name}"}} {h["sum"]:.6f}')
+            lines.append(f'{METRIC}_count{{span="{name}"}} {h["count"]}')
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+# ---------- Spans ----------
+
+class _Span:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, name: str):
+        self.histogram = REGISTRY.histogram(name)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str):
+    """Context manager timing its block into the histogram for name."""
+    return _Span(name) if ENABLED else _NO_SPAN
+
+
+def observe(name: str, seconds: float) -> None:
+    """Record a duration measured elsewhere (e.g. a job's queue-to-done time)."""
+    if ENABLED:
+        REGISTRY.observe(name, seconds)
+
+
+def timed(name: str):
+    """Decorator: time every call of a function (or coroutine function) as a span."""
+
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+        histogram = REGISTRY.histogram(name)
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - start)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorate
+
+
+# ---------- Export ----------
+
+def write_metrics(path: str) -> None:
+    """Write the histograms to path (JSON if it ends in .json), replacing it atomically."""
+    text = REGISTRY.to_json() if path.endswith(".json") else REGISTRY.to_prometheus()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _export_loop(path: str) -> None:
+    while True:
+        time.sleep(EXPORT_INTERVAL)
+        try:
+            write_metrics(path)
+        except OSError:
+            pass    # e.g. the directory went away; try again next interval
+
+
+if ENABLED and METRICS_FILE:
+    threading.Thread(target=_export_loop, args=(METRICS_FILE,), name="metrics-export", daemon=True).start()
+
+
+def timing_panel() -> None:
+    """Table of span timings plus export buttons, for the Developer View expanders."""
+    import streamlit as st
+
+    st.subheader("Where the time goes (this server process)")
+    if not ENABLED:
+        st.caption("Timing is off (SENIOR_INTERN_TIMING=0).")
+        return
+    spans = REGISTRY.snapshot()
+    if not spans:
+        st.caption("No spans recorded yet.")
+        return
+    rows = [
+        {
+            "span": name,
+            "calls": h["count"],
+            "total ms": round(h["sum"] * 1000, 1),
+            "mean ms": round(h["mean"] * 1000, 2),
+            "p50 ms": round(h["p50"] * 1000, 2),
+            "p95 ms": round(h["p95"] * 1000, 2),
+            "max ms": round(h["max"] * 1000, 2),
+        }
+        for name, h in sorted(spans.items(), key=lambda item: -item[1]["sum"])
+    ]
+    st.dataframe(rows, hide_index=True, width="stretch")
+    left, right = st.columns(2)
+    left.download_button("Prometheus text", REGISTRY.to_prometheus(), file_name="senior_intern.prom")
+    right.download_button("JSON", REGISTRY.to_json(), file_name="senior_intern_timings.json")
@@ -0,0 +1,159 @@
+# inverted_index.py — Senior Intern • term -> senior posting lists
+#
+# Each senior gets a dense integer doc id (its row in the matcher's feature
+# matrix). Every term ("domain:Fintech", "problem:Turnaround / Crisis",
+# "skill:pricing", ...) maps to a growable array of doc ids; ids are handed
+# out in increasing order, so posting lists stay sorted for free.
+#
+# Queries run over per-term bitmaps (NumPy bool masks) that are built lazily
+# from the posting lists the first time a term is queried and then only
+# catch up on ids added since, so AND / OR are a handful of vectorised
+# logical ops regardless of how many seniors match.
+
+import re
+import threading
+from array import array
+
+import numpy as np
+
+from models import SeniorProfile
+
+EMPTY = np.empty(0, dtype=np.uint32)
+
+STOPWORDS = {
+    "and", "are", "but", "for", "from", "how", "not", "our", "the", "their", "they",
+    "this", "that", "was", "were", "what", "with", "you", "your", "have", "has", "into",
+}
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokens(text: str) -> set:
+    return {t for t in TOKEN_RE.findall(text.lower()) if len(t) > 2 and t not in STOPWORDS}
+
+
+def domain_term(domain: str) -> str:
+    return f"domain:{domain}"
+
+
+def problem_term(problem_type: str) -> str:
+    return f"problem:{problem_type}"
+
+
+def stage_term(stage: str) -> str:
+    return f"stage:{stage}"
+
+
+def skill_term(token: str) -> str:
+    return f"skill:{token}"
+
+
+def senior_terms(s: SeniorProfile) -> set:
+    terms = {domain_term(d) for d in s.preferred_domains}
+    terms.update(problem_term(t) for t in s.preferred_problem_types)
+    terms.add(stage_term(s.preferred_startup_stage))
+    terms.update(skill_term(t) for t in tokens(" ".join(s.skills)))
+    return terms
+
+
+class InvertedIndex:
+    """Posting lists of doc ids per term, maintained incrementally."""
+
+    def __init__(self):
+        self._postings = {}
+        self._masks = {}    # term -> [bool mask, number of postings already applied]
+        self._n_docs = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._n_docs
+
+    def add(self, doc_id: int, terms) -> None:
+        """Index a document. doc_id must be larger than every id added before."""
+        # Under the lock: _mask() holds buffer views of the posting arrays,
+        # and appending to one while a view exists raises BufferError.
+        with self._lock:
+            if doc_id < self._n_docs:
+                raise ValueError(f"doc ids must be added in increasing order (got {doc_id} after {self._n_docs - 1})")
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = array("I")
+                postings.append(doc_id)
+            self._n_docs = doc_id + 1
+
+    def postings(self, term: str) -> np.ndarray:
+        postings = self._postings.get(term)
+        if postings is None:
+            return EMPTY
+        # Copy out: a live view would pin the array's buffer and make the
+        # next add() to this term raise BufferError.
+        with self._lock:
+            return np.frombuffer(postings, dtype=np.uint32).copy()
+
+    def doc_freq(self, term: str) -> int:
+        postings = self._postings.get(term)
+        return len(postings) if postings is not None else 0
+
+    # ---------- Bitmaps ----------
+
+    def _mask(self, term: str, n_docs: int):
+        """Bool mask of length >= n_docs for term, or None if the term is unknown."""
+        postings = self._postings.get(term)
+        if postings is None:
+            return None
+        with self._lock:
+            entry = self._masks.get(term)
+            if entry is None:
+                entry = self._masks[term] = [np.zeros(0, dtype=bool), 0]
+            mask, applied = entry
+            if len(mask) < n_docs:
+                grown = np.zeros(max(n_docs, 2 * len(mask)), dtype=bool)
+                grown[: len(mask)] = mask
+                mask = entry[0] = grown
+            total = len(postings)
+            if applied < total:
+                new_ids = np.frombuffer(postings, dtype=np.uint32)[applied:total]
+                new_ids = new_ids[new_ids < len(mask)]
+                mask[new_ids] = True
+                entry[1] = applied + len(new_ids)
+        return mask
+
+    def mask(self, groups, n_docs: int = None) -> np.ndarray:
+        """Bool mask over doc ids: AND across groups, OR within each group."""
+        n = self._n_docs if n_docs is None else n_docs
+        result = None
+        for group in groups:
+            if not group:
+                continue
+            any_mask = np.zeros(n, dtype=bool)
+            for term in group:
+                m = self._mask(term, n)
+                if m is not None:
+                    np.logical_or(any_mask, m[:n], out=any_mask)
+            if result is None:
+                result = any_mask
+            else:
+                np.logical_and(result, any_mask, out=result)
+        return result if result is not None else np.zeros(n, dtype=bool)
+
+    # ---------- Queries ----------
+
+    def any_of(self, terms) -> np.ndarray:
+        """Docs containing at least one of the terms (OR)."""
+        return self.search([terms])
+
+    def all_of(self, terms) -> np.ndarray:
+        """Docs containing every term (AND)."""
+        return self.search([[t] for t in terms])
+
+    def search(self, groups, n_docs: int = None) -> np.ndarray:
+        """Sorted doc ids (below n_docs, if given): AND across groups, OR within each group.
+
+        search([["domain:Fintech", "domain:SaaS"], ["problem:Turnaround / Crisis"]])
+        returns the seniors who want Fintech or SaaS *and* enjoy turnarounds.
+        """
+        groups = [g for g in groups if g]
+        if not groups:
+            return EMPTY
+        return np.flatnonzero(self.mask(groups, n_docs)).astype(np.uint32)
@@ -0,0 +1,204 @@
+# jobs.py — Senior Intern • background pipeline for form submissions
+#
+# A form submit only appends the record to its store and hands it to the
+# SubmissionQueue, which returns the record id straight away. Worker threads
+# then do the slow part while the page polls job(id) for progress:
+#
+#   senior:  build_senior_ai_text -> embed -> index (shared matcher)
+#   problem: build_problem_ai_text -> embed -> board text
+#
+# Problem jobs don't rank seniors: the page does that with hybrid_matches,
+# which needs the embedding this job leaves in the cache.
+#
+# Embedding is best-effort: nothing downstream needs the vector yet, so
+# without a Gemini key the step is skipped and noted on the job rather than
+# failing the submission. The vector itself lands in the embedding cache.
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from app_cache import senior_matcher
+from board_rules import virtual_board
+from gemini_client import background_loop, get_gemini_client
+from instrumentation import observe
+from models import FounderProblem, SeniorProfile, build_problem_ai_text, build_senior_ai_text
+
+JOB_WORKERS = int(os.getenv("SENIOR_INTERN_JOB_WORKERS", 8))
+MAX_JOBS = 10_000       # jobs kept for polling; the oldest are dropped first
+
+STAGE_LABELS = {
+    "queued": "Waiting for a worker",
+    "ai_text": "Preparing your answers",
+    "embed": "Embedding with Gemini",
+    "index": "Adding you to the senior pool",
+    "board": "Consulting the advisory board",
+}
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str                    # "senior" or "problem"
+    status: str = "queued"       # queued -> running -> done | failed
+    stage: str = "queued"
+    submitted_at: float = field(default_factory=time.monotonic)
+    finished_at: float = None
+    result: dict = None
+    error: str = None
+    skipped: dict = field(default_factory=dict)   # stage -> reason
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def label(self) -> str:
+        return STAGE_LABELS.get(self.stage, self.stage)
+
+
+def gemini_embed(text: str):
+    """Start embedding on the client's loop; returns a concurrent Future."""
+    return asyncio.run_coroutine_threadsafe(get_gemini_client().embed(text), background_loop())
+
+
+class SubmissionQueue:
+    def __init__(
+        self,
+        matcher=senior_matcher,
+        embed=gemini_embed,
+        workers: int = JOB_WORKERS,
+        max_jobs: int = MAX_JOBS,
+    ):
+        self.matcher = matcher    # () -> SeniorMatcher that already includes stored seniors
+        self.embed = embed        # text -> Future of the vector, or None to skip embedding
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="submission")
+
+    # ---------- Submitting ----------
+
+    def submit_senior(self, profile: SeniorProfile) -> str:
+        return self._submit(Job(profile.id, "senior"), profile)
+
+    def submit_problem(self, problem: FounderProblem) -> str:
+        return self._submit(Job(problem.id, "problem"), problem)
+
+    def _submit(self, job: Job, record) -> str:
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        self._executor.submit(self._run, job, record)
+        return job.id
+
+    # ---------- Polling ----------
+
+    def job(self, job_id: str):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: float = None):
+        job = self.job(job_id)
+        if job is not None:
+            job._done.wait(timeout)
+        return job
+
+    def stats(self) -> dict:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        counts = {"queued": 0, "running": 0, "done": 0, "failed": 0}
+        for job in jobs:
+            counts[job.status] += 1
+        return counts
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    # ---------- Pipeline ----------
+
+    # A worker never blocks on Gemini: the embed step hands the text to the
+    # client's event loop and the rest of the pipeline is resubmitted to the
+    # pool when the vector arrives, so in-flight embeddings can batch up
+    # however few workers there are.
+
+    def _run(self, job: Job, record) -> None:
+        job.status = "running"
+        try:
+            job.stage = "ai_text"
+            if job.kind == "senior":
+                text = build_senior_ai_text(record)
+            else:
+                text = build_problem_ai_text(record)
+
+            job.stage = "embed"
+            if self.embed is None:
+                job.skipped["embed"] = "disabled"
+            else:
+                try:
+                    future = self.embed(text)
+                except Exception as exc:
+                    job.skipped["embed"] = f"{type(exc).__name__}: {exc}"
+                else:
+                    future.add_done_callback(lambda f: self._resume(job, record, text, f))
+                    return
+        except Exception as exc:
+            self._fail(job, exc)
+            return
+        self._finish(job, record, text)
+
+    def _resume(self, job: Job, record, text: str, embedded) -> None:
+        # Runs where the embedding completes (the client's loop thread). After
+        # close() the pool refuses new work, so finish inline rather than
+        # leave the job running forever.
+        try:
+            self._executor.submit(self._finish, job, record, text, embedded)
+        except RuntimeError:
+            self._finish(job, record, text, embedded)
+
+    def _finish(self, job: Job, record, text: str, embedded=None) -> None:
+        try:
+            if embedded is not None and embedded.exception() is not None:
+                exc = embedded.exception()
+                job.skipped["embed"] = f"{type(exc).__name__}: {exc}"
+            if job.kind == "senior":
+                job.stage = "index"
+                self.matcher()    # catches up with the store, which holds the new senior
+                job.result = {"ai_text": text}
+            else:
+                job.stage = "board"
+                job.result = {"ai_text": text, "advisory_text": virtual_board(record)}
+            job.status = "done"
+        except Exception as exc:
+            self._fail(job, exc)
+            return
+        job.finished_at = time.monotonic()
+        observe(f"job.{job.kind}", job.finished_at - job.submitted_at)
+        job._done.set()
+
+    def _fail(self, job: Job, exc: Exception) -> None:
+        job.status = "failed"
+        job.error = f"{type(exc).__name__}: {exc}"
+        job.finished_at = time.monotonic()
+        observe(f"job.{job.kind}.failed", job.finished_at - job.submitted_at)
+        job._done.set()
+
+
+# ---------- Process-wide queue ----------
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_submission_queue() -> SubmissionQueue:
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = SubmissionQueue()
+        return _queue
@@ -0,0 +1,329 @@
+# matching.py — Senior Intern • vectorized senior matching
+#
+# Every senior is encoded once into a row of a dense float32 feature matrix
+# (domains, problem types, startup stage, hashed skill tokens). A founder
+# problem becomes a weighted query vector over the same columns, so scoring
+# the whole pool is a single matrix-vector product followed by an
+# argpartition top-k. The matrix is kept column-major and only the query's
+# non-zero columns are read, and an inverted index over domains / problem
+# types trims the candidate set before any scoring happens.
+
+import threading
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+
+from instrumentation import timed
+from inverted_index import InvertedIndex, domain_term, problem_term, senior_terms, tokens
+from models import DOMAINS, PROBLEM_TYPES, STARTUP_STAGES, FounderProblem, SeniorProfile
+
+# ---------- Feature layout ----------
+
+N_SKILL_BUCKETS = 64
+
+DOMAIN_OFFSET = 0
+PROBLEM_OFFSET = DOMAIN_OFFSET + len(DOMAINS)
+STAGE_OFFSET = PROBLEM_OFFSET + len(PROBLEM_TYPES)
+SKILL_OFFSET = STAGE_OFFSET + len(STARTUP_STAGES)
+N_FEATURES = SKILL_OFFSET + N_SKILL_BUCKETS
+
+DOMAIN_INDEX = {d: DOMAIN_OFFSET + i for i, d in enumerate(DOMAINS)}
+PROBLEM_INDEX = {t: PROBLEM_OFFSET + i for i, t in enumerate(PROBLEM_TYPES)}
+STAGE_INDEX = {s: STAGE_OFFSET + i for i, s in enumerate(STARTUP_STAGES)}
+
+DOMAIN_WEIGHT = 3.0
+PROBLEM_WEIGHT = 2.0
+STAGE_WEIGHT = 1.5
+ANY_STAGE_WEIGHT = 0.75
+SKILL_WEIGHT = 0.5
+
+# ---------- Founder -> senior vocabulary ----------
+
+IMPACT_TO_PROBLEM_TYPES = {
+    "Revenue / Sales": ["Sales & GTM"],
+    "Growth / New customers": ["Sales & GTM", "Product & UX"],
+    "Customer satisfaction": ["Product & UX", "Operations & Execution"],
+    "Operations / Delivery": ["Operations & Execution"],
+    "Team clarity / morale": ["People & Culture"],
+    "Cashflow / Runway": ["Finance & Unit Economics", "Turnaround / Crisis"],
+}
+
+WHY_TO_PROBLEM_TYPES = {
+    "Limited budget": ["Finance & Unit Economics"],
+    "Weak or unclear strategy": ["Strategy & Direction"],
+    "Poor execution / follow-through": ["Operations & Execution"],
+    "No mentor / guidance": ["Strategy & Direction"],
+    "Team too junior": ["People & Culture"],
+    "Wrong product positioning": ["Product & UX", "Strategy & Direction"],
+    "Not talking enough to customers": ["Product & UX"],
+    "Low sales experience": ["Sales & GTM"],
+    "Market might not be right": ["Strategy & Direction"],
+}
+
+COMPANY_STAGE_TO_SENIOR_STAGES = {
+    "Idea": ["Idea stage"],
+    "Prototype": ["Idea stage", "MVP built"],
+    "MVP": ["MVP built"],
+    "Early revenue": ["Early revenue"],
+    "Scaling": ["Scaling"],
+}
+
+DOMAIN_KEYWORDS = {d: [d.lower()] for d in DOMAINS if d != "Other"}
+DOMAIN_KEYWORDS["E-commerce"].append("ecommerce")
+DOMAIN_KEYWORDS["Healthtech"].append("health")
+DOMAIN_KEYWORDS["Fintech"].append("payments")
+
+URGENT = 8
+
+# Below this fraction of the pool, gathering just the candidates' columns is
+# cheaper than scoring everyone and then picking the candidates out.
+SELECTIVE_FRACTION = 0.125
+
+# Score-matrix cells per chunk when ranking many problems at once.
+CHUNK_CELLS = 1 << 22
+
+def skill_bucket(token: str) -> int:
+    # crc32 rather than hash() so buckets are stable across processes
+    return SKILL_OFFSET + zlib.crc32(token.encode()) % N_SKILL_BUCKETS
+
+
+def problem_types_for(problem: FounderProblem) -> list:
+    """Senior problem types implied by the founder's impact areas and root causes."""
+    types = []
+    for area in problem.impact_areas:
+        types.extend(IMPACT_TO_PROBLEM_TYPES.get(area, []))
+    for reason in problem.why_exists:
+        types.extend(WHY_TO_PROBLEM_TYPES.get(reason, []))
+    if problem.urgency >= URGENT:
+        types.append("Turnaround / Crisis")
+    return types
+
+
+def infer_domains(problem: FounderProblem) -> list:
+    """FounderProblem has no domain field, so look for domain names in the free text."""
+    text = " ".join(
+        [problem.company_one_liner, problem.main_problem_one_line, problem.detailed_description]
+    ).lower()
+    return [d for d, words in DOMAIN_KEYWORDS.items() if any(w in text for w in words)]
+
+
+# ---------- Encoding ----------
+
+def encode_senior(s: SeniorProfile, row: np.ndarray) -> None:
+    for d in s.preferred_domains:
+        if d in DOMAIN_INDEX:
+            row[DOMAIN_INDEX[d]] = 1.0
+    for t in s.preferred_problem_types:
+        if t in PROBLEM_INDEX:
+            row[PROBLEM_INDEX[t]] = 1.0
+    if s.preferred_startup_stage in STAGE_INDEX:
+        row[STAGE_INDEX[s.preferred_startup_stage]] = 1.0
+    for tok in tokens(" ".join(s.skills)):
+        row[skill_bucket(tok)] = 1.0
+
+
+def encode_seniors(seniors: list) -> np.ndarray:
+    features = np.zeros((len(seniors), N_FEATURES), dtype=np.float32)
+    for i, s in enumerate(seniors):
+        encode_senior(s, features[i])
+    return features
+
+
+def encode_problem(problem: FounderProblem) -> np.ndarray:
+    q = np.zeros(N_FEATURES, dtype=np.float32)
+    for d in infer_domains(problem):
+        q[DOMAIN_INDEX[d]] = DOMAIN_WEIGHT
+    for t in problem_types_for(problem):
+        q[PROBLEM_INDEX[t]] += PROBLEM_WEIGHT
+    for stage in COMPANY_STAGE_TO_SENIOR_STAGES.get(problem.company_stage, []):
+        q[STAGE_INDEX[stage]] = STAGE_WEIGHT
+    q[STAGE_INDEX["Any"]] = ANY_STAGE_WEIGHT
+    text = " ".join([problem.main_problem_one_line, problem.detailed_description])
+    for tok in tokens(text):
+        q[skill_bucket(tok)] = SKILL_WEIGHT
+    return q
+
+
+# ---------- Matching ----------
+
+@dataclass
+class Match:
+    senior: SeniorProfile
+    score: float
+    shared_domains: list
+    shared_problem_types: list
+    stage_fit: bool
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first (ties keep pool order)."""
+    n = scores.shape[0]
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        # argpartition picks arbitrarily among ties for the k-th place, so
+        # take everything above it and then the earliest of the ties.
+        kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        above = np.flatnonzero(scores > kth)
+        idx = np.concatenate([above, np.flatnonzero(scores == kth)[: k - len(above)]])
+    else:
+        idx = np.arange(n)
+    return idx[np.lexsort((idx, -scores[idx]))]
+
+
+def top_k_rows(scores: np.ndarray, k: int) -> tuple:
+    """Row-wise top_k_indices: (ids, scores), each (rows, k), best first.
+
+    Ties keep column order, as in top_k_indices. Rows with fewer than k
+    columns are padded with id -1 and score -inf.
+    """
+    n_rows, n = scores.shape
+    ids = np.full((n_rows, k), -1, dtype=np.int64)
+    best = np.full((n_rows, k), -np.inf, dtype=np.float32)
+    kk = min(k, n)
+    if kk == 0:
+        return ids, best
+    if kk < n:
+        kth = -np.partition(-scores, kk - 1, axis=1)[:, kk - 1]
+        above = scores > kth[:, None]
+        need = kk - above.sum(axis=1)
+        rows, cols = np.nonzero(above)
+        rows, cols = [rows], [cols]
+        # Then the earliest ties for the k-th place, one column per pass
+        # (k is small, and argmax stops at the first True).
+        tied = scores == kth[:, None]
+        for t in range(kk):
+            r = np.flatnonzero(need > t)
+            if len(r) == 0:
+                break
+            c = tied[r].argmax(axis=1)
+            tied[r, c] = False
+            rows.append(r)
+            cols.append(c)
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        cols = cols[np.lexsort((cols, rows))].reshape(n_rows, kk)
+    else:
+        cols = np.broadcast_to(np.arange(n), (n_rows, n))
+    vals = np.take_along_axis(scores, cols, axis=1)
+    order = np.argsort(-vals, axis=1, kind="stable")
+    ids[:, :kk] = np.take_along_axis(cols, order, axis=1)
+    best[:, :kk] = np.take_along_axis(vals, order, axis=1)
+    return ids, best
+
+
+class SeniorMatcher:
+    """Scores founder problems against a growing senior pool."""
+
+    def __init__(self, seniors=()):
+        self.seniors = []
+        self.index = InvertedIndex()
+        # Column-major: one contiguous row per feature, one column per senior.
+        self._columns = np.zeros((N_FEATURES, 0), dtype=np.float32)
+        self._lock = threading.Lock()
+        self.extend(seniors)
+
+    def __len__(self) -> int:
+        return len(self.seniors)
+
+    @property
+    def features(self) -> np.ndarray:
+        """(n_seniors, N_FEATURES) view of the encoded pool."""
+        return self._columns[:, : len(self.seniors)].T
+
+    def add(self, senior: SeniorProfile) -> None:
+        self.extend([senior])
+
+    @timed("match.encode")
+    def extend(self, seniors) -> None:
+        seniors = list(seniors)
+        with self._lock:
+            n = len(self.seniors)
+            self._reserve(n + len(seniors))
+            rows = encode_seniors(seniors)
+            self._columns[:, n : n + len(seniors)] = rows.T
+            for i, s in enumerate(seniors, n):
+                self.index.add(i, senior_terms(s))
+            # Publish the seniors last so a reader never sees one whose
+            # feature row is still being written. The index already has
+            # their ids, so readers take len(self.seniors) once and bound
+            # every lookup by it (see ranked()).
+            self.seniors.extend(seniors)
+
+    def _reserve(self, rows: int) -> None:
+        capacity = self._columns.shape[1]
+        if rows <= capacity:
+            return
+        grown = np.zeros((N_FEATURES, max(rows, 2 * capacity, 64)), dtype=np.float32)
+        grown[:, :capacity] = self._columns
+        self._columns = grown
+
+    def candidates(self, problem: FounderProblem, k: int, n: int = None):
+        """Doc ids (below n, the pool size by default) worth scoring, or None
+        to score the whole pool.
+
+        Seniors sharing both a domain and a problem type with the founder
+        come first; if that leaves fewer than k, either one is enough.
+        """
+        n = len(self.seniors) if n is None else n
+        domain_group = [domain_term(d) for d in infer_domains(problem)]
+        type_group = [problem_term(t) for t in set(problem_types_for(problem))]
+        for groups in ([domain_group, type_group], [domain_group + type_group]):
+            ids = self.index.search(groups, n)
+            if len(ids) >= k:
+                return ids
+        return None
+
+    def scores(self, problem: FounderProblem, ids: np.ndarray = None, n: int = None) -> np.ndarray:
+        """Scores for the first n seniors (all by default), or only for the given doc ids."""
+        q = encode_problem(problem)
+        nz = np.flatnonzero(q)
+        columns = self._columns[:, : len(self.seniors) if n is None else n]
+        if ids is None:
+            return q[nz] @ columns[nz]
+        return q[nz] @ columns[np.ix_(nz, ids)]
+
+    @timed("match.top_k")
+    def top_k(self, problem: FounderProblem, k: int = 3, prefilter: bool = True) -> list:
+        rows, top_scores = self.ranked(problem, k, prefilter)
+        return self.matches_for(problem, rows, top_scores)
+
+    def ranked(self, problem: FounderProblem, k: int, prefilter: bool = True) -> tuple:
+        """(rows, scores) of the k best seniors, best first."""
+        # One snapshot of the pool size for the whole query: extend() may be
+        # adding seniors meanwhile, and the index learns their ids first.
+        n = len(self.seniors)
+        ids = self.candidates(problem, k, n) if prefilter else None
+        if ids is None:
+            scores = self.scores(problem, n=n)
+            rows = top_k_indices(scores, k)
+            top_scores = scores[rows]
+        else:
+            if len(ids) < SELECTIVE_FRACTION * n:
+                scores = self.scores(problem, ids)
+            else:
+                scores = self.scores(problem, n=n)[ids]
+            best = top_k_indices(scores, k)
+            rows = ids[best]
+            top_scores = scores[best]
+        return rows, top_scores
+
+    def matches_for(self, problem: FounderProblem, rows, scores) -> list:
+        """Match objects for already-ranked senior rows and their scores."""
+        wanted_types = set(problem_types_for(problem))
+        domains = set(infer_domains(problem))
+        stages = set(COMPANY_STAGE_TO_SENIOR_STAGES.get(problem.company_stage, [])) | {"Any"}
+        matches = []
+        for i, score in zip(rows, scores):
+            s = self.seniors[i]
+            matches.append(
+                Match(
+                    senior=s,
+                    score=float(score),
+                    shared_domains=[d for d in s.preferred_domains if d in domains],
+                    shared_problem_types=[t for t in s.preferred_problem_types if t in wanted_types],
+                    stage_fit=s.preferred_startup_stage in stages,
+                )
+            )
+        return matches
+
@@ -0,0 +1,158 @@
+# model_resolver.py — Senior Intern • which Gemini models to use, without asking every start
+#
+# test_gemini.py used to call genai.list_models() and take models[0] on every
+# run. Discovery is a network round trip, so the result (supported models
+# per method plus the chosen one) is cached on disk with a TTL:
+#
+#   * GEMINI_MODEL / GEMINI_EMBED_MODEL set  -> used as-is, no discovery
+#   * fresh cache                            -> read the JSON file, no discovery
+#   * stale cache                            -> return the cached choice now,
+#                                               refresh in a background thread
+#   * no cache                               -> discover once and write it
+
+import json
+import os
+import threading
+import time
+
+from store import DATA_DIR
+
+CACHE_TTL = float(os.getenv("GEMINI_MODEL_CACHE_TTL", 24 * 3600))
+
+METHODS = {
+    "generate": "generateContent",
+    "embed": "embedContent",
+}
+
+ENV_OVERRIDES = {
+    "generate": "GEMINI_MODEL",
+    "embed": "GEMINI_EMBED_MODEL",
+}
+
+# Checked in order; the first one the key can use wins, else the first listed.
+PREFERRED = {
+    "generate": ["models/gemini-1.5-flash", "models/gemini-1.5-pro", "models/gemini-pro"],
+    "embed": ["models/text-embedding-004", "models/embedding-001"],
+}
+
+
+def genai_list_models():
+    import google.generativeai as genai
+
+    return genai.list_models()
+
+
+def choose(kind: str, available: list) -> str:
+    for name in PREFERRED[kind]:
+        if name in available:
+            return name
+    if not available:
+        raise LookupError(f"No models with {METHODS[kind]} found for this key/project.")
+    return available[0]
+
+
+class ModelResolver:
+    def __init__(self, list_models=genai_list_models, cache_path: str = None, ttl: float = CACHE_TTL):
+        self.list_models = list_models
+        self.cache_path = cache_path or os.path.join(DATA_DIR, "gemini_models.json")
+        self.ttl = ttl
+        self._cache = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self.discoveries = 0
+
+    # ---------- Cache file ----------
+
+    def _read(self):
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, cache: dict) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        tmp = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, self.cache_path)
+
+    def _fresh(self, cache: dict) -> bool:
+        return time.time() - cache.get("fetched_at", 0) < self.ttl
+
+    # ---------- Discovery ----------
+
+    def discover(self) -> dict:
+        """List models over the network and rewrite the cache."""
+        self.discoveries += 1
+        supported = {kind: [] for kind in METHODS}
+        for m in self.list_models():
+            methods = getattr(m, "supported_generation_methods", [])
+            for kind, method in METHODS.items():
+                if method in methods:
+                    supported[kind].append(m.name)
+        chosen = {kind: choose(kind, names) for kind, names in supported.items() if names}
+        cache = {"fetched_at": time.time(), "supported": supported, "chosen": chosen}
+        self._write(cache)
+        with self._lock:
+            self._cache = cache
+        return cache
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.discover()
+            except Exception:
+                pass  # keep serving the stale choice; try again next start
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="gemini-model-refresh", daemon=True).start()
+
+    # ---------- Resolution ----------
+
+    def resolve(self, kind: str = "generate") -> str:
+        override = os.getenv(ENV_OVERRIDES[kind])
+        if override:
+            return override
+        with self._lock:
+            cache = self._cache
+        if cache is None:
+            cache = self._read()
+            with self._lock:
+                self._cache = cache
+        if cache is not None and kind in cache.get("chosen", {}):
+            if not self._fresh(cache):
+                self._refresh_in_background()
+            return cache["chosen"][kind]
+        cache = self.discover()
+        if kind not in cache["chosen"]:
+            raise LookupError(f"No models with {METHODS[kind]} found for this key/project.")
+        return cache["chosen"][kind]
+
+    def supported(self, kind: str = "generate") -> list:
+        cache = self._cache or self._read() or self.discover()
+        return cache["supported"].get(kind, [])
+
+
+# ---------- Process-wide resolver ----------
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_model_resolver() -> ModelResolver:
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = ModelResolver()
+        return _resolver
+
+
+def resolve_model(kind: str = "generate") -> str:
+    return get_model_resolver().resolve(kind)
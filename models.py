@@ -0,0 +1,167 @@
+# models.py — Senior Intern • shared data model
+#
+# The Streamlit scripts used to define these inline, which meant nothing else
+# (matching, storage, benchmarks) could import them without running a page.
+
+from dataclasses import dataclass
+
+from instrumentation import timed
+
+# ---------- Form options ----------
+
+DOMAINS = [
+    "SaaS",
+    "Fintech",
+    "Edtech",
+    "Healthtech",
+    "E-commerce",
+    "Telecom",
+    "Manufacturing",
+    "Retail",
+    "Hospitality",
+    "Other",
+]
+
+STARTUP_STAGES = ["Idea stage", "MVP built", "Early revenue", "Scaling", "Any"]
+
+PROBLEM_TYPES = [
+    "Strategy & Direction",
+    "Operations & Execution",
+    "Product & UX",
+    "Sales & GTM",
+    "Finance & Unit Economics",
+    "People & Culture",
+    "Turnaround / Crisis",
+    "Other",
+]
+
+IMPACT_AREAS = [
+    "Revenue / Sales",
+    "Growth / New customers",
+    "Customer satisfaction",
+    "Operations / Delivery",
+    "Team clarity / morale",
+    "Cashflow / Runway",
+    "Other",
+]
+
+WHY_EXISTS_OPTIONS = [
+    "Lack of experience in this area",
+    "Limited budget",
+    "Weak or unclear strategy",
+    "Poor execution / follow-through",
+    "No mentor / guidance",
+    "Team too junior",
+    "Wrong product positioning",
+    "Not talking enough to customers",
+    "Low sales experience",
+    "Market might not be right",
+    "I am not sure",
+    "Other",
+]
+
+WHAT_TRIED_OPTIONS = [
+    "Paid ads / performance marketing",
+    "Content or social media marketing",
+    "Discounts / offers",
+    "Changing pricing",
+    "Hiring new people",
+    "Talking to customers",
+    "Changing the product",
+    "Nothing yet",
+    "Other",
+]
+
+COMPANY_STAGES = ["Idea", "Prototype", "MVP", "Early revenue", "Scaling"]
+
+
+# ---------- Data model ----------
+
+@dataclass
+class SeniorProfile:
+    id: str
+    name: str
+    email: str
+    linkedin_url: str
+    headline: str
+    skills: list
+    intro: str
+    preferred_domains: list
+    preferred_startup_stage: str
+    preferred_problem_types: list
+    availability_days_per_week: int
+    availability_hours_per_day: int
+    created_at: str
+    # Stable ids of the skills' vocabulary terms (skills.SkillVocabulary),
+    # in the order typed; records stored before skills had ids read back as ().
+    skill_ids: tuple = ()
+
+
+@dataclass
+class FounderProblem:
+    id: str
+    founder_name: str
+    founder_email: str
+    company_name: str
+    company_one_liner: str
+    main_problem_one_line: str
+    impact_areas: list
+    why_exists: list
+    what_tried: list
+    urgency: int
+    company_stage: str
+    detailed_description: str
+    created_at: str
+
+
+# ---------- Text for Gemini ----------
+
+@timed("ai_text.senior")
+def build_senior_ai_text(profile: SeniorProfile) -> str:
+    """Text we will send to Gemini later."""
+    return f"""
+Senior profile:
+Name: {profile.name}
+Headline: {profile.headline}
+
+Skills: {", ".join(profile.skills)}
+Preferred domains: {", ".join(profile.preferred_domains)}
+Preferred startup stage: {profile.preferred_startup_stage}
+Enjoys solving: {", ".join(profile.preferred_problem_types)}
+
+Availability: {profile.availability_days_per_week} days/week,
+{profile.availability_hours_per_day} hours/day.
+
+Intro:
+{profile.intro}
+
+LinkedIn: {profile.linkedin_url}
+"""
+
+
+@timed("ai_text.problem")
+def build_problem_ai_text(p: FounderProblem) -> str:
+    return f"""
+Startup problem:
+
+Founder: {p.founder_name} ({p.founder_email})
+Company: {p.company_name}
+One-liner: {p.company_one_liner}
+
+Main problem (one line):
+{p.main_problem_one_line}
+
+Impact areas: {", ".join(p.impact_areas)}
+
+Why the founder thinks this problem exists:
+{", ".join(p.why_exists)}
+
+What they have tried so far:
+{", ".join(p.what_tried)}
+
+Urgency (1-10): {p.urgency}
+Company stage: {p.company_stage}
+
+Detailed description:
+{p.detailed_description}
+"""
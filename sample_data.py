@@ -0,0 +1,148 @@
+# sample_data.py — Senior Intern • demo seniors and synthetic datasets
+#
+# MOCK_SENIORS is the small pool the founder demo matches against until real
+# profiles are stored. The synthetic_* generators build large, reproducible
+# pools for benchmarks and load tests.
+
+import random
+import uuid
+from datetime import datetime
+
+from models import (
+    COMPANY_STAGES,
+    DOMAINS,
+    IMPACT_AREAS,
+    PROBLEM_TYPES,
+    STARTUP_STAGES,
+    WHAT_TRIED_OPTIONS,
+    WHY_EXISTS_OPTIONS,
+    FounderProblem,
+    SeniorProfile,
+)
+
+# ---------- Demo seniors ----------
+
+MOCK_SENIORS = [
+    SeniorProfile(
+        id="mock-anita-rao",
+        name="Anita Rao",
+        email="anita.rao@example.com",
+        linkedin_url="https://www.linkedin.com/in/anita-rao",
+        headline="Ex-COO, 25+ yrs in Retail & Operations",
+        skills=["Operations", "Retail", "Store execution", "Customer retention"],
+        intro="She has led multiple retail turnarounds where repeat customers and store-level execution were the main issues.",
+        preferred_domains=["Retail", "E-commerce", "Hospitality"],
+        preferred_startup_stage="Early revenue",
+        preferred_problem_types=["Operations & Execution", "Turnaround / Crisis", "People & Culture"],
+        availability_days_per_week=2,
+        availability_hours_per_day=4,
+        created_at="2025-01-01T00:00:00",
+    ),
+    SeniorProfile(
+        id="mock-vikram-mehta",
+        name="Vikram Mehta",
+        email="vikram.mehta@example.com",
+        linkedin_url="https://www.linkedin.com/in/vikram-mehta",
+        headline="Ex-CPO, B2B SaaS & Product Strategy",
+        skills=["Product", "Strategy", "Retention", "Positioning"],
+        intro="He’s scaled SaaS products from MVP to thousands of paying customers and knows how to fix retention and positioning problems.",
+        preferred_domains=["SaaS", "Edtech"],
+        preferred_startup_stage="MVP built",
+        preferred_problem_types=["Product & UX", "Strategy & Direction", "Sales & GTM"],
+        availability_days_per_week=3,
+        availability_hours_per_day=3,
+        created_at="2025-01-01T00:00:00",
+    ),
+    SeniorProfile(
+        id="mock-sara-al-mansoori",
+        name="Sara Al Mansoori",
+        email="sara.almansoori@example.com",
+        linkedin_url="https://www.linkedin.com/in/sara-al-mansoori",
+        headline="Ex-CFO, 20+ yrs in Finance & Unit Economics",
+        skills=["Finance", "Pricing", "Unit economics", "Fundraising"],
+        intro="She is ideal when pricing, margins, or runway are the hidden reason behind a growth or retention issue.",
+        preferred_domains=["Fintech", "SaaS", "Retail"],
+        preferred_startup_stage="Any",
+        preferred_problem_types=["Finance & Unit Economics", "Turnaround / Crisis"],
+        availability_days_per_week=2,
+        availability_hours_per_day=3,
+        created_at="2025-01-01T00:00:00",
+    ),
+]
+
+
+# ---------- Synthetic datasets ----------
+
+FIRST_NAMES = ["Anita", "Vikram", "Sara", "Arjun", "James", "Mei", "Omar", "Lucia", "Kenji", "Priya", "Hans", "Grace"]
+LAST_NAMES = ["Rao", "Mehta", "Ali", "Thompson", "Tanaka", "Haddad", "Rossi", "Schmidt", "Okafor", "Nair", "Kim", "Silva"]
+TITLES = ["Ex-COO", "Ex-CFO", "Ex-CPO", "Ex-CTO", "Ex-VP Sales", "Ex-Head of Marketing", "Ex-HR Director", "Ex-GM"]
+SKILLS = [
+    "Strategy", "Operations", "Product", "Go-To-Market", "Fundraising", "Pricing", "Hiring",
+    "Unit economics", "Supply chain", "B2B Sales", "Retention", "Positioning", "Cloud",
+    "Customer success", "Partnerships", "Negotiation", "Budgeting", "Turnarounds",
+]
+PROBLEM_LINES = [
+    "We don’t have repeat customers.",
+    "Our sales cycle is too long.",
+    "We are running out of runway.",
+    "The team keeps missing deadlines.",
+    "Nobody understands what we sell.",
+    "Churn doubled this quarter.",
+]
+
+
+def iter_synthetic_seniors(n: int, seed: int = 0):
+    """Reproducible stream of n SeniorProfile records (nothing held in memory)."""
+    rng = random.Random(seed)
+    created_at = datetime(2025, 1, 1).isoformat()
+    for i in range(n):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        title = rng.choice(TITLES)
+        domains = rng.sample(DOMAINS, rng.randint(1, 3))
+        yield SeniorProfile(
+            id=str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            name=name,
+            email=f"senior{i}@example.com",
+            linkedin_url=f"https://www.linkedin.com/in/senior-{i}",
+            headline=f"{title}, {rng.randint(15, 35)}+ yrs in {' & '.join(domains)}",
+            skills=rng.sample(SKILLS, rng.randint(2, 5)),
+            intro=f"{name} has helped {rng.randint(2, 12)} startups with {rng.choice(SKILLS).lower()}.",
+            preferred_domains=domains,
+            preferred_startup_stage=rng.choice(STARTUP_STAGES),
+            preferred_problem_types=rng.sample(PROBLEM_TYPES[:-1], rng.randint(1, 3)),
+            availability_days_per_week=rng.randint(1, 7),
+            availability_hours_per_day=rng.randint(1, 8),
+            created_at=created_at,
+        )
+
+
+def synthetic_seniors(n: int, seed: int = 0) -> list:
+    """Reproducible pool of n SeniorProfile records."""
+    return list(iter_synthetic_seniors(n, seed))
+
+
+def synthetic_problems(n: int, seed: int = 0) -> list:
+    """Reproducible batch of n FounderProblem records."""
+    rng = random.Random(seed)
+    created_at = datetime(2025, 1, 1).isoformat()
+    problems = []
+    for i in range(n):
+        domain = rng.choice(DOMAINS[:-1])
+        problems.append(
+            FounderProblem(
+                id=str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                founder_name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                founder_email=f"founder{i}@example.com",
+                company_name=f"Startup {i}",
+                company_one_liner=f"We are a {domain} company helping small businesses grow.",
+                main_problem_one_line=rng.choice(PROBLEM_LINES),
+                impact_areas=rng.sample(IMPACT_AREAS[:-1], rng.randint(1, 3)),
+                why_exists=rng.sample(WHY_EXISTS_OPTIONS[:-1], rng.randint(1, 3)),
+                what_tried=rng.sample(WHAT_TRIED_OPTIONS, rng.randint(1, 2)),
+                urgency=rng.randint(1, 10),
+                company_stage=rng.choice(COMPANY_STAGES),
+                detailed_description=f"We need help with {rng.choice(SKILLS).lower()} and {rng.choice(SKILLS).lower()}.",
+                created_at=created_at,
+            )
+        )
+    return problems
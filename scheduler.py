@@ -0,0 +1,223 @@
+# scheduler.py — Senior Intern • capacity-aware assignment of seniors to problems
+#
+#   python scheduler.py [--out assignments.jsonl] [--k 3] [--hours 2] [--capacity-out capacity.jsonl]
+#
+# Matching alone recommends the best-scoring seniors to every founder, so a
+# popular senior would be asked by everyone. The scheduler treats each
+# senior's weekly hours (days/week x hours/day) as capacity, every
+# assignment as HOURS_PER_ASSIGNMENT of it, and assigns a whole batch of
+# problems at once: most urgent first (ties in submission order), each to
+# its best-scoring seniors that still have hours left.
+#
+# Candidates per problem are its top CANDIDATES seniors among those sharing
+# one of its domains (the whole pool when no domain is inferred or too few
+# seniors share it), ranked exactly as SeniorMatcher.top_k. Problems with the
+# same domains are scored as one matrix product, and the top-n of each chunk
+# is found from 64-senior block maxima, so only blocks that can reach it are
+# looked at. A problem whose candidates are all fully booked gets fewer than
+# k seniors; Assignment.unfilled says how many are missing.
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+import numpy as np
+
+from instrumentation import timed
+from matching import CHUNK_CELLS, DOMAIN_INDEX, encode_problem, encode_seniors, infer_domains, top_k_rows
+from models import FounderProblem
+
+HOURS_PER_ASSIGNMENT = 2
+CANDIDATES = 32
+BLOCK = 64
+
+
+@dataclass
+class Assignment:
+    problem: FounderProblem
+    senior_rows: list
+    scores: list
+    unfilled: int
+
+
+def weekly_hours(senior) -> int:
+    return senior.availability_days_per_week * senior.availability_hours_per_day
+
+
+def _top_n_blocked(scores_t: np.ndarray, n_seniors: int, n: int) -> tuple:
+    """top_k_rows of scores_t.T, for a (BLOCK-multiple seniors, problems) score
+    matrix whose rows from n_seniors on are -inf padding.
+
+    The n-th largest block maximum is a lower bound on the n-th largest
+    score, so only blocks whose maximum reaches it can hold the top n.
+    """
+    n_rows, m = scores_t.shape
+    n_blocks = n_rows // BLOCK
+    if n_blocks <= n:
+        return top_k_rows(np.ascontiguousarray(scores_t[:n_seniors].T), n)
+    blocks = scores_t.reshape(n_blocks, BLOCK, m)
+    block_max = blocks.max(axis=1)
+    floor = -np.partition(-block_max, n - 1, axis=0)[n - 1]
+    b, problem = np.nonzero(block_max >= floor)
+    values = blocks[b, :, problem]
+    pair, offset = np.nonzero(values >= floor[problem][:, None])
+    problem, senior, values = problem[pair], b[pair] * BLOCK + offset, values[pair, offset]
+    # Best first, ties in pool order, then the first n of every problem.
+    order = np.lexsort((senior, -values, problem))
+    problem, senior, values = problem[order], senior[order], values[order]
+    rank = np.arange(len(problem)) - np.searchsorted(problem, np.arange(m))[problem]
+    keep = rank < n
+    return senior[keep].reshape(m, n), values[keep].reshape(m, n)
+
+
+class CapacityScheduler:
+    """Remaining weekly hours per senior, spent by batches of problems."""
+
+    def __init__(self, seniors: list, hours_per_assignment: int = HOURS_PER_ASSIGNMENT,
+                 features: np.ndarray = None):
+        self.seniors = seniors
+        self.hours_per_assignment = hours_per_assignment
+        # Encoded rows as in SeniorMatcher.features; pass them in to reuse an existing encoding.
+        self.features = encode_seniors(seniors) if features is None else features
+        self.capacity = np.fromiter((weekly_hours(s) for s in seniors), dtype=np.int32, count=len(seniors))
+        self.remaining = self.capacity.copy()
+        self.rows = {s.id: i for i, s in enumerate(seniors)}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.seniors)
+
+    def remaining_hours(self, senior_id: str) -> int:
+        """Weekly hours the senior has left (KeyError for unknown ids)."""
+        return int(self.remaining[self.rows[senior_id]])
+
+    def remaining_capacity(self) -> dict:
+        """{senior id: hours left this week} for the whole pool."""
+        return dict(zip(self.rows, self.remaining.tolist()))
+
+    def release(self, assignment: Assignment) -> None:
+        """Give the hours of an assignment back (problem solved or withdrawn)."""
+        with self._lock:
+            for row in assignment.senior_rows:
+                self.remaining[row] = min(self.capacity[row], self.remaining[row] + self.hours_per_assignment)
+
+    # ---------- Candidates ----------
+
+    def _pool_for(self, domains: tuple):
+        if not domains:
+            return None
+        rows = np.flatnonzero(self.features[:, [DOMAIN_INDEX[d] for d in domains]].any(axis=1))
+        return rows if len(rows) >= CANDIDATES else None
+
+    @timed("schedule.candidates")
+    def candidates(self, problems: list, n: int = CANDIDATES) -> tuple:
+        """(ids, scores), each (len(problems), n), best first; ids -1 where a pool is smaller than n."""
+        ids = np.full((len(problems), n), -1, dtype=np.int64)
+        best = np.full((len(problems), n), -np.inf, dtype=np.float32)
+        if not problems or not len(self.seniors):
+            return ids, best
+        groups = defaultdict(list)
+        for i, p in enumerate(problems):
+            groups[tuple(sorted(infer_domains(p)))].append(i)
+        for domains, members in groups.items():
+            pool = self._pool_for(domains)
+            features = self.features if pool is None else self.features[pool]
+            size = len(features)
+            padded = np.zeros((-(-size // BLOCK) * BLOCK, features.shape[1]), dtype=np.float32)
+            padded[:size] = features
+            nn = min(n, size)
+            queries = np.stack([encode_problem(problems[i]) for i in members])
+            chunk = max(1, CHUNK_CELLS // len(padded))
+            for start in range(0, len(members), chunk):
+                rows = members[start : start + chunk]
+                scores_t = padded @ queries[start : start + chunk].T
+                scores_t[size:] = -np.inf
+                top, top_scores = _top_n_blocked(scores_t, size, nn)
+                ids[rows, :nn] = top if pool is None else pool[top]
+                best[rows, :nn] = top_scores
+        return ids, best
+
+    # ---------- Assignment ----------
+
+    @timed("schedule.assign")
+    def schedule(self, problems: list, k: int = 3) -> list:
+        """Assign up to k seniors to every problem, most urgent first.
+
+        Returns one Assignment per problem, in input order; the hours are
+        taken from remaining until released.
+        """
+        ids, scores = self.candidates(problems)
+        order = sorted(range(len(problems)), key=lambda i: (-problems[i].urgency, problems[i].created_at, i))
+        ids_list, scores_list = ids.tolist(), scores.tolist()
+        hours = self.hours_per_assignment
+        assignments = [None] * len(problems)
+        with self._lock:
+            remaining = self.remaining.tolist()
+            for i in order:
+                rows, picked = [], []
+                for row, score in zip(ids_list[i], scores_list[i]):
+                    if row < 0 or len(rows) == k:
+                        break
+                    if remaining[row] >= hours:
+                        remaining[row] -= hours
+                        rows.append(row)
+                        picked.append(score)
+                assignments[i] = Assignment(problems[i], rows, picked, k - len(rows))
+            self.remaining[:] = remaining
+        return assignments
+
+
+def write_assignments(out, seniors: list, assignments) -> int:
+    n = 0
+    for a in assignments:
+        line = {
+            "problem_id": a.problem.id,
+            "founder_email": a.problem.founder_email,
+            "urgency": a.problem.urgency,
+            "seniors": [{"senior_id": seniors[i].id, "score": float(s)} for i, s in zip(a.senior_rows, a.scores)],
+            "unfilled": a.unfilled,
+        }
+        out.write(json.dumps(line, ensure_ascii=False) + "\n")
+        n += 1
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Assign stored founder problems to seniors within their weekly hours.")
+    parser.add_argument("--out", default="-", help="JSONL output file, or - for stdout")
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--hours", type=int, default=HOURS_PER_ASSIGNMENT, help="weekly hours per assignment")
+    parser.add_argument("--capacity-out", help="also write {senior_id, capacity, remaining} JSONL here")
+    args = parser.parse_args(argv)
+
+    from store import get_problem_store, get_senior_store
+
+    seniors = get_senior_store().all()
+    problems = get_problem_store().all()
+    t0 = time.perf_counter()
+    scheduler = CapacityScheduler(seniors, args.hours)
+    assignments = scheduler.schedule(problems, k=args.k)
+    elapsed = time.perf_counter() - t0
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    try:
+        n = write_assignments(out, seniors, assignments)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if args.capacity_out:
+        with open(args.capacity_out, "w", encoding="utf-8") as f:
+            for s, cap, left in zip(seniors, scheduler.capacity.tolist(), scheduler.remaining.tolist()):
+                f.write(json.dumps({"senior_id": s.id, "capacity": cap, "remaining": left}) + "\n")
+    unfilled = sum(a.unfilled for a in assignments)
+    print(
+        f"{n:,} problems x {len(seniors):,} seniors scheduled in {elapsed:.1f}s, {unfilled:,} slots unfilled",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
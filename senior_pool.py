@@ -0,0 +1,246 @@
+# senior_pool.py — Senior Intern • compact columnar pool of senior profiles
+#
+# A list of SeniorProfile dataclasses costs well over a kilobyte per senior
+# (instance dict, a str object per field, list objects for skills / domains /
+# problem types). A matching worker holding 500k+ seniors keeps them here
+# instead:
+#
+#   * stage        -> array('B') code into STARTUP_STAGES
+#   * domains      -> array('H') bitmask over DOMAINS
+#   * problem types-> array('H') bitmask over PROBLEM_TYPES
+#   * availability -> array('B') days/week and hours/day
+#   * skill ids    -> one array('I') for all rows, sliced by array('Q') offsets
+#   * free text    -> UTF-8 bytes in one shared arena; each row's text
+#                     fields are stored back to back, NUL-separated, so the
+#                     only per-row cost is one offset in an array('Q')
+#
+# pool[i] returns a SeniorRow, a __slots__ view that decodes fields on
+# access; row.to_profile() rebuilds the dataclass when one is needed
+# (domains and problem types come back in form order, not entry order).
+
+import hashlib
+from array import array
+
+import numpy as np
+
+from models import DOMAINS, PROBLEM_TYPES, STARTUP_STAGES, SeniorProfile
+
+TEXT_FIELDS = ("id", "name", "email", "linkedin_url", "headline", "skills", "intro", "created_at")
+FIELD_SEP = "\0"
+SKILL_SEP = "\x1f"  # ASCII unit separator; never typed into a form
+
+STAGE_CODE = {s: i for i, s in enumerate(STARTUP_STAGES)}
+DOMAIN_BIT = {d: 1 << i for i, d in enumerate(DOMAINS)}
+PROBLEM_BIT = {t: 1 << i for i, t in enumerate(PROBLEM_TYPES)}
+
+
+def _bitmask(values, bits: dict, field: str) -> int:
+    mask = 0
+    for v in values:
+        if v not in bits:
+            raise ValueError(f"unknown {field}: {v!r}")
+        mask |= bits[v]
+    return mask
+
+
+def _decode_table(vocab: list) -> list:
+    """mask -> list of names, precomputed for every possible mask."""
+    return [[v for i, v in enumerate(vocab) if mask >> i & 1] for mask in range(1 << len(vocab))]
+
+
+DOMAINS_BY_MASK = _decode_table(DOMAINS)
+PROBLEM_TYPES_BY_MASK = _decode_table(PROBLEM_TYPES)
+
+
+def _id_hash(id_: str) -> int:
+    return int.from_bytes(hashlib.blake2b(id_.encode(), digest_size=8).digest(), "little")
+
+
+class _TextField:
+    """Descriptor reading one arena string for the row it is accessed on."""
+
+    __slots__ = ("field",)
+
+    def __init__(self, field: int):
+        self.field = field
+
+    def __get__(self, row, owner):
+        if row is None:
+            return self
+        return row._pool.text(row._row, self.field)
+
+
+class SeniorRow:
+    """Read-only view of one senior in a SeniorPool."""
+
+    __slots__ = ("_pool", "_row")
+
+    id = _TextField(0)
+    name = _TextField(1)
+    email = _TextField(2)
+    linkedin_url = _TextField(3)
+    headline = _TextField(4)
+    intro = _TextField(6)
+    created_at = _TextField(7)
+
+    def __init__(self, pool: "SeniorPool", row: int):
+        self._pool = pool
+        self._row = row
+
+    @property
+    def skills(self) -> list:
+        text = self._pool.text(self._row, 5)
+        return text.split(SKILL_SEP) if text else []
+
+    @property
+    def skill_ids(self) -> tuple:
+        pool = self._pool
+        return tuple(pool.skill_ids[pool._skill_offsets[self._row] : pool._skill_offsets[self._row + 1]])
+
+    @property
+    def preferred_domains(self) -> list:
+        return list(DOMAINS_BY_MASK[self._pool.domains[self._row]])
+
+    @property
+    def preferred_problem_types(self) -> list:
+        return list(PROBLEM_TYPES_BY_MASK[self._pool.problem_types[self._row]])
+
+    @property
+    def preferred_startup_stage(self) -> str:
+        return STARTUP_STAGES[self._pool.stage[self._row]]
+
+    @property
+    def availability_days_per_week(self) -> int:
+        return self._pool.days[self._row]
+
+    @property
+    def availability_hours_per_day(self) -> int:
+        return self._pool.hours[self._row]
+
+    def to_profile(self) -> SeniorProfile:
+        return SeniorProfile(
+            id=self.id,
+            name=self.name,
+            email=self.email,
+            linkedin_url=self.linkedin_url,
+            headline=self.headline,
+            skills=self.skills,
+            intro=self.intro,
+            preferred_domains=self.preferred_domains,
+            preferred_startup_stage=self.preferred_startup_stage,
+            preferred_problem_types=self.preferred_problem_types,
+            availability_days_per_week=self.availability_days_per_week,
+            availability_hours_per_day=self.availability_hours_per_day,
+            created_at=self.created_at,
+            skill_ids=self.skill_ids,
+        )
+
+    def __repr__(self) -> str:
+        return f"SeniorRow({self._row}, id={self.id!r}, name={self.name!r})"
+
+
+class SeniorPool:
+    def __init__(self, seniors=()):
+        self._arena = bytearray()
+        self._offsets = array("Q", [0])   # row r is arena[offsets[r]:offsets[r + 1]]
+        self.stage = array("B")
+        self.domains = array("H")
+        self.problem_types = array("H")
+        self.days = array("B")
+        self.hours = array("B")
+        self.skill_ids = array("I")
+        self._skill_offsets = array("Q", [0])
+        self._id_hashes = array("Q")
+        self._lookup = None               # (sorted hashes, rows), rebuilt after appends
+        self.extend(seniors)
+
+    def __len__(self) -> int:
+        return len(self.stage)
+
+    def __getitem__(self, row: int) -> SeniorRow:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return SeniorRow(self, row)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield SeniorRow(self, row)
+
+    def text(self, row: int, field: int) -> str:
+        chunk = self._arena[self._offsets[row] : self._offsets[row + 1]]
+        return chunk.split(b"\0")[field].decode()
+
+    # ---------- Writes ----------
+
+    def append(self, s: SeniorProfile) -> int:
+        # Encode and check every value first: a row rejected halfway would
+        # leave the columns misaligned for every row after it.
+        stage = STAGE_CODE.get(s.preferred_startup_stage)
+        if stage is None:
+            raise ValueError(f"unknown preferred_startup_stage: {s.preferred_startup_stage!r}")
+        domains = _bitmask(s.preferred_domains, DOMAIN_BIT, "domain")
+        problem_types = _bitmask(s.preferred_problem_types, PROBLEM_BIT, "problem type")
+        days, hours = s.availability_days_per_week, s.availability_hours_per_day
+        for name, value in (("availability_days_per_week", days), ("availability_hours_per_day", hours)):
+            if not isinstance(value, int) or not 0 <= value <= 255:
+                raise ValueError(f"{name} must be an int in 0..255, got {value!r}")
+        if any(SKILL_SEP in skill for skill in s.skills):
+            raise ValueError("skills must not contain the unit separator (\\x1f)")
+        try:
+            skill_ids = array("I", s.skill_ids)
+        except (OverflowError, TypeError) as exc:
+            raise ValueError(f"skill_ids must be ints in 0..2**32-1: {exc}") from None
+
+        texts = (s.id, s.name, s.email, s.linkedin_url, s.headline, SKILL_SEP.join(s.skills), s.intro, s.created_at)
+        if any(FIELD_SEP in t for t in texts):
+            raise ValueError("text fields must not contain NUL characters")
+        text = FIELD_SEP.join(texts).encode()
+        id_hash = _id_hash(s.id)
+
+        self._arena += text
+        self._offsets.append(len(self._arena))
+        self.stage.append(stage)
+        self.domains.append(domains)
+        self.problem_types.append(problem_types)
+        self.days.append(days)
+        self.hours.append(hours)
+        self.skill_ids.extend(skill_ids)
+        self._skill_offsets.append(len(self.skill_ids))
+        self._id_hashes.append(id_hash)
+        self._lookup = None
+        return len(self) - 1
+
+    def extend(self, seniors) -> None:
+        for s in seniors:
+            self.append(s)
+
+    # ---------- Lookups ----------
+
+    def row_of(self, id_: str):
+        """Row number for a senior id, or None."""
+        if self._lookup is None:
+            hashes = np.frombuffer(self._id_hashes, dtype=np.uint64)
+            order = np.argsort(hashes, kind="stable")
+            self._lookup = (hashes[order], order)
+        hashes, order = self._lookup
+        h = np.uint64(_id_hash(id_))
+        lo = int(np.searchsorted(hashes, h, side="left"))
+        hi = int(np.searchsorted(hashes, h, side="right"))
+        for row in order[lo:hi]:
+            if self[int(row)].id == id_:  # guard against 64-bit hash collisions
+                return int(row)
+        return None
+
+    def get(self, id_: str):
+        row = self.row_of(id_)
+        return None if row is None else SeniorRow(self, row)
+
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers and the text arena."""
+        columns = (
+            self._offsets, self.stage, self.domains, self.problem_types, self.days, self.hours,
+            self.skill_ids, self._skill_offsets, self._id_hashes,
+        )
+        return len(self._arena) + sum(c.itemsize * len(c) for c in columns)
@@ -0,0 +1,94 @@
+# session_cache.py — Senior Intern • per-session values kept out of st.session_state
+#
+# st.session_state lives as long as the browser session, once per session,
+# so it only holds ids now: the profile or problem itself is in the
+# process-wide store (store.get(id)) and its AI text is rebuilt when shown.
+# What a session produces that can't be rebuilt cheaply (the streamed board
+# analysis) goes here instead: one cache for the whole process of
+# session id -> {name: value}, holding at most max_sessions sessions.
+#
+# Sessions are kept in order of last access, which is also idle order, so
+# every access first drops the sessions at the front that have been idle
+# for idle_seconds, then the least recently active ones over the cap. A
+# value dropped while its session is still open is simply missing; the
+# page regenerates it (the board from the generation cache, see
+# advisory_board).
+
+import threading
+import time
+from collections import OrderedDict
+
+MAX_SESSIONS = 10_000
+IDLE_SECONDS = 30 * 60.0
+
+
+class SessionCache:
+    """Per-session values; idle and least recently active sessions dropped first."""
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, idle_seconds: float = IDLE_SECONDS,
+                 clock=time.monotonic):
+        self.max_sessions = max_sessions
+        self.idle_seconds = idle_seconds
+        self.clock = clock
+        self._sessions = OrderedDict()  # session -> [last access, {name: value}], least recent first
+        self._lock = threading.Lock()
+        self.evicted = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _values(self, session: str, create: bool):
+        now = self.clock()
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if now - oldest[0] <= self.idle_seconds:
+                break
+            self._sessions.popitem(last=False)
+            self.expired += 1
+        entry = self._sessions.get(session)
+        if entry is None:
+            if not create:
+                return None
+            entry = self._sessions[session] = [now, {}]
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+        else:
+            entry[0] = now
+            self._sessions.move_to_end(session)
+        return entry[1]
+
+    def get(self, session: str, name: str, default=None):
+        with self._lock:
+            values = self._values(session, create=False)
+            return default if values is None else values.get(name, default)
+
+    def put(self, session: str, name: str, value) -> None:
+        with self._lock:
+            self._values(session, create=True)[name] = value
+
+    def clear_session(self, session: str) -> None:
+        with self._lock:
+            self._sessions.pop(session, None)
+
+    def stats(self) -> dict:
+        return {
+            "sessions": len(self._sessions),
+            "evicted": self.evicted,
+            "expired": self.expired,
+        }
+
+
+# ---------- Process-wide cache ----------
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_session_cache() -> SessionCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SessionCache()
+        return _cache
@@ -0,0 +1,347 @@
+# skills.py — Senior Intern • canonical skill vocabulary with fuzzy lookup
+#
+# Seniors type skills free-form, so "GTM", "Go-To-Market" and "go to market"
+# used to be three different skills to the indexes and caches. Every skill
+# now also gets the stable integer id of a canonical term, stored next to
+# the text the senior typed (which is kept as is):
+#
+#   1. exact: the normalised text (lowercase, punctuation dropped, "&" ->
+#      "and") or its spaceless form against every term's keys: its name,
+#      aliases and, for 3+ word names, initials ("gtm");
+#   2. typo: a one-word skill of MIN_TYPO+ letters against the one-word
+#      names and aliases, within one edit (two from LONG_WORD letters) of
+#      the closest few by trigram similarity: "negotation", "pricings".
+#
+# Nothing looser: "Production" is not "Product", nor "Data" "Data
+# analytics", nor "Legal tech" "Legal", so multi-word text that isn't a key
+# and anything else unmatched becomes a new term. Ids are positions in the
+# vocabulary file (DATA_DIR/skills.jsonl), which is append-only: a term
+# keeps its id for good, and built-in terms missing from an existing file
+# are appended to it rather than renumbered. The app and bulk imports add
+# terms side by side, so add() locks the file and first reads the terms
+# other processes appended, then numbers its own after them.
+
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+
+import numpy as np
+
+from file_lock import locked
+from instrumentation import timed
+from store import DATA_DIR
+
+SKILLS_FILE = "skills.jsonl"
+
+MIN_TYPO = 7            # shorter words only resolve exactly
+LONG_WORD = 10          # words this long may be two edits off, shorter ones one
+TYPO_CANDIDATES = 8     # keys with the most trigrams in common, checked by edit distance
+ACRONYM_SKIP = {"and", "of", "the", "for"}
+
+EMPTY = np.empty(0, dtype=np.uint32)
+
+log = logging.getLogger(__name__)
+
+# (name, aliases). Seeds a new vocabulary file in this order.
+BUILTIN_SKILLS = [
+    ("Strategy", ["business strategy", "strategic planning"]),
+    ("Operations", ["ops", "operations management"]),
+    ("Product", ["product management"]),
+    ("Go-To-Market", ["gtm", "go to market strategy"]),
+    ("Fundraising", ["fund raising", "raising capital", "venture capital"]),
+    ("Pricing", ["pricing strategy"]),
+    ("Hiring", ["recruiting", "recruitment", "talent acquisition"]),
+    ("Unit economics", []),
+    ("Supply chain", ["supply chain management", "scm", "logistics"]),
+    ("B2B Sales", ["enterprise sales", "b2b"]),
+    ("Retention", ["customer retention", "churn reduction"]),
+    ("Positioning", ["product positioning"]),
+    ("Cloud", ["cloud computing", "aws", "azure", "gcp"]),
+    ("Customer success", ["account management"]),
+    ("Partnerships", ["business development", "biz dev", "bd"]),
+    ("Negotiation", []),
+    ("Budgeting", ["financial planning", "fp&a"]),
+    ("Turnarounds", ["turnaround management", "crisis management", "restructuring"]),
+    ("Marketing", ["digital marketing", "growth marketing"]),
+    ("Sales", ["sales management", "selling"]),
+    ("Finance", ["corporate finance", "financial modelling", "financial modeling"]),
+    ("Leadership", ["people management", "team leadership"]),
+    ("Team building", []),
+    ("Store execution", ["retail operations"]),
+    ("Product-led growth", ["plg"]),
+    ("Brand", ["branding", "brand strategy"]),
+    ("Legal", ["contracts"]),
+    ("Compliance", ["regulatory", "regulation"]),
+    ("Data analytics", ["analytics", "data analysis", "business intelligence", "bi"]),
+    ("Machine learning", ["ml"]),
+    ("Artificial intelligence", ["ai"]),
+    ("Software engineering", ["software development", "engineering"]),
+    ("UX design", ["user experience", "ux", "ui ux"]),
+    ("Customer discovery", ["customer interviews", "user research"]),
+]
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text).lower().replace("&", " and ")
+    return " ".join(WORD_RE.findall(text))
+
+
+def trigrams(key: str) -> set:
+    padded = f" {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def term_keys(name: str, aliases=()) -> list:
+    """Exact-match keys of a term: normalised name and aliases, their spaceless
+    forms, and the initials of 3+ word names."""
+    keys = []
+    for text in [name, *aliases]:
+        key = normalize(text)
+        if not key:
+            continue
+        keys += [key, key.replace(" ", "")]
+        words = [w for w in key.split() if w not in ACRONYM_SKIP]
+        if len(words) >= 3:
+            keys.append("".join(w[0] for w in words))
+    return list(dict.fromkeys(keys))
+
+
+def word_keys(name: str, aliases=()) -> set:
+    """The keys of a term that typo lookup may match: one-word names and aliases."""
+    keys = {normalize(text) for text in [name, *aliases]}
+    return {key for key in keys if key and " " not in key}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (a swap counts once), or limit + 1 past limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before, row = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = current[j - 1] + 1, row[j] + 1, row[j - 1] + (ca != cb)
+            d = min(cost)
+            if before is not None and i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                d = min(d, before[j - 2] + 1)
+            current.append(d)
+        if min(current) > limit:
+            return limit + 1
+        before, row = row, current
+    return row[-1]
+
+
+class SkillVocabulary:
+    """Canonical skill terms by stable id, with exact and one-word typo lookup."""
+
+    def __init__(self, terms=BUILTIN_SKILLS, path: str = None):
+        self.path = path
+        self.names = []         # term id -> canonical name
+        self.keys = []          # key index -> key text
+        self.key_terms = []     # key index -> term id
+        self._exact = {}        # key text -> term id (first term to claim a key keeps it)
+        self._postings = {}     # trigram -> indexes of one-word keys (uint32, ascending)
+        self._n_trigrams = np.zeros(0, dtype=np.int32)
+        self._offset = 0        # bytes of the file already read into the vocabulary
+        self._lock = threading.Lock()
+
+        stored = []
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                stored = self._read_new(f)
+        self._build(stored)
+        known = {normalize(name) for name, _ in stored}
+        missing = [(name, aliases) for name, aliases in terms if normalize(name) not in known]
+        if not path:
+            self._build(missing)
+        else:
+            for name, aliases in missing:
+                self.add(name, aliases)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # ---------- Building ----------
+
+    def _read_new(self, f) -> list:
+        """(name, aliases) of the terms in the open file past self._offset.
+
+        Only complete lines count (a torn last line is left for later).
+        Unreadable lines are skipped, and so is a line reusing an id already
+        taken (two processes numbering the same term before add() locked
+        the file): the first term with an id keeps it.
+        """
+        f.seek(self._offset)
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        terms = []
+        next_id = len(self.names)
+        for line in data[:end].split(b"\n"):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                term_id, name, aliases = row["id"], row["name"], row.get("aliases", [])
+            except (ValueError, KeyError, TypeError) as exc:
+                log.warning("%s: skipped unreadable skill: %s", self.path, exc)
+                continue
+            if term_id < next_id:
+                log.warning("%s: skipped %r, id %d is already taken", self.path, name, term_id)
+                continue
+            if term_id > next_id:
+                raise ValueError(f"{self.path}: expected id {next_id}, found {term_id}")
+            terms.append((name, aliases))
+            next_id += 1
+        self._offset += end
+        return terms
+
+    def _register(self, term_id: int, keys: list) -> list:
+        """Claim the term's unclaimed keys; returns their key indexes."""
+        added = []
+        for key in keys:
+            if key in self._exact:
+                continue
+            self._exact[key] = term_id
+            added.append(len(self.keys))
+            self.keys.append(key)
+            self.key_terms.append(term_id)
+        return added
+
+    def _build(self, terms: list) -> None:
+        """Bulk-add terms (no file writes), building postings in one pass."""
+        postings = {}
+        new = []
+        for name, aliases in terms:
+            term_id = len(self.names)
+            self.names.append(name)
+            words = word_keys(name, aliases)
+            for k in self._register(term_id, term_keys(name, aliases)):
+                new.append(k)
+                if self.keys[k] in words:
+                    for t in trigrams(self.keys[k]):
+                        postings.setdefault(t, []).append(k)
+        for t, ks in postings.items():
+            self._postings[t] = np.concatenate([self._postings.get(t, EMPTY), np.array(ks, dtype=np.uint32)])
+        self._n_trigrams = np.concatenate(
+            [self._n_trigrams, np.array([len(trigrams(self.keys[k])) for k in new], dtype=np.int32)]
+        )
+
+    def add(self, name: str, aliases=()) -> int:
+        """Append a new term (persisted when the vocabulary has a file); returns its id."""
+        keys = term_keys(name, aliases)
+        if not keys:
+            raise ValueError(f"skill {name!r} has no letters or digits")
+        with self._lock:
+            if keys[0] in self._exact:
+                return self._exact[keys[0]]
+            if not self.path:
+                return self._insert(name, aliases)
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a+b") as f, locked(f):
+                for other, other_aliases in self._read_new(f):
+                    self._insert(other, other_aliases)
+                if keys[0] in self._exact:      # another process added it meanwhile
+                    return self._exact[keys[0]]
+                term_id = len(self.names)
+                line = json.dumps({"id": term_id, "name": name, "aliases": list(aliases)}, ensure_ascii=False) + "\n"
+                if f.seek(0, os.SEEK_END) > self._offset:
+                    line = "\n" + line         # end a torn line instead of extending it
+                f.write(line.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                self._offset = f.tell()
+            return self._insert(name, aliases)
+
+    def _insert(self, name: str, aliases=()) -> int:
+        """Add a term to the in-memory indexes under the next id; returns it."""
+        term_id = len(self.names)
+        keys, words = term_keys(name, aliases), word_keys(name, aliases)
+        # Readers may be resolving concurrently, so everything a lookup
+        # can lead to (name, trigram counts) exists before the keys and
+        # postings that lead to it, and arrays are replaced, not resized.
+        self.names.append(name)
+        added = self._register(term_id, keys)
+        self._n_trigrams = np.append(
+            self._n_trigrams, np.array([len(trigrams(self.keys[k])) for k in added], dtype=np.int32)
+        )
+        for k in added:
+            if self.keys[k] in words:
+                for t in trigrams(self.keys[k]):
+                    self._postings[t] = np.append(self._postings.get(t, EMPTY), np.uint32(k))
+        return term_id
+
+    # ---------- Lookup ----------
+
+    def _typo(self, key: str):
+        grams = trigrams(key)
+        lists = [self._postings[t] for t in grams if t in self._postings]
+        if not lists:
+            return None
+        cand, shared = np.unique(np.concatenate(lists), return_counts=True)
+        dice = 2 * shared / (len(grams) + self._n_trigrams[cand])
+        limit = 2 if len(key) >= LONG_WORD else 1
+        best = None
+        # Most similar first, the oldest key first among equals.
+        for k in cand[np.argsort(-dice, kind="stable")[:TYPO_CANDIDATES]]:
+            d = edit_distance(key, self.keys[k], limit)
+            if d <= limit and (best is None or d < best[0]):
+                best = (d, k)
+        return None if best is None else self.key_terms[best[1]]
+
+    def resolve(self, text: str):
+        """Term id for free-form skill text, or None if no term matches it."""
+        key = normalize(text)
+        if not key:
+            return None
+        term_id = self._exact.get(key)
+        if term_id is None:
+            term_id = self._exact.get(key.replace(" ", ""))
+        if term_id is None and len(key) >= MIN_TYPO and " " not in key:
+            term_id = self._typo(key)
+        return term_id
+
+    def resolve_or_add(self, text: str) -> int:
+        term_id = self.resolve(text)
+        return self.add(text.strip()) if term_id is None else term_id
+
+    @timed("skills.canonicalize")
+    def canonicalize(self, skills) -> tuple:
+        """(skills as typed, canonical term ids) for free-form skills.
+
+        Blank entries and repeats of the same normalised text are dropped and
+        the rest only trimmed; ids are deduplicated. Both keep first-seen order.
+        """
+        typed, ids, seen = [], [], set()
+        for text in skills:
+            key = normalize(text)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            typed.append(text.strip())
+            term_id = self.resolve_or_add(text)
+            if term_id not in ids:
+                ids.append(term_id)
+        return typed, tuple(ids)
+
+    def nbytes(self) -> int:
+        """Bytes held by the trigram postings and per-key arrays (not the dicts)."""
+        return sum(p.nbytes for p in self._postings.values()) + self._n_trigrams.nbytes
+
+
+# ---------- Process-wide vocabulary ----------
+
+_vocabularies = {}
+_vocabularies_lock = threading.Lock()
+
+
+def get_skill_vocabulary(data_dir: str = DATA_DIR) -> SkillVocabulary:
+    path = os.path.join(data_dir, SKILLS_FILE)
+    with _vocabularies_lock:
+        if path not in _vocabularies:
+            _vocabularies[path] = SkillVocabulary(path=path)
+        return _vocabularies[path]
@@ -0,0 +1,282 @@
+# store.py — Senior Intern • append-only profile store
+#
+# Profiles and problems are appended to a JSONL log (one record per line).
+# Appends only touch memory; a background thread writes the pending lines
+# and fsyncs them in batches, so concurrent Streamlit sessions never wait on
+# the disk one record at a time. On startup the log is read once per process
+# and the id / email / domain indexes are rebuilt from it; a line that
+# doesn't parse, or isn't an object with every field the record type
+# requires, is logged with its line number and skipped.
+
+import atexit
+import gc
+import json
+import logging
+import os
+import threading
+from dataclasses import MISSING, asdict, fields
+
+from file_lock import locked
+from instrumentation import span, timed
+from matching import infer_domains
+from models import FounderProblem, SeniorProfile
+
+DATA_DIR = os.getenv("SENIOR_INTERN_DATA_DIR", "data")
+SENIORS_FILE = "seniors.jsonl"
+PROBLEMS_FILE = "problems.jsonl"
+
+FLUSH_INTERVAL = 0.05   # seconds between group commits
+FLUSH_BATCH = 1024      # flush early once this many lines are pending
+
+log = logging.getLogger(__name__)
+
+
+class ProfileStore:
+    """Append-only JSONL log with in-memory indexes by id, email and domain."""
+
+    record_type = None
+    tuple_fields = ()   # tuple-typed fields, read back from JSON as lists
+
+    def __init__(self, path: str, flush_interval: float = FLUSH_INTERVAL, flush_batch: int = FLUSH_BATCH):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+
+        self._records = []
+        self._by_id = {}
+        self._by_email = {}
+        self._by_domain = {}
+
+        self._lock = threading.Lock()      # guards indexes and the pending buffer
+        self._io_lock = threading.Lock()   # serialises writes to the file
+        self._pending = []
+        self._wake = threading.Event()
+        self._closed = False
+
+        self._load()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._flusher = threading.Thread(target=self._flush_loop, name=f"store-flush:{path}", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    # ---------- Record-specific keys ----------
+
+    def email_of(self, record) -> str:
+        raise NotImplementedError
+
+    def domains_of(self, record) -> list:
+        raise NotImplementedError
+
+    # ---------- Loading ----------
+
+    @timed("store.load")
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        # Writers (this store's flusher, bulk imports) append whole lines
+        # under the file lock, so under it a line without its newline is a
+        # torn final write from a crash: cut it off so new appends start on
+        # a clean line instead of failing startup.
+        with open(self.path, "r+b") as f, locked(f):
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end < len(data):
+                f.truncate(end)
+                data = data[:end]
+        body = data.strip()
+        while b"\n\n" in body:
+            body = body.replace(b"\n\n", b"\n")
+        if not body:
+            return
+        # Bulk-building 100k+ records triggers many useless cyclic GC passes;
+        # pausing the collector roughly halves cold-start time.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            required = self.required_fields()
+            try:
+                rows = json.loads(b"[" + body.replace(b"\n", b",") + b"]")
+            except ValueError:
+                rows = None
+            if rows is None or not all(isinstance(row, dict) and required <= row.keys() for row in rows):
+                # A bad line somewhere in the log (say, from a bulk import
+                # in another process): parse line by line and skip it.
+                rows = self._parse_lines(data)
+            # Rows are exactly asdict() output, so adopt each parsed dict as
+            # the instance __dict__ instead of re-copying it through __init__.
+            cls = self.record_type
+            new = object.__new__
+            tuple_fields = self.tuple_fields
+            records = []
+            for row in rows:
+                for name in tuple_fields:
+                    if name in row:
+                        row[name] = tuple(row[name])
+                record = new(cls)
+                record.__dict__ = row
+                records.append(record)
+            self._index(records)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    @classmethod
+    def required_fields(cls) -> frozenset:
+        """Fields a stored row must have: those without a default."""
+        return frozenset(
+            f.name for f in fields(cls.record_type)
+            if f.default is MISSING and f.default_factory is MISSING
+        )
+
+    def _parse_lines(self, data: bytes) -> list:
+        required = self.required_fields()
+        rows = []
+        for line_no, line in enumerate(data.split(b"\n"), 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                log.warning("%s:%d: skipped unreadable record: %s", self.path, line_no, exc)
+                continue
+            if not isinstance(row, dict):
+                log.warning("%s:%d: skipped record that is not an object", self.path, line_no)
+                continue
+            missing = required.difference(row)
+            if missing:
+                log.warning("%s:%d: skipped record missing %s", self.path, line_no, ", ".join(sorted(missing)))
+                continue
+            rows.append(row)
+        return rows
+
+    def _index(self, records: list) -> None:
+        self._records.extend(records)
+        by_id, by_email, by_domain = self._by_id, self._by_email, self._by_domain
+        email_of, domains_of = self.email_of, self.domains_of
+        for r in records:
+            by_id[r.id] = r
+            email = email_of(r).strip().lower()
+            if email in by_email:
+                by_email[email].append(r)
+            else:
+                by_email[email] = [r]
+            for d in domains_of(r):
+                if d in by_domain:
+                    by_domain[d].append(r)
+                else:
+                    by_domain[d] = [r]
+
+    # ---------- Writes ----------
+
+    @timed("store.append")
+    def append(self, record):
+        """Add a record. It is durable on disk within flush_interval seconds."""
+        line = json.dumps(asdict(record), ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"store {self.path} is closed")
+            self._index([record])
+            self._pending.append(line)
+            full = len(self._pending) >= self.flush_batch
+        if full:
+            self._wake.set()
+        return record
+
+    def flush(self) -> None:
+        """Write and fsync everything appended so far."""
+        # Take the batch under the I/O lock too, so two flushes (the flusher
+        # thread and close() or a caller) write their batches in order.
+        with self._io_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return
+            with span("store.flush"), locked(self._file):
+                self._file.write("".join(pending))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        self._flusher.join()
+        self.flush()
+        self._file.close()
+
+    # ---------- Reads ----------
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._by_id
+
+    def get(self, record_id: str):
+        return self._by_id.get(record_id)
+
+    def by_email(self, email: str) -> list:
+        return list(self._by_email.get(email.strip().lower(), []))
+
+    def by_domain(self, domain: str) -> list:
+        return list(self._by_domain.get(domain, []))
+
+    def all(self, start: int = 0) -> list:
+        """Records in append order, from the start-th on."""
+        with self._lock:
+            return self._records[start:]
+
+
+class SeniorStore(ProfileStore):
+    record_type = SeniorProfile
+    tuple_fields = ("skill_ids",)
+
+    def email_of(self, record: SeniorProfile) -> str:
+        return record.email
+
+    def domains_of(self, record: SeniorProfile) -> list:
+        return record.preferred_domains
+
+
+class ProblemStore(ProfileStore):
+    record_type = FounderProblem
+
+    def email_of(self, record: FounderProblem) -> str:
+        return record.founder_email
+
+    def domains_of(self, record: FounderProblem) -> list:
+        return infer_domains(record)
+
+
+# ---------- Process-wide stores ----------
+
+# Streamlit re-executes page scripts on every interaction but imports modules
+# once per process, so these survive reruns and are shared by all sessions.
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def _get_store(cls, filename: str):
+    path = os.path.join(DATA_DIR, filename)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = cls(path)
+        return _stores[path]
+
+
+def get_senior_store() -> SeniorStore:
+    return _get_store(SeniorStore, SENIORS_FILE)
+
+
+def get_problem_store() -> ProblemStore:
+    return _get_store(ProblemStore, PROBLEMS_FILE)
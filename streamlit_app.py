@@ -0,0 +1,21 @@
+# streamlit_app.py — Senior Intern • one multipage app for every flow
+#
+#   streamlit run streamlit_app.py
+#
+# The landing page, the senior profile flow and the founder problem flow are
+# pages of this one app, so they run in a single server process and share
+# its process-wide state: the profile stores (store.py), the senior matcher
+# and per-problem analysis (app_cache.py), the Gemini client
+# (gemini_client.py) and the timing histograms (instrumentation.py).
+
+import streamlit as st
+
+from instrumentation import span
+
+HOME = st.Page("home.py", title="Home", icon="🏠", default=True)
+SENIOR = st.Page("app.py", title="Senior Profile", icon="🧓", url_path="senior")
+FOUNDER = st.Page("founder_app.py", title="Startup Problem", icon="🚀", url_path="founder")
+
+page = st.navigation([HOME, SENIOR, FOUNDER])
+with span(f"rerun.{page.url_path or 'home'}"):
+    page.run()
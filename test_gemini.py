@@ -1,10 +1,15 @@
 # test_gemini.py — final, auto-detect version
+#
+# Model discovery is cached by model_resolver, so this only lists models over
+# the network when the cache is missing or stale. Pass --refresh to force it.
 
 import os
 import sys
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from model_resolver import get_model_resolver
+
 # 1. Load API key from .env
 load_dotenv()
 api_key = os.getenv("GEMINI_API_KEY")
@@ -16,23 +21,22 @@ if not api_key:
 genai.configure(api_key=api_key)
 
 try:
-    print("✅ Connected to Gemini. Fetching available models...\n")
-    models = [
-        m for m in genai.list_models()
-        if "generateContent" in getattr(m, "supported_generation_methods", [])
-    ]
-
-    if not models:
+    resolver = get_model_resolver()
+    if "--refresh" in sys.argv:
+        print("✅ Connected to Gemini. Fetching available models...\n")
+        resolver.discover()
+
+    try:
+        model_name = resolver.resolve("generate")
+    except LookupError:
         print("❌ No models with generateContent found for this key/project.")
         print("   Check that you created the key in Google AI Studio (not Vertex AI).")
         sys.exit(1)
 
-    print("Available models that support generateContent:")
-    for i, m in enumerate(models):
-        print(f"{i}: {m.name}")
+    print(f"Available models that support generateContent (cached in {resolver.cache_path}):")
+    for i, name in enumerate(resolver.supported("generate")):
+        print(f"{i}: {name}")
 
-    # Pick the first available model
-    model_name = models[0].name
     print(f"\n➡ Using model: {model_name}\n")
 
     model = genai.GenerativeModel(model_name)